@@ -5,19 +5,27 @@ A comprehensive plugin for managing and using regex patterns with portfolios,
 dynamic variables, and seamless Find panel integration.
 """
 
+from __future__ import annotations
+
+import os
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Callable
+
 import sublime  # pyright: ignore[reportMissingImports]
 import sublime_plugin  # pyright: ignore[reportMissingImports]
 
 # Support both ST package loading (RegexLab.RegexLab) and direct execution
-if __name__ == "RegexLab.RegexLab":
+try:
     # Normal ST loading: use relative imports
     from .src.commands.about_command import RegexlabAboutCommand as AboutCommandImpl
-    from .src.commands.generate_integrity_command import RegexlabGenerateIntegrityCommand
+    from .src.commands.generate_integrity_command import RegexlabGenerateIntegrityCommand  # noqa: F401
     from .src.commands.load_pattern_command import LoadPatternCommand
     from .src.commands.new_portfolio_wizard_command import NewPortfolioWizardCommand
     from .src.commands.portfolio_manager_command import PortfolioManagerCommand
     from .src.commands.use_selection_command import RegexLabUseSelectionCommand as UseSelectionCommandImpl
-else:
+except ImportError:
     # Direct import (tests, UnitTesting reload): use absolute imports
     from src.commands.about_command import RegexlabAboutCommand as AboutCommandImpl
     from src.commands.generate_integrity_command import RegexlabGenerateIntegrityCommand  # noqa: F401
@@ -27,6 +35,26 @@ else:
     from src.commands.use_selection_command import RegexLabUseSelectionCommand as UseSelectionCommandImpl
 
 
+# Upper bound for concurrent portfolio parsing (keeps ST's thread budget intact)
+_MAX_LOAD_WORKERS = 4
+
+# True while a manual reload is queued on the async thread but not started yet.
+# Only touched on the main thread (run) and at the start of _reload; every
+# set_timeout_async callback runs on the same worker, so passes never overlap.
+_reload_scheduled = False
+
+_SUMMARY_RULE = "━" * 40
+
+# Startup error dialog
+_MAX_DIALOG_ERRORS = 3
+_DIALOG_ERROR_SEPARATOR = "\n\n" + "━" * 24 + "\n\n"
+_NO_PORTFOLIOS_MESSAGE = (
+    "No portfolios could be loaded!\n\n"
+    "RegexLab requires at least one valid portfolio.\n"
+    "Check that RegexLab/data/portfolios/ contains valid .json files."
+)
+
+
 class RegexLabLoadPatternCommand(sublime_plugin.WindowCommand):
     """
     Load a pattern from active portfolio into Find panel.
@@ -107,6 +135,24 @@ class RegexlabAboutCommand(sublime_plugin.WindowCommand):
         command.run(self.window)
 
 
+class RegexlabInsertTextCommand(sublime_plugin.TextCommand):
+    """
+    Internal helper - insert text at the start of the view in one edit.
+
+    Used by the About command to fill its scratch buffer without going
+    through the generic "append" command (no auto-scroll, no per-call
+    selection handling).
+    """
+
+    def run(self, edit, text: str = "") -> None:
+        """Insert text at position 0."""
+        self.view.insert(edit, 0, text)
+
+    def is_visible(self) -> bool:
+        """Hide from Command Palette."""
+        return False
+
+
 class RegexLabReloadPortfoliosCommand(sublime_plugin.WindowCommand):
     """
     Reload Portfolios - Force refresh of all portfolios.
@@ -119,85 +165,341 @@ class RegexLabReloadPortfoliosCommand(sublime_plugin.WindowCommand):
     """
 
     def run(self) -> None:
-        """Execute the command to reload all portfolios."""
-        from pathlib import Path
+        """
+        Execute the command to reload all portfolios (off the UI thread).
+
+        Requests made while a reload is already queued are coalesced into it,
+        so N rapid reloads cost one scan (plus one more if some arrive while
+        that scan is running, to pick up changes it may have missed).
+        """
+        global _reload_scheduled
+
+        if _reload_scheduled:
+            from .src.core.logger import get_logger
+
+            get_logger().debug("Portfolio reload already scheduled, coalescing request")
+            return
+
+        _reload_scheduled = True
+        sublime.set_timeout_async(self._reload, 0)
+
+    def _reload(self) -> None:
+        """Reload all portfolios. Runs on Sublime Text's async worker thread."""
+        global _reload_scheduled
+
+        # Cleared before scanning: later requests queue a fresh pass
+        _reload_scheduled = False
 
         from .src.core.logger import get_logger
         from .src.services.portfolio_service import PortfolioService
 
         logger = get_logger()
-        service = PortfolioService()
-        packages_path = Path(sublime.packages_path())
+        service = PortfolioService.get_instance()
 
         logger.info("RegexLab: Manual portfolio reload triggered")
 
-        # Clear existing portfolios
-        service.portfolio_manager._loaded_portfolios.clear()
-        service.portfolio_manager._builtin_portfolio = None
-        service.portfolio_manager._portfolio_paths.clear()
-        logger.debug("Cleared existing portfolios from memory")
+        # Incremental reload: unchanged files are kept, changed files re-parsed,
+        # portfolios whose file disappeared are dropped
+        def post_status(message: str) -> None:
+            # Every status update goes through the main-thread queue, so the final
+            # result can never be overwritten by a progress message still queued
+            sublime.set_timeout(lambda: self.window.status_message(message), 0)
 
-        # STEP 0 - Multi-Portfolio Integrity Verification (v2)
-        # Use USER directories for integrity check
-        user_regexlab = packages_path / "User" / "RegexLab"
-        regexlab_dir_v2 = user_regexlab / ".regexlab"
-        from .src.core.integrity_manager import IntegrityManager
+        def on_progress(message: str) -> None:
+            post_status(f"RegexLab: {message}...")
+
+        report = _discover_and_load(service, _get_paths(), reload=True, on_progress=on_progress)
+        loaded_count = report.loaded + report.unchanged
+
+        # Show result to user
+        if report.failed == 0:
+            post_status(f"RegexLab: Successfully reloaded {loaded_count} portfolio(s)")
+            logger.info(
+                "✓ Portfolio reload complete: %s loaded (%s added, %s changed, %s unchanged, %s removed)",
+                loaded_count,
+                report.added,
+                report.changed,
+                report.unchanged,
+                report.removed,
+            )
+        else:
+            post_status(f"RegexLab: Reloaded {loaded_count} portfolio(s), {report.failed} failed (see console)")
+            logger.warning("⚠ Portfolio reload: %s loaded, %s failed", loaded_count, report.failed)
+
+
+@dataclass(frozen=True)
+class _Paths:
+    """User/RegexLab directory layout, resolved once per session."""
+
+    packages: Path
+    user_dir: Path  # User/RegexLab
+    regexlab_dir: Path  # User/RegexLab/.regexlab (integrity keystore)
+    builtin_dir: Path  # User/RegexLab/builtin_portfolios (extracted, verified)
+    custom_dir: Path  # User/RegexLab/portfolios (custom active)
+    disabled_dir: Path  # User/RegexLab/disabled_portfolios (user-disabled)
+
+
+_paths: _Paths | None = None
+
+
+def _get_paths() -> _Paths:
+    """Return the cached directory layout, building it on first use."""
+    global _paths
+
+    if _paths is None:
+        packages_path = Path(sublime.packages_path())
+        user_dir = packages_path / "User" / "RegexLab"
+        _paths = _Paths(
+            packages=packages_path,
+            user_dir=user_dir,
+            regexlab_dir=user_dir / ".regexlab",
+            builtin_dir=user_dir / "builtin_portfolios",
+            custom_dir=user_dir / "portfolios",
+            disabled_dir=user_dir / "disabled_portfolios",
+        )
+    return _paths
+
+
+def _list_json_files(directory: Path) -> list[Path]:
+    """
+    List *.json files in a directory, sorted by path.
+
+    Uses os.scandir (cached DirEntry type info, no fnmatch) instead of
+    Path.glob. Returns an empty list if the directory does not exist.
+    """
+    try:
+        with os.scandir(directory) as entries:
+            return sorted(
+                Path(entry.path)
+                for entry in entries
+                if entry.name.endswith(".json") and entry.is_file()
+            )
+    except FileNotFoundError:
+        return []
+
+
+def _count_json_files(directory: Path) -> int:
+    """Count *.json entries in a directory without building Path objects (0 if missing)."""
+    try:
+        with os.scandir(directory) as entries:
+            return sum(1 for entry in entries if entry.name.endswith(".json"))
+    except FileNotFoundError:
+        return 0
 
-        integrity_manager_v2 = IntegrityManager(regexlab_dir_v2)
 
-        # A) Built-in portfolios
-        builtin_dir = user_regexlab / "builtin_portfolios"
+@dataclass
+class _LoadReport:
+    """Outcome of a discovery + load pass over the portfolio directories."""
+
+    loaded: int = 0
+    failed: int = 0
+    # Diff against the previously loaded state
+    added: int = 0
+    changed: int = 0
+    unchanged: int = 0
+    removed: int = 0
+    error_messages: list[str] = field(default_factory=list)
+
+
+def _discover_and_load(
+    service, paths: _Paths, reload: bool, on_progress: Callable[[str], None] | None = None
+) -> _LoadReport:
+    """
+    Verify builtin integrity, discover portfolio files and load them.
+
+    Shared by plugin_loaded() and the Reload Portfolios command. Files whose
+    stat fingerprint (mtime_ns, size) matches the last load are skipped, so an
+    unchanged library costs one stat() per file instead of one JSON parse.
+
+    Args:
+        service: PortfolioService instance
+        paths: Cached directory layout (see _get_paths())
+        reload: True for a manual reload (allows overwriting loaded portfolios
+            and drops portfolios whose file no longer exists)
+        on_progress: Optional callback receiving short progress messages
+
+    Returns:
+        _LoadReport with loaded/unchanged/failed counts and user-facing errors
+    """
+    from .src.core.constants import DEFAULT_FORCE_INTEGRITY_CHECK
+    from .src.core.logger import LogLevel, get_logger
+    from .src.core.settings_manager import SettingsManager
+
+    logger = get_logger()
+    report = _LoadReport()
+    manager = service.portfolio_manager
+
+    builtin_dir = paths.builtin_dir
+    portfolios_dir = paths.custom_dir
+
+    # ========== Verify builtin portfolios integrity (v2) ==========
+    try:
+        # Use USER directories for integrity check
+        integrity_manager_v2 = service.get_integrity_manager(paths.regexlab_dir)
+
+        force_check = SettingsManager.get_instance().get("force_integrity_check", DEFAULT_FORCE_INTEGRITY_CHECK)
 
-        # Verify integrity if keystore exists
         if integrity_manager_v2.keystore_file.exists():
-            logger.info("Verifying multi-portfolio integrity (reload)...")
-            all_ok, verified, restored = integrity_manager_v2.verify_and_restore(builtin_dir)
-            if all_ok:
-                logger.info("✓ All %s builtin portfolios verified", len(verified))
+            if not force_check and integrity_manager_v2.is_verification_current(builtin_dir):
+                logger.debug("Builtin portfolios unchanged since last verification, skipping integrity check")
             else:
-                logger.warning("⚠ Restored %s portfolios:", len(restored))
-                for portfolio_name, reason in restored:
-                    logger.warning("  - %s - %s", portfolio_name, reason)
-
-        # Reload portfolios using same logic as plugin_loaded
-        portfolios_to_load = []
-        loaded_count = 0
-        failed_count = 0
-
-        builtin_files = sorted(builtin_dir.glob("*.json"))
-        for filepath in builtin_files:
-            portfolios_to_load.append((filepath, True))
-
-        # B) Custom portfolios
-        user_regexlab = packages_path / "User" / "RegexLab"
-        portfolios_dir = user_regexlab / "portfolios"
-        custom_files = sorted(portfolios_dir.glob("*.json"))
-        for filepath in custom_files:
-            portfolios_to_load.append((filepath, False))
-
-        logger.debug("Reloading %s portfolio(s)...", len(portfolios_to_load))
-
-        # Load all portfolios
-        first_builtin = True
-        for portfolio_path, is_builtin in portfolios_to_load:
-            try:
-                # First builtin portfolio becomes the "builtin principal" (backward compat)
-                set_as_builtin_flag = is_builtin and first_builtin
-                service.portfolio_manager.load_portfolio(portfolio_path, set_as_builtin=set_as_builtin_flag, reload=True)
-                if is_builtin and first_builtin:
-                    first_builtin = False
-                loaded_count += 1
-            except Exception as e:
-                failed_count += 1
-                logger.error("Failed to reload portfolio: %s - %s", portfolio_path.name, e)
+                logger.info("Verifying multi-portfolio integrity...")
+                verify_progress = None
+                if on_progress is not None:
 
-        # Show result to user
-        if failed_count == 0:
-            self.window.status_message(f"RegexLab: Successfully reloaded {loaded_count} portfolio(s)")
-            logger.info("✓ Portfolio reload complete: %s loaded", loaded_count)
+                    def verify_progress(done: int, total: int) -> None:
+                        on_progress(f"Verifying builtin portfolios {done}/{total}")
+
+                all_ok, verified, restored = integrity_manager_v2.verify_and_restore(builtin_dir, verify_progress)
+
+                if all_ok:
+                    logger.info("✓ All %s builtin portfolios verified", len(verified))
+                else:
+                    logger.warning("⚠ Restored %s portfolios:", len(restored))
+                    for path, reason in restored:
+                        logger.warning("  - %s: %s", path.name, reason)
+
+                # Stamp taken after restores, so restored files count as verified
+                integrity_manager_v2.mark_verified(builtin_dir)
+    except Exception as e:
+        logger.error("Multi-portfolio integrity check failed: %s", e)
+
+    # ========== Ensure User/RegexLab directories exist ==========
+    builtin_dir.mkdir(parents=True, exist_ok=True)
+    portfolios_dir.mkdir(parents=True, exist_ok=True)
+    paths.disabled_dir.mkdir(parents=True, exist_ok=True)
+    logger.debug("User directories ensured: builtin_portfolios/, portfolios/ and disabled_portfolios/")
+
+    # ========== Discover all portfolios to load ==========
+    # A) Built-in portfolios (loaded from User/RegexLab/builtin_portfolios, verified above)
+    # B) Custom active portfolios (User/RegexLab/portfolios/*.json)
+    builtin_files = _list_json_files(builtin_dir)
+    custom_files = _list_json_files(portfolios_dir)
+    logger.debug("Found %s builtin portfolio(s) in: %s", len(builtin_files), builtin_dir)
+    logger.debug("Found %s custom portfolio(s) in: %s", len(custom_files), portfolios_dir)
+
+    portfolios_to_load = [(path, True) for path in builtin_files] + [(path, False) for path in custom_files]
+    logger.info("Total portfolios to load: %s", len(portfolios_to_load))
+
+    # Diff against what is loaded: removed files are unloaded, unchanged files
+    # skipped, added/changed files (re)loaded. Never cleared wholesale.
+    if reload:
+        report.removed = len(manager.unload_missing({path for path, _ in portfolios_to_load}))
+
+    # ========== Load all discovered portfolios ==========
+    pending: list[tuple[Path, bool]] = []  # (path, is_builtin)
+
+    for portfolio_path, is_builtin in portfolios_to_load:
+        if manager.is_unchanged_since_load(portfolio_path):
+            report.unchanged += 1
+            logger.debug("Portfolio unchanged, skipping: %s", portfolio_path.name)
+            continue
+
+        if manager.is_known_path(portfolio_path):
+            report.changed += 1
         else:
-            self.window.status_message(f"RegexLab: Reloaded {loaded_count} portfolio(s), {failed_count} failed (see console)")
-            logger.warning("⚠ Portfolio reload: %s loaded, %s failed", loaded_count, failed_count)
+            report.added += 1
+        pending.append((portfolio_path, is_builtin))
+
+    logger.debug(
+        "Portfolio diff: %s added, %s changed, %s unchanged, %s removed",
+        report.added,
+        report.changed,
+        report.unchanged,
+        report.removed,
+    )
+
+    if not pending:
+        _apply_builtin_principal(manager, builtin_files, reload)
+        return report
+
+    if on_progress is not None:
+        on_progress(f"Loading {len(pending)} portfolio(s)")
+
+    # Files are read and parsed concurrently, then registered in discovery order
+    # so name collisions resolve exactly as with a sequential load
+    with ThreadPoolExecutor(max_workers=min(_MAX_LOAD_WORKERS, len(pending))) as executor:
+        futures = [executor.submit(manager.read_portfolio_file, path) for path, _ in pending]
+
+    # Per-portfolio details are batched into one record (ST console writes are slow)
+    debug_enabled = logger.is_enabled_for(LogLevel.DEBUG)
+    loaded_info: list[str] = []
+    loaded_debug: list[str] = []
+
+    for (portfolio_path, is_builtin), future in zip(pending, futures):
+        failed_before = report.failed
+        try:
+            parsed, fingerprint = future.result()
+            portfolio = manager.register_portfolio(parsed, portfolio_path, reload=reload, fingerprint=fingerprint)
+
+            report.loaded += 1
+            builtin_marker = " (Built-in)" if is_builtin else ""
+            loaded_info.append(f"  ✓ {portfolio.name}{builtin_marker} - {len(portfolio.patterns)} pattern(s)")
+            if debug_enabled:
+                loaded_debug.append(
+                    f"  {portfolio_path.name}: author={portfolio.author or 'N/A'}, "
+                    f"version={portfolio.version}, readonly={portfolio.readonly}"
+                )
+
+        except FileNotFoundError:
+            report.failed += 1
+            report.error_messages.append(
+                f"Portfolio file not found:\n{portfolio_path}\n\nFile may have been deleted."
+            )
+            logger.error("✗ Portfolio not found: %s", portfolio_path)
+        except ValueError as e:
+            # Portfolio validation errors: JSON syntax, missing fields, etc.
+            error_str = str(e)
+
+            # Make the error more user-friendly
+            if "Invalid JSON" in error_str:
+                report.failed += 1
+                logger.error("✗ Portfolio '%s' has JSON syntax errors:", portfolio_path.name)
+                logger.error("  → %s", error_str)
+                logger.error("  → Location: %s", portfolio_path)
+                logger.error("  → Fix: Check for missing commas, extra commas, or unclosed brackets")
+            elif "already loaded" in error_str:
+                # This is expected during reload, don't spam (not counted as failure)
+                logger.debug("⚠ Portfolio '%s' already loaded (skipped)", portfolio_path.name)
+            else:
+                report.failed += 1
+                logger.warning("⚠ Portfolio issue: %s - %s", portfolio_path.name, e)
+        except Exception as e:
+            # Unexpected errors
+            report.failed += 1
+            logger.error("✗ Error loading portfolio: %s - %s", portfolio_path.name, e)
+
+        # A changed file that no longer loads must not keep its previous content loaded
+        if report.failed > failed_before and manager.is_known_path(portfolio_path):
+            stale = manager.unload_path(portfolio_path)
+            report.removed += len(stale)
+            logger.warning(
+                "⚠ Unloaded stale portfolio(s) %s: %s failed to reload", ", ".join(stale), portfolio_path.name
+            )
+
+    if loaded_info:
+        logger.info("Portfolios loaded:\n%s", "\n".join(loaded_info))
+    if loaded_debug:
+        logger.debug("Portfolio details:\n%s", "\n".join(loaded_debug))
+
+    _apply_builtin_principal(manager, builtin_files, reload)
+    return report
+
+
+def _apply_builtin_principal(manager, builtin_files: list[Path], reload: bool) -> None:
+    """
+    Make the first builtin portfolio (alphabetical) the "builtin principal" on reload.
+
+    Backward compat with the full reload, which always did this. Applied after
+    registration so it also covers an unchanged (not re-parsed) first file.
+
+    Args:
+        manager: PortfolioManager instance
+        builtin_files: Builtin portfolio files in discovery order
+        reload: Whether this pass is a reload
+    """
+    if reload and builtin_files:
+        manager.set_builtin_principal(builtin_files[0])
 
 
 def ensure_user_resources(logger) -> None:
@@ -208,12 +510,9 @@ def ensure_user_resources(logger) -> None:
     files directly inside the package. We extract them to User/RegexLab
     to allow IntegrityManager to work with real files.
     """
-    from pathlib import Path
-
-    packages_path = Path(sublime.packages_path())
-    user_regexlab = packages_path / "User" / "RegexLab"
-    user_regexlab_data = user_regexlab / ".regexlab"
-    user_portfolios_dir = user_regexlab / "builtin_portfolios"  # Separate from custom portfolios
+    paths = _get_paths()
+    user_regexlab_data = paths.regexlab_dir
+    user_portfolios_dir = paths.builtin_dir  # Separate from custom portfolios
 
     user_regexlab_data.mkdir(parents=True, exist_ok=True)
     user_portfolios_dir.mkdir(parents=True, exist_ok=True)
@@ -258,6 +557,17 @@ def plugin_loaded() -> None:
     """
     Initialize plugin on load.
 
+    Directory scans, JSON parsing and integrity verification run on Sublime
+    Text's async worker thread so startup never blocks the UI.
+    See _plugin_loaded_impl() for the actual initialization.
+    """
+    sublime.set_timeout_async(_plugin_loaded_impl, 0)
+
+
+def _plugin_loaded_impl() -> None:
+    """
+    Discover, verify and load all portfolios (runs on the async thread).
+
     AUTO-DISCOVERY MODE:
     - Scans and loads ALL .json files from RegexLab/data/portfolios/ (builtin)
     - Scans and loads ALL .json files from User/RegexLab/portfolios/ (custom active)
@@ -269,163 +579,56 @@ def plugin_loaded() -> None:
     - Auto-restores corrupted or missing files from rxl.kst
     - First builtin portfolio (alphabetical order) becomes the "builtin principal"
     """
-    from pathlib import Path
-
-    from .src.core.integrity_manager import IntegrityManager
     from .src.core.logger import get_logger
     from .src.services.portfolio_service import PortfolioService
 
     logger = get_logger()
-    service = PortfolioService()
-    packages_path = Path(sublime.packages_path())
+    service = PortfolioService.get_instance()
+    paths = _get_paths()
 
     logger.info("RegexLab - Auto-Discovery Mode")
-    logger.debug("Packages path: %s", packages_path)
+    logger.debug("Packages path: %s", paths.packages)
 
     # ========== STEP 0: Ensure User Resources (Fix for Packaged Mode) ==========
     ensure_user_resources(logger)
 
-    # Define user_regexlab here to avoid UnboundLocalError/Pylance issues
-    user_regexlab = packages_path / "User" / "RegexLab"
-
-    # ========== STEP 1: Verify builtin portfolios integrity (v2) ==========
-    try:
-        # Use USER directories for integrity check
-        builtin_dir = user_regexlab / "builtin_portfolios"
-        regexlab_dir_v2 = user_regexlab / ".regexlab"
-
-        integrity_manager_v2 = IntegrityManager(regexlab_dir_v2)
-
-        if integrity_manager_v2.keystore_file.exists():
-            logger.info("Verifying multi-portfolio integrity...")
-            all_ok, verified, restored = integrity_manager_v2.verify_and_restore(builtin_dir)
-
-            if all_ok:
-                logger.info("✓ All %s builtin portfolios verified", len(verified))
-            else:
-                logger.warning("⚠ Restored %s portfolios:", len(restored))
-                for path, reason in restored:
-                    logger.warning("  - %s: %s", path.name, reason)
-    except Exception as e:
-        logger.error("Multi-portfolio integrity check failed: %s", e)
-
-    # ========== STEP 2: Ensure User/RegexLab directories exist ==========
-    portfolios_dir = user_regexlab / "portfolios"
-    disabled_dir = user_regexlab / "disabled_portfolios"
-
-    portfolios_dir.mkdir(parents=True, exist_ok=True)
-    disabled_dir.mkdir(parents=True, exist_ok=True)
-    logger.debug("User directories ensured: portfolios/ and disabled_portfolios/")
-
-    # ========== STEP 3: Discover all portfolios to load ==========
-    portfolios_to_load = []
-    loaded_count = 0
-    failed_count = 0
-    error_messages = []
-
-    # A) Built-in portfolios (Now loaded from User/RegexLab/builtin_portfolios)
-    # We use the extracted files which are verified/restored
-    builtin_dir = user_regexlab / "builtin_portfolios"
-    builtin_dir.mkdir(parents=True, exist_ok=True)
-
-    builtin_files = sorted(builtin_dir.glob("*.json"))
-    logger.debug("Found %s builtin portfolio(s) in: %s", len(builtin_files), builtin_dir)
-
-    # Add all builtin portfolios found
-    for filepath in builtin_files:
-        portfolios_to_load.append((filepath, True))  # (path, is_builtin)
-
-    # B) Custom active portfolios (User/RegexLab/portfolios/*.json)
-    custom_files = sorted(portfolios_dir.glob("*.json"))
-    logger.debug("Found %s custom portfolio(s) in: %s", len(custom_files), portfolios_dir)
-    for filepath in custom_files:
-        portfolios_to_load.append((filepath, False))  # (path, is_builtin)
-
-    # C) Log disabled portfolios (for user info, not loaded)
-    disabled_files = list(disabled_dir.glob("*.json"))
-    if disabled_files:
-        logger.debug("Found %s disabled portfolio(s) in: %s", len(disabled_files), disabled_dir)
+    # ========== STEPS 1-3: Verify integrity, discover and load portfolios ==========
+    report = _discover_and_load(service, paths, reload=False)
+    loaded_count = report.loaded + report.unchanged
+    failed_count = report.failed
+    error_messages = report.error_messages
+
+    # Count disabled portfolios (for user info, not loaded) - names only, no Path objects
+    disabled_dir = paths.disabled_dir
+    disabled_count = _count_json_files(disabled_dir)
+    if disabled_count:
+        logger.debug("Found %s disabled portfolio(s) in: %s", disabled_count, disabled_dir)
         logger.debug("  Disabled portfolios will not be loaded")
 
-    logger.info("Total portfolios to load: %s", len(portfolios_to_load))
-
-    # ========== STEP 4: Load all discovered portfolios ==========
-    # Note: We don't need to re-check integrity here, it was done in Step 1
-    builtin_integrity_checked = True
-
-    for i, (portfolio_path, is_builtin) in enumerate(portfolios_to_load):
-        logger.debug("Loading portfolio %s/%s: %s", i + 1, len(portfolios_to_load), portfolio_path.name)
-
-        try:
-            # Load portfolio
-            # set_as_builtin=True only for FIRST builtin portfolio (backward compat)
-            set_as_builtin_flag = is_builtin and not builtin_integrity_checked
-            portfolio = service.portfolio_manager.load_portfolio(
-                portfolio_path, set_as_builtin=set_as_builtin_flag, reload=False
-            )
-
-            # Mark first builtin as checked
-            if is_builtin and not builtin_integrity_checked:
-                builtin_integrity_checked = True
-
-            loaded_count += 1
-            builtin_marker = " (Built-in)" if is_builtin else ""
-            logger.info("✓ Portfolio loaded: %s%s", portfolio.name, builtin_marker)
-            logger.info("  Patterns: %s", len(portfolio.patterns))
-            logger.debug("  Author: %s", portfolio.author if hasattr(portfolio, "author") else "N/A")
-            logger.debug("  Version: %s", portfolio.version if hasattr(portfolio, "version") else "N/A")
-            logger.debug("  Readonly: %s", portfolio.readonly)
-
-        except FileNotFoundError:
-            failed_count += 1
-            error_msg = f"Portfolio file not found:\n{portfolio_path}\n\nFile may have been deleted."
-            error_messages.append(error_msg)
-            logger.error("✗ Portfolio not found: %s", portfolio_path)
-        except ValueError as e:
-            # Portfolio validation errors: JSON syntax, missing fields, etc.
-            failed_count += 1
-            error_str = str(e)
-
-            # Make the error more user-friendly
-            if "Invalid JSON" in error_str:
-                logger.error("✗ Portfolio '%s' has JSON syntax errors:", portfolio_path.name)
-                logger.error("  → %s", error_str)
-                logger.error("  → Location: %s", portfolio_path)
-                logger.error("  → Fix: Check for missing commas, extra commas, or unclosed brackets")
-            elif "already loaded" in error_str:
-                # This is expected during reload, don't spam
-                logger.debug("⚠ Portfolio '%s' already loaded (skipped)", portfolio_path.name)
-                failed_count -= 1  # Don't count as failure
-            else:
-                logger.warning("⚠ Portfolio issue: %s - %s", portfolio_path.name, e)
-        except Exception as e:
-            # Unexpected errors
-            failed_count += 1
-            logger.error("✗ Error loading portfolio: %s - %s", portfolio_path.name, e)
-
     # ========== STEP 4: Summary and Error Reporting ==========
     if loaded_count > 0:
-        logger.info("━" * 40)
-        logger.info("RegexLab initialized: %s portfolio(s) loaded", loaded_count)
+        summary = [_SUMMARY_RULE, f"RegexLab initialized: {loaded_count} portfolio(s) loaded"]
+        if disabled_count:
+            summary.append(f"  {disabled_count} portfolio(s) disabled (in disabled_portfolios/)")
+        logger.info("\n".join(summary))
+        # Kept as its own record so failures stay visible at log_level WARNING/ERROR
         if failed_count > 0:
             logger.warning("  %s portfolio(s) failed to load", failed_count)
-        if disabled_files:
-            logger.info("  %s portfolio(s) disabled (in disabled_portfolios/)", len(disabled_files))
     else:
         logger.error("✗ No portfolios loaded")
         if not error_messages:
-            error_messages.append(
-                "No portfolios could be loaded!\n\n"
-                "RegexLab requires at least one valid portfolio.\n"
-                "Check that RegexLab/data/portfolios/ contains valid .json files."
-            )
+            error_messages.append(_NO_PORTFOLIOS_MESSAGE)
+
+    # Show error dialog to user only if critical errors occurred
+    if not error_messages:
+        return
 
-    # Show error dialog to user if critical errors occurred
-    if error_messages:
-        display_errors = error_messages[:3]
-        if len(error_messages) > 3:
-            display_errors.append(f"\n... and {len(error_messages) - 3} more error(s).")
+    display_errors = error_messages[:_MAX_DIALOG_ERRORS]
+    hidden_count = len(error_messages) - _MAX_DIALOG_ERRORS
+    if hidden_count > 0:
+        display_errors.append(f"\n... and {hidden_count} more error(s).")
 
-        error_dialog = "RegexLab: Portfolio Loading Errors\n\n" + "\n\n━━━━━━━━━━━━━━━━━━━━━━━━\n\n".join(display_errors)
+    error_dialog = "RegexLab: Portfolio Loading Errors\n\n" + _DIALOG_ERROR_SEPARATOR.join(display_errors)
 
-        sublime.error_message(error_dialog)
+    # UI calls stay on the main thread
+    sublime.set_timeout(lambda: sublime.error_message(error_dialog), 0)
@@ -12,6 +12,35 @@ from typing import TYPE_CHECKING
 if TYPE_CHECKING:
     import sublime  # pyright: ignore[reportMissingImports]
 
+# Shown when messages/install.txt cannot be found (built once at import)
+_FALLBACK_ABOUT = """
+╔══════════════════════════════════════════════════════════════════════════════╗
+║                                                                              ║
+║                       🎯 RegexLab - About 🎯                                ║
+║                                                                              ║
+║            The Ultimate Regex Pattern Manager for Sublime Text              ║
+║                                                                              ║
+╚══════════════════════════════════════════════════════════════════════════════╝
+
+RegexLab transforms how you work with regex patterns in Sublime Text.
+
+📖 Documentation: https://github.com/KaminoU/RegexLab/blob/main/README.md
+🐛 Issues/Bugs: https://github.com/KaminoU/RegexLab/issues
+⭐ GitHub: https://github.com/KaminoU/RegexLab
+
+═══════════════════════════════════════════════════════════════════════════════
+
+🔧 QUICK START:
+
+  1. Ctrl+K, Ctrl+R → Load Pattern
+  2. Ctrl+K, Ctrl+P → Portfolio Manager
+  3. Ctrl+K, Ctrl+U → Use Selection
+
+═══════════════════════════════════════════════════════════════════════════════
+
+Enjoy! 🎉
+"""
+
 
 class RegexlabAboutCommand:
     """
@@ -20,6 +49,11 @@ class RegexlabAboutCommand:
     Opens the install.txt message in a new buffer for easy reference.
     """
 
+    # Path to install.txt, resolved once per session
+    _install_msg_path: Path | None = None
+    # (mtime, content) of the last install.txt read
+    _cached: tuple[float, str] | None = None
+
     def run(self, window: sublime.Window) -> None:
         """
         Execute the About command.
@@ -27,62 +61,53 @@ class RegexlabAboutCommand:
         Args:
             window: Sublime Text window instance
         """
-        import sublime  # pyright: ignore[reportMissingImports]
-
-        # Get RegexLab package path
-        packages_path = Path(sublime.packages_path())
-        regexlab_path = packages_path / "RegexLab"
-        install_msg_path = regexlab_path / "messages" / "install.txt"
-
-        # Read install message
-        try:
-            content = install_msg_path.read_text(encoding="utf-8")
-        except FileNotFoundError:
-            # Fallback if install.txt doesn't exist
-            content = self._get_fallback_about()
+        content = self._get_about_content()
 
         # Create new buffer and display
         view = window.new_file()
         view.set_name("About RegexLab")
         view.set_scratch(True)  # Don't prompt to save
-        view.set_read_only(False)
-        view.run_command("append", {"characters": content})
-        view.set_read_only(True)
 
-        # Set syntax to plain text for better readability
+        # Set syntax to plain text first, so the text is tokenized only once
         view.assign_syntax("Packages/Text/Plain text.tmLanguage")
 
-    def _get_fallback_about(self) -> str:
+        # Single buffer insert via edit token (see RegexlabInsertTextCommand in RegexLab.py)
+        view.run_command("regexlab_insert_text", {"text": content})
+        view.set_read_only(True)
+
+    @classmethod
+    def _get_about_content(cls) -> str:
         """
-        Fallback about message if install.txt is missing.
+        Return install.txt content, re-reading it only when its mtime changes.
 
         Returns:
-            str: About message
+            str: About message (fallback text if install.txt is missing)
         """
-        return """
-╔══════════════════════════════════════════════════════════════════════════════╗
-║                                                                              ║
-║                       🎯 RegexLab - About 🎯                                ║
-║                                                                              ║
-║            The Ultimate Regex Pattern Manager for Sublime Text              ║
-║                                                                              ║
-╚══════════════════════════════════════════════════════════════════════════════╝
-
-RegexLab transforms how you work with regex patterns in Sublime Text.
+        if cls._install_msg_path is None:
+            import sublime  # pyright: ignore[reportMissingImports]
 
-📖 Documentation: https://github.com/KaminoU/RegexLab/blob/main/README.md
-🐛 Issues/Bugs: https://github.com/KaminoU/RegexLab/issues
-⭐ GitHub: https://github.com/KaminoU/RegexLab
+            # Get RegexLab package path
+            cls._install_msg_path = Path(sublime.packages_path()) / "RegexLab" / "messages" / "install.txt"
 
-═══════════════════════════════════════════════════════════════════════════════
+        try:
+            mtime = cls._install_msg_path.stat().st_mtime
+        except FileNotFoundError:
+            # Fallback if install.txt doesn't exist
+            return cls._get_fallback_about()
 
-🔧 QUICK START:
+        if cls._cached is not None and cls._cached[0] == mtime:
+            return cls._cached[1]
 
-  1. Ctrl+K, Ctrl+R → Load Pattern
-  2. Ctrl+K, Ctrl+P → Portfolio Manager
-  3. Ctrl+K, Ctrl+U → Use Selection
+        content = cls._install_msg_path.read_text(encoding="utf-8")
+        cls._cached = (mtime, content)
+        return content
 
-═══════════════════════════════════════════════════════════════════════════════
+    @staticmethod
+    def _get_fallback_about() -> str:
+        """
+        Fallback about message if install.txt is missing.
 
-Enjoy! 🎉
-"""
+        Returns:
+            str: About message
+        """
+        return _FALLBACK_ABOUT
@@ -18,7 +18,7 @@ from __future__ import annotations
 import re
 from typing import TYPE_CHECKING, Any
 
-from ..core.helpers import format_aligned_summary
+from ..core.helpers import SEPARATOR_LINE, format_aligned_summary_fixed
 from ..core.logger import get_logger
 from ..core.models import Pattern, PatternType
 from ..services.portfolio_service import PortfolioService
@@ -26,6 +26,27 @@ from ..services.portfolio_service import PortfolioService
 if TYPE_CHECKING:
     import sublime  # pyright: ignore[reportMissingImports]
 
+# Quick panel flag resolved once at import (0 when sublime is unavailable)
+try:
+    import sublime as _sublime  # pyright: ignore[reportMissingImports]
+
+    _MONOSPACE_FONT = _sublime.MONOSPACE_FONT
+except (ImportError, AttributeError):
+    _MONOSPACE_FONT = 0
+
+# Variable syntaxes that make a pattern dynamic: $VAR, ${VAR}, {{VAR}}, {VAR}
+# One alternation: a single scan of the input instead of four re.search() calls
+_VARIABLE_PATTERN = re.compile(
+    r"\$[A-Z_][A-Z0-9_]*"  # $VAR
+    r"|\$\{[A-Z_][A-Z0-9_]*\}"  # ${VAR}
+    r"|\{\{[A-Z_][A-Z0-9_]*\}\}"  # {{VAR}}
+    r"|\{[A-Z_][A-Z0-9_]*\}"  # {VAR}
+)
+
+
+# Longest confirmation summary label ("Pattern Name"); labels are fixed
+_SUMMARY_LABEL_WIDTH = len("Pattern Name")
+
 
 class AddPatternCommand:
     """
@@ -43,9 +64,12 @@ class AddPatternCommand:
     def __init__(self) -> None:
         """Initialize Add Pattern command."""
         self.logger = get_logger()
-        self.portfolio_service = PortfolioService()
+        self.portfolio_service = PortfolioService.get_instance()
         self.portfolio_name: str | None = None
         self.wizard_data: dict[str, Any] = {}
+        self._existing_names: frozenset[str] = frozenset()
+        # (items, action_map) of the confirmation panel, kept while it is re-shown
+        self._confirm_panel: tuple[list[str], dict[int, str]] | None = None
 
     def run(self, window: sublime.Window, portfolio_name: str) -> None:
         """
@@ -71,6 +95,9 @@ class AddPatternCommand:
 
         self.portfolio_name = portfolio_name
         self.wizard_data = {}
+        self._confirm_panel = None
+        # Snapshot of existing names for O(1) duplicate checks in the name step
+        self._existing_names = frozenset(p.name for p in portfolio.patterns)
 
         # Step 1: Ask for pattern name
         self._show_name_input(window)
@@ -91,8 +118,7 @@ class AddPatternCommand:
                 return
 
             # Validate name doesn't already exist in portfolio
-            portfolio = self.portfolio_service.get_portfolio_by_name(self.portfolio_name)  # type: ignore
-            if portfolio and any(p.name == name for p in portfolio.patterns):
+            if name in self._existing_names:
                 self.logger.warning("Add Pattern: Pattern name '%s' already exists", name)
                 window.status_message(f"Regex Lab: Pattern '{name}' already exists in portfolio")
                 # Re-show input panel
@@ -137,7 +163,8 @@ class AddPatternCommand:
 
             # Validate regex syntax
             try:
-                re.compile(regex)
+                # Keep the compiled object so Pattern() does not compile it again
+                self.wizard_data["_compiled"] = re.compile(regex)
                 self.logger.debug("Add Pattern: Regex syntax valid")
             except re.error as e:
                 self.logger.warning("Add Pattern: Invalid regex syntax - %s", e)
@@ -218,53 +245,57 @@ class AddPatternCommand:
         """
         self.logger.debug("Add Pattern: Showing confirmation panel")
 
-        # Build summary
-        summary_items = [
-            ("Portfolio", self.portfolio_name),
-            ("Pattern Name", self.wizard_data["name"]),
-            ("Regex", self.wizard_data["regex"]),
-            ("Type", self.wizard_data["type"].value),
-        ]
+        # Summary lines only change with wizard_data: reuse them when the panel is re-shown
+        if self._confirm_panel is None:
+            # Build summary
+            summary_items = [
+                ("Portfolio", self.portfolio_name),
+                ("Pattern Name", self.wizard_data["name"]),
+                ("Regex", self.wizard_data["regex"]),
+                ("Type", self.wizard_data["type"].value),
+            ]
+
+            if self.wizard_data.get("description"):
+                summary_items.append(("Description", self.wizard_data["description"]))
 
-        if self.wizard_data.get("description"):
-            summary_items.append(("Description", self.wizard_data["description"]))
+            summary_lines = format_aligned_summary_fixed("New Pattern Summary", summary_items, _SUMMARY_LABEL_WIDTH)
 
-        summary_lines = format_aligned_summary("New Pattern Summary", summary_items)
+            # Build Quick Panel items with summary + actions
+            # Format: [*summary_lines, "", separator, "✅ Create", "❌ Cancel"]
+            items = [*summary_lines, "", SEPARATOR_LINE, "✅ Create this pattern", "❌ Cancel"]
 
-        # Build Quick Panel items with summary + actions
-        # Format: [*summary_lines, "", separator, "✅ Create", "❌ Cancel"]
-        items = [*summary_lines, "", "─" * 60, "✅ Create this pattern", "❌ Cancel"]
+            # Action indices (summary + blank + separator + 2 actions), computed once
+            action_map = {
+                len(summary_lines) + 2: "create",  # "✅ Create this pattern"
+                len(summary_lines) + 3: "cancel",  # "❌ Cancel"
+            }
+            self._confirm_panel = (items, action_map)
+
+        items, action_map = self._confirm_panel
 
         def on_select(index: int) -> None:
             # User cancelled
             if index == -1:
                 self.logger.debug("Add Pattern: Confirmation cancelled")
                 window.status_message("Regex Lab: Pattern creation cancelled")
+                self._confirm_panel = None
                 return
 
-            # Calculate action indices (summary + blank + separator + 2 actions)
-            create_index = len(summary_lines) + 2  # "✅ Create this pattern"
-            cancel_index = len(summary_lines) + 3  # "❌ Cancel"
-
-            if index == create_index:
+            action = action_map.get(index)
+            if action == "create":
                 self.logger.debug("Add Pattern: User confirmed pattern creation")
                 self._create_pattern(window)
-            elif index == cancel_index:
+            elif action == "cancel":
                 self.logger.debug("Add Pattern: User cancelled pattern creation")
                 window.status_message("Regex Lab: Pattern creation cancelled")
+                self._confirm_panel = None
             else:
                 # User clicked on summary line (ignore, re-show panel)
                 self.logger.debug("Add Pattern: Summary line clicked, re-showing confirmation")
                 self._show_confirmation(window)
 
-        try:
-            import sublime  # pyright: ignore[reportMissingImports]
-
-            window.show_quick_panel(items, on_select, flags=sublime.MONOSPACE_FONT)
-            self.logger.debug("Add Pattern: Confirmation panel displayed")
-        except (ImportError, AttributeError):
-            window.show_quick_panel(items, on_select)
-            self.logger.debug("Add Pattern: Confirmation panel displayed (fallback)")
+        window.show_quick_panel(items, on_select, flags=_MONOSPACE_FONT)
+        self.logger.debug("Add Pattern: Confirmation panel displayed")
 
     def _create_pattern(self, window: sublime.Window) -> None:
         """
@@ -282,6 +313,7 @@ class AddPatternCommand:
                 regex=self.wizard_data["regex"],
                 type=self.wizard_data["type"],
                 description=self.wizard_data.get("description", ""),
+                compiled_regex=self.wizard_data.get("_compiled"),
             )
 
             # Add pattern to portfolio
@@ -309,6 +341,10 @@ class AddPatternCommand:
             self.logger.error("Add Pattern: Error creating pattern - %s: %s", type(e).__name__, e)
             window.status_message(f"Regex Lab: Error creating pattern - {e}")
 
+        finally:
+            # Wizard is over, release the cached panel
+            self._confirm_panel = None
+
     def _detect_pattern_type(self, regex: str) -> PatternType:
         """
         Auto-detect if pattern is static or dynamic based on regex analysis.
@@ -323,19 +359,9 @@ class AddPatternCommand:
         Returns:
             PatternType.STATIC or PatternType.DYNAMIC
         """
-        # Check for variable patterns:
-        # $VAR, ${VAR}, {{VAR}}, {VAR}
-        variable_patterns = [
-            r"\$[A-Z_][A-Z0-9_]*",  # $VAR
-            r"\$\{[A-Z_][A-Z0-9_]*\}",  # ${VAR}
-            r"\{\{[A-Z_][A-Z0-9_]*\}\}",  # {{VAR}}
-            r"\{[A-Z_][A-Z0-9_]*\}",  # {VAR}
-        ]
-
-        for pattern in variable_patterns:
-            if re.search(pattern, regex):
-                self.logger.debug("Add Pattern: Detected variable pattern, type = DYNAMIC")
-                return PatternType.DYNAMIC
+        if _VARIABLE_PATTERN.search(regex):
+            self.logger.debug("Add Pattern: Detected variable pattern, type = DYNAMIC")
+            return PatternType.DYNAMIC
 
         self.logger.debug("Add Pattern: No variables detected, type = STATIC")
         return PatternType.STATIC
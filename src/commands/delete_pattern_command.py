@@ -6,10 +6,9 @@ Provides confirmation dialog and handles portfolio update with integrity checks.
 
 from __future__ import annotations
 
-from datetime import datetime
 from typing import TYPE_CHECKING
 
-from ..core.helpers import format_aligned_summary
+from ..core.helpers import SEPARATOR_LINE, format_aligned_summary_fixed
 from ..core.logger import get_logger
 from ..core.models import Pattern, Portfolio
 from ..services.portfolio_service import PortfolioService
@@ -17,6 +16,18 @@ from ..services.portfolio_service import PortfolioService
 if TYPE_CHECKING:
     import sublime  # pyright: ignore[reportMissingImports]
 
+# Quick panel flag resolved once at import (0 when sublime is unavailable)
+try:
+    import sublime as _sublime  # pyright: ignore[reportMissingImports]
+
+    _MONOSPACE_FONT = _sublime.MONOSPACE_FONT
+except (ImportError, AttributeError):
+    _MONOSPACE_FONT = 0
+
+
+# Longest confirmation summary label ("Pattern Name"); labels are fixed
+_SUMMARY_LABEL_WIDTH = len("Pattern Name")
+
 
 class DeletePatternCommand:
     """
@@ -33,7 +44,10 @@ class DeletePatternCommand:
         Args:
             portfolio_service: Optional PortfolioService instance (for testing)
         """
-        self.portfolio_service = portfolio_service or PortfolioService()
+        self.logger = get_logger()
+        self.portfolio_service = portfolio_service or PortfolioService.get_instance()
+        # (pattern, items, action_map) of the confirmation panel, kept while it is re-shown
+        self._confirm_panel: tuple[Pattern, list[str], dict[int, str]] | None = None
 
     def run(
         self,
@@ -52,63 +66,68 @@ class DeletePatternCommand:
             pattern: Pattern to delete
             portfolio: Portfolio containing the pattern
         """
-        logger = get_logger()
-        logger.debug(f"Delete pattern requested: '{pattern.name}' from portfolio '{portfolio.name}'")
-
-        # Build confirmation summary
-        type_label = "Dynamic" if pattern.is_dynamic() else "Static"
-
-        summary_items = [
-            ("Pattern Name", pattern.name),
-            ("Type", type_label),
-            ("Description", pattern.description or "(no description)"),
-            ("Portfolio", portfolio.name),
-        ]
-
-        summary_lines = format_aligned_summary("⚠️ Confirm Pattern Deletion", summary_items)
-
-        # Build Quick Panel items with summary + warning + actions
-        items = [
-            *summary_lines,
-            "",
-            "⚠️ This action cannot be undone.",
-            "",
-            "─" * 60,
-            "🗑️ Delete this pattern",
-            "❌ Cancel",
-        ]
+        self.logger.debug("Delete pattern requested: '%s' from portfolio '%s'", pattern.name, portfolio.name)
+
+        # Reuse the panel built for this pattern when it is re-shown
+        if self._confirm_panel is None or self._confirm_panel[0] is not pattern:
+            # Build confirmation summary
+            type_label = "Dynamic" if pattern.is_dynamic() else "Static"
+
+            summary_items = [
+                ("Pattern Name", pattern.name),
+                ("Type", type_label),
+                ("Description", pattern.description or "(no description)"),
+                ("Portfolio", portfolio.name),
+            ]
+
+            summary_lines = format_aligned_summary_fixed("⚠️ Confirm Pattern Deletion", summary_items, _SUMMARY_LABEL_WIDTH)
+
+            # Build Quick Panel items with summary + warning + actions
+            items = [
+                *summary_lines,
+                "",
+                "⚠️ This action cannot be undone.",
+                "",
+                SEPARATOR_LINE,
+                "🗑️ Delete this pattern",
+                "❌ Cancel",
+            ]
+
+            # Action indices, computed once
+            action_map = {
+                len(summary_lines) + 4: "delete",  # "🗑️ Delete this pattern"
+                len(summary_lines) + 5: "cancel",  # "❌ Cancel"
+            }
+            self._confirm_panel = (pattern, items, action_map)
+
+        _, items, action_map = self._confirm_panel
 
         def on_select(index: int) -> None:
             """Handle user confirmation response."""
             # User cancelled
             if index == -1:
-                logger.debug(f"Delete cancelled by user for pattern '{pattern.name}'")
+                self.logger.debug("Delete cancelled by user for pattern '%s'", pattern.name)
                 window.status_message(f"Regex Lab: Delete cancelled for '{pattern.name}'")
+                self._confirm_panel = None
                 return
 
-            # Calculate action indices
-            delete_index = len(summary_lines) + 4  # "🗑️ Delete this pattern"
-            cancel_index = len(summary_lines) + 5  # "❌ Cancel"
-
-            if index == delete_index:
-                logger.debug(f"Delete confirmed by user for pattern '{pattern.name}'")
+            action = action_map.get(index)
+            if action == "delete":
+                self.logger.debug("Delete confirmed by user for pattern '%s'", pattern.name)
+                self._confirm_panel = None
                 self._execute_delete(window, pattern, portfolio)
-            elif index == cancel_index:
-                logger.debug(f"Delete cancelled by user for pattern '{pattern.name}'")
+            elif action == "cancel":
+                self.logger.debug("Delete cancelled by user for pattern '%s'", pattern.name)
                 window.status_message(f"Regex Lab: Delete cancelled for '{pattern.name}'")
+                self._confirm_panel = None
             else:
                 # User clicked on summary/warning line (re-show panel)
-                logger.debug("Summary line clicked, re-showing confirmation")
+                self.logger.debug("Summary line clicked, re-showing confirmation")
                 self.run(window, pattern, portfolio)
 
-        logger.debug("Showing delete confirmation panel")
+        self.logger.debug("Showing delete confirmation panel")
 
-        try:
-            import sublime  # pyright: ignore[reportMissingImports]
-
-            window.show_quick_panel(items, on_select, flags=sublime.MONOSPACE_FONT)
-        except (ImportError, AttributeError):
-            window.show_quick_panel(items, on_select)
+        window.show_quick_panel(items, on_select, flags=_MONOSPACE_FONT)
 
         # Async operation - no return value (deletion happens in callback)
 
@@ -126,43 +145,35 @@ class DeletePatternCommand:
             pattern: Pattern to delete
             portfolio: Portfolio containing the pattern
         """
-        logger = get_logger()
+        # Find pattern in portfolio. Callers normally pass the instance held by
+        # the portfolio, so an identity scan finds it without Pattern.__eq__;
+        # fall back to an equality search for copies.
+        pattern_index = next((i for i, p in enumerate(portfolio.patterns) if p is pattern), None)
+        if pattern_index is None:
+            try:
+                pattern_index = portfolio.patterns.index(pattern)
+            except ValueError:
+                self.logger.error("Pattern '%s' not found in portfolio '%s'", pattern.name, portfolio.name)
+                window.status_message(f"Regex Lab: Error - Pattern '{pattern.name}' not found")
+                return
+        self.logger.debug("Pattern found at index %s in portfolio '%s'", pattern_index, portfolio.name)
 
-        # Find pattern in portfolio
-        try:
-            pattern_index = portfolio.patterns.index(pattern)
-            logger.debug(f"Pattern found at index {pattern_index} in portfolio '{portfolio.name}'")
-        except ValueError:
-            logger.error(f"Pattern '{pattern.name}' not found in portfolio '{portfolio.name}'")
-            window.status_message(f"Regex Lab: Error - Pattern '{pattern.name}' not found")
-            return
-
-        # Remove pattern from portfolio
-        removed_pattern = portfolio.patterns.pop(pattern_index)
-        logger.debug(f"Pattern '{removed_pattern.name}' removed from portfolio (index {pattern_index})")
-
-        # Update portfolio.updated field with today's date (ISO format)
-        today = datetime.now().strftime("%Y-%m-%d")
-        portfolio.updated = today
-        logger.debug(f"Portfolio updated field set to: {today}")
-
-        # Save portfolio
+        # Save portfolio without the pattern; the in-memory list (and the
+        # 'updated' date) only change once the file has been written
+        remaining = portfolio.patterns[:pattern_index] + portfolio.patterns[pattern_index + 1 :]
         try:
-            portfolio_path = self.portfolio_service.portfolio_manager._portfolio_paths.get(portfolio.name)
+            portfolio_path = self.portfolio_service.get_portfolio_path(portfolio.name)
             if not portfolio_path:
                 raise ValueError(f"Portfolio path not found for '{portfolio.name}'")
 
-            logger.debug(f"Saving portfolio '{portfolio.name}' to: {portfolio_path}")
-            self.portfolio_service.save_portfolio(portfolio, str(portfolio_path))
-            logger.debug(f"Portfolio '{portfolio.name}' saved successfully")
+            self.logger.debug("Saving portfolio '%s' to: %s", portfolio.name, portfolio_path)
+            self.portfolio_service.save_portfolio_patterns(portfolio, remaining, str(portfolio_path))
+            self.logger.debug("Pattern '%s' removed from portfolio '%s'", pattern.name, portfolio.name)
 
             # Show success message
             window.status_message(f"Regex Lab: Pattern '{pattern.name}' deleted successfully")
-            logger.debug(f"Delete operation completed successfully for pattern '{pattern.name}'")
+            self.logger.debug("Delete operation completed successfully for pattern '%s'", pattern.name)
 
         except (ValueError, OSError) as e:
-            logger.error(f"Error saving portfolio after delete: {e}")
-            # Rollback: add pattern back to portfolio
-            portfolio.patterns.insert(pattern_index, removed_pattern)
-            logger.debug(f"Rollback: Pattern '{pattern.name}' restored to portfolio at index {pattern_index}")
+            self.logger.error("Error saving portfolio after delete: %s", e)
             window.status_message(f"Regex Lab: Error deleting pattern - {e}")
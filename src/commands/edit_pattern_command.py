@@ -7,7 +7,6 @@ Auto-detects type from regex content (dynamic if contains {{VAR}}).
 
 from __future__ import annotations
 
-import re
 from datetime import datetime
 from typing import TYPE_CHECKING
 
@@ -27,6 +26,39 @@ from ..services.portfolio_service import PortfolioService
 if TYPE_CHECKING:
     import sublime  # pyright: ignore[reportMissingImports]
 
+logger = get_logger()
+
+# Editable fields, in submenu row order (the "Done" row follows them)
+_SUBMENU_FIELDS = ("name", "description", "regex", "default_panel")
+
+# default_panel value for each row of the Edit Default Panel Quick Panel
+_DEFAULT_PANEL_CHOICES = ("find", "replace", "find_in_files", None)
+
+
+def _contains_dynamic_var(text: str) -> bool:
+    """
+    Check whether text contains a {{VAR}} token.
+
+    Same answer as re.search(r"{{[^}]+}}", text), using str.find only:
+    for each "{{", the first "}" after it must start a "}}" and must not
+    directly follow the braces (so "{{}}" is not a variable).
+
+    Args:
+        text: Regex source to inspect
+
+    Returns:
+        True if a {{...}} token with a non-empty name is present
+    """
+    start = text.find("{{")
+    while start != -1:
+        close = text.find("}", start + 2)
+        if close == -1:
+            return False
+        if close > start + 2 and text.startswith("}}", close):
+            return True
+        start = text.find("{{", start + 1)
+    return False
+
 
 class EditPatternCommand:
     """
@@ -37,9 +69,6 @@ class EditPatternCommand:
     Updates portfolio.updated field on save.
     """
 
-    # Regex pattern to detect dynamic variables
-    DYNAMIC_VAR_PATTERN = re.compile(r"{{[^}]+}}")
-
     def __init__(self, portfolio_service: PortfolioService | None = None) -> None:
         """
         Initialize the command.
@@ -47,11 +76,16 @@ class EditPatternCommand:
         Args:
             portfolio_service: Optional PortfolioService instance (for testing)
         """
-        self.portfolio_service = portfolio_service or PortfolioService()
+        self.portfolio_service = portfolio_service or PortfolioService.get_instance()
         self.window: sublime.Window | None = None
         self.pattern: Pattern | None = None
         self.portfolio: Portfolio | None = None
         self.modified = False  # Track if any changes made
+        # Submenu rows, built on first show and patched for fields in _dirty
+        self._items: list[list[str]] | None = None
+        self._dirty: set[str] = set()
+        # "'<pattern>' [<portfolio>]" part of the per-field status messages
+        self._status_suffix: str | None = None
 
     def run(
         self,
@@ -67,13 +101,14 @@ class EditPatternCommand:
             pattern: Pattern to edit
             portfolio: Portfolio containing the pattern
         """
-        logger = get_logger()
-        logger.debug(f"Edit pattern started: '{pattern.name}' from portfolio '{portfolio.name}'")
+        logger.debug("Edit pattern started: '%s' from portfolio '%s'", pattern.name, portfolio.name)
 
         self.window = window
         self.pattern = pattern
         self.portfolio = portfolio
         self.modified = False
+        self._items = None
+        self._status_suffix = f"'{pattern.name}' [{portfolio.name}]"
 
         # Show main context in status bar
         self._show_main_status()
@@ -92,46 +127,25 @@ class EditPatternCommand:
         if not self.window or not self.pattern:
             return
 
-        logger = get_logger()
         logger.debug("Showing edit submenu")
 
-        # Get current type icon
-        type_icon = ICON_DYNAMIC_PATTERN if self.pattern.is_dynamic() else ICON_STATIC_PATTERN
-        type_label = "Dynamic" if self.pattern.is_dynamic() else "Static"
+        # Build rows once per session; afterwards only refresh fields edited since last show
+        if self._items is None:
+            self._items = [
+                [f"{ICON_EDIT} Edit Name", ""],
+                [f"{ICON_EDIT} Edit Description", ""],
+                [f"{ICON_EDIT} Edit Regex", ""],
+                [f"{ICON_EDIT} Edit Default Panel", ""],
+                ["✅ Done", ""],
+            ]
+            self._dirty = set(_SUBMENU_FIELDS)
 
-        # Get current default_panel display
-        panel_display = "None"
-        if self.pattern.default_panel:
-            panel_icons = {
-                "find": ICON_FIND_PANEL,
-                "replace": ICON_REPLACE_PANEL,
-                "find_in_files": ICON_FIND_IN_FILES_PANEL,
-            }
-            panel_icon = panel_icons.get(self.pattern.default_panel, "")
-            panel_display = f"{panel_icon} {self.pattern.default_panel}"
+        for field_name in self._dirty:
+            self._items[_SUBMENU_FIELDS.index(field_name)][1] = self._format_current(self.pattern, field_name)
+        self._dirty.clear()
 
-        items = [
-            [
-                f"{ICON_EDIT} Edit Name",
-                f"Current: {self.pattern.name}",
-            ],
-            [
-                f"{ICON_EDIT} Edit Description",
-                f"Current: {self.pattern.description}",
-            ],
-            [
-                f"{ICON_EDIT} Edit Regex",
-                f"Current: {self.pattern.regex} ({type_icon} {type_label})",
-            ],
-            [
-                f"{ICON_EDIT} Edit Default Panel",
-                f"Current: {panel_display}",
-            ],
-            [
-                "✅ Done",
-                "Save changes and exit" if self.modified else "Exit without changes",
-            ],
-        ]
+        self._items[4][1] = "Save changes and exit" if self.modified else "Exit without changes"
+        items = self._items
 
         self.window.show_quick_panel(
             items,
@@ -139,6 +153,40 @@ class EditPatternCommand:
             placeholder=f"Edit Pattern: {self.pattern.name}",
         )
 
+    @staticmethod
+    def _format_current(pattern: Pattern, field_name: str) -> str:
+        """
+        Format the "Current: ..." detail line of a submenu row.
+
+        Args:
+            pattern: Pattern being edited
+            field_name: One of _SUBMENU_FIELDS
+
+        Returns:
+            Detail text for the row
+        """
+        if field_name == "name":
+            return f"Current: {pattern.name}"
+        if field_name == "description":
+            return f"Current: {pattern.description}"
+        if field_name == "regex":
+            # Get current type icon
+            type_icon = ICON_DYNAMIC_PATTERN if pattern.is_dynamic() else ICON_STATIC_PATTERN
+            type_label = "Dynamic" if pattern.is_dynamic() else "Static"
+            return f"Current: {pattern.regex} ({type_icon} {type_label})"
+
+        # Get current default_panel display
+        panel_display = "None"
+        if pattern.default_panel:
+            panel_icons = {
+                "find": ICON_FIND_PANEL,
+                "replace": ICON_REPLACE_PANEL,
+                "find_in_files": ICON_FIND_IN_FILES_PANEL,
+            }
+            panel_icon = panel_icons.get(pattern.default_panel, "")
+            panel_display = f"{panel_icon} {pattern.default_panel}"
+        return f"Current: {panel_display}"
+
     def _handle_submenu_selection(self, index: int) -> None:
         """
         Handle user selection from edit submenu.
@@ -146,8 +194,6 @@ class EditPatternCommand:
         Args:
             index: Selected index (-1 = cancelled, 0-3 = edit fields, 4 = done)
         """
-        logger = get_logger()
-
         if index == -1:
             # User cancelled
             logger.debug("Edit submenu cancelled")
@@ -155,27 +201,20 @@ class EditPatternCommand:
                 self.window.status_message("Regex Lab: Edit cancelled (changes not saved)")
             return
 
-        if index == 0:
-            self._edit_name()
-        elif index == 1:
-            self._edit_description()
-        elif index == 2:
-            self._edit_regex()
-        elif index == 3:
-            self._edit_default_panel()
-        elif index == 4:
-            self._done()
+        # Handlers in submenu row order
+        handlers = (self._edit_name, self._edit_description, self._edit_regex, self._edit_default_panel, self._done)
+        if 0 <= index < len(handlers):
+            handlers[index]()
 
     def _edit_name(self) -> None:
         """Edit pattern name."""
         if not self.window or not self.pattern or not self.portfolio:
             return
 
-        logger = get_logger()
-        logger.debug(f"Editing name for pattern '{self.pattern.name}'")
+        logger.debug("Editing name for pattern '%s'", self.pattern.name)
 
         # Update status bar with persistent display
-        status = f"Regex Lab: Editing Name for '{self.pattern.name}' [{self.portfolio.name}]"
+        status = f"Regex Lab: Editing Name for {self._status_suffix}"
         show_persistent_status(self.window, status)
 
         def on_done(new_name: str) -> None:
@@ -191,7 +230,9 @@ class EditPatternCommand:
                 old_name = self.pattern.name  # type: ignore
                 self.pattern.name = new_name  # type: ignore
                 self.modified = True
-                logger.debug(f"Pattern name changed: '{old_name}' → '{new_name}'")
+                self._dirty.add("name")
+                self._status_suffix = f"'{new_name}' [{self.portfolio.name}]"  # type: ignore
+                logger.debug("Pattern name changed: '%s' → '%s'", old_name, new_name)
 
             self._show_main_status()
             self._show_edit_submenu()
@@ -215,11 +256,10 @@ class EditPatternCommand:
         if not self.window or not self.pattern or not self.portfolio:
             return
 
-        logger = get_logger()
-        logger.debug(f"Editing description for pattern '{self.pattern.name}'")
+        logger.debug("Editing description for pattern '%s'", self.pattern.name)
 
         # Update status bar with persistent display
-        status = f"Regex Lab: Editing Description for '{self.pattern.name}' [{self.portfolio.name}]"
+        status = f"Regex Lab: Editing Description for {self._status_suffix}"
         show_persistent_status(self.window, status)
 
         def on_done(new_desc: str) -> None:
@@ -235,7 +275,8 @@ class EditPatternCommand:
                 old_desc = self.pattern.description  # type: ignore
                 self.pattern.description = new_desc  # type: ignore
                 self.modified = True
-                logger.debug(f"Pattern description changed: '{old_desc}' → '{new_desc}'")
+                self._dirty.add("description")
+                logger.debug("Pattern description changed: '%s' → '%s'", old_desc, new_desc)
 
             self._show_main_status()
             self._show_edit_submenu()
@@ -259,11 +300,10 @@ class EditPatternCommand:
         if not self.window or not self.pattern or not self.portfolio:
             return
 
-        logger = get_logger()
-        logger.debug(f"Editing regex for pattern '{self.pattern.name}'")
+        logger.debug("Editing regex for pattern '%s'", self.pattern.name)
 
         # Update status bar with persistent display
-        status = f"Regex Lab: Editing Regex for '{self.pattern.name}' [{self.portfolio.name}]"
+        status = f"Regex Lab: Editing Regex for {self._status_suffix}"
         show_persistent_status(self.window, status)
 
         def on_done(new_regex: str) -> None:
@@ -282,7 +322,7 @@ class EditPatternCommand:
                 self.pattern.regex = new_regex  # type: ignore
 
                 # Auto-detect type from regex content
-                if self.DYNAMIC_VAR_PATTERN.search(new_regex):
+                if _contains_dynamic_var(new_regex):
                     self.pattern.type = PatternType.DYNAMIC  # type: ignore
                     logger.debug("Auto-detected type: dynamic (found {{VAR}} pattern)")
                 else:
@@ -290,9 +330,10 @@ class EditPatternCommand:
                     logger.debug("Auto-detected type: static (no {{VAR}} pattern)")
 
                 self.modified = True
-                logger.debug(f"Pattern regex changed: '{old_regex}' → '{new_regex}'")
+                self._dirty.add("regex")
+                logger.debug("Pattern regex changed: '%s' → '%s'", old_regex, new_regex)
                 if old_type != self.pattern.type:  # type: ignore
-                    logger.debug(f"Pattern type changed: {old_type} → {self.pattern.type}")  # type: ignore
+                    logger.debug("Pattern type changed: %s → %s", old_type, self.pattern.type)  # type: ignore
 
             self._show_main_status()
             self._show_edit_submenu()
@@ -316,11 +357,10 @@ class EditPatternCommand:
         if not self.window or not self.pattern or not self.portfolio:
             return
 
-        logger = get_logger()
-        logger.debug(f"Editing default_panel for pattern '{self.pattern.name}'")
+        logger.debug("Editing default_panel for pattern '%s'", self.pattern.name)
 
         # Update status bar with persistent display
-        status = f"Regex Lab: Editing Default Panel for '{self.pattern.name}' [{self.portfolio.name}]"
+        status = f"Regex Lab: Editing Default Panel for {self._status_suffix}"
         show_persistent_status(self.window, status)
 
         items = [
@@ -340,19 +380,13 @@ class EditPatternCommand:
 
             old_panel = self.pattern.default_panel  # type: ignore
 
-            if index == 0:
-                new_panel = "find"
-            elif index == 1:
-                new_panel = "replace"
-            elif index == 2:
-                new_panel = "find_in_files"
-            else:  # index == 3
-                new_panel = None
+            new_panel = _DEFAULT_PANEL_CHOICES[index]
 
             if new_panel != old_panel:
                 self.pattern.default_panel = new_panel  # type: ignore
                 self.modified = True
-                logger.debug(f"Pattern default_panel changed: {old_panel} → {new_panel}")
+                self._dirty.add("default_panel")
+                logger.debug("Pattern default_panel changed: %s → %s", old_panel, new_panel)
 
             self._show_main_status()
             self._show_edit_submenu()
@@ -364,34 +398,32 @@ class EditPatternCommand:
         if not self.window or not self.pattern or not self.portfolio:
             return
 
-        logger = get_logger()
-
         if not self.modified:
             logger.debug("No changes made, exiting without save")
             self.window.status_message("Regex Lab: No changes made")
             return
 
-        logger.debug(f"Saving changes for pattern '{self.pattern.name}'")
+        logger.debug("Saving changes for pattern '%s'", self.pattern.name)
 
         # Update portfolio.updated field with today's date (ISO format)
         today = datetime.now().strftime("%Y-%m-%d")
         self.portfolio.updated = today
-        logger.debug(f"Portfolio updated field set to: {today}")
+        logger.debug("Portfolio updated field set to: %s", today)
 
         # Save portfolio
         try:
-            portfolio_path = self.portfolio_service.portfolio_manager._portfolio_paths.get(self.portfolio.name)
+            portfolio_path = self.portfolio_service.get_portfolio_path(self.portfolio.name)
             if not portfolio_path:
                 raise ValueError(f"Portfolio path not found for '{self.portfolio.name}'")
 
-            logger.debug(f"Saving portfolio '{self.portfolio.name}' to: {portfolio_path}")
+            logger.debug("Saving portfolio '%s' to: %s", self.portfolio.name, portfolio_path)
             self.portfolio_service.save_portfolio(self.portfolio, str(portfolio_path))
-            logger.debug(f"Portfolio '{self.portfolio.name}' saved successfully")
+            logger.debug("Portfolio '%s' saved successfully", self.portfolio.name)
 
             # Show success message
             self.window.status_message(f"Regex Lab: Pattern '{self.pattern.name}' updated [{self.portfolio.name}]")
-            logger.debug(f"Edit operation completed successfully for pattern '{self.pattern.name}'")
+            logger.debug("Edit operation completed successfully for pattern '%s'", self.pattern.name)
 
         except (ValueError, OSError) as e:
-            logger.error(f"Error saving portfolio after edit: {e}")
+            logger.error("Error saving portfolio after edit: %s", e)
             self.window.status_message(f"Regex Lab: Error saving changes - {e}")
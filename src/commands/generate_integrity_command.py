@@ -12,6 +12,8 @@ Run manually from Python console when builtin portfolios are finalized.
 
 from __future__ import annotations
 
+import os
+import traceback
 from pathlib import Path
 
 import sublime  # pyright: ignore[reportMissingImports]
@@ -20,6 +22,8 @@ import sublime_plugin  # pyright: ignore[reportMissingImports]
 from ..core.integrity_manager import IntegrityManager
 from ..core.logger import get_logger
 
+logger = get_logger()
+
 
 class RegexlabGenerateIntegrityCommand(sublime_plugin.ApplicationCommand):  # type: ignore[misc]
     """
@@ -36,7 +40,6 @@ class RegexlabGenerateIntegrityCommand(sublime_plugin.ApplicationCommand):  # ty
 
     def run(self) -> None:
         """Execute the command."""
-        logger = get_logger()
         logger.info("=" * 60)
         logger.info("GENERATING MULTI-PORTFOLIO INTEGRITY KEYSTORE (v2)")
         logger.info("=" * 60)
@@ -57,8 +60,11 @@ class RegexlabGenerateIntegrityCommand(sublime_plugin.ApplicationCommand):  # ty
                 )
                 return
 
-            # List portfolio files
-            portfolio_files = sorted(builtin_portfolios_dir.glob("*.json"))
+            # List portfolio files (single scandir pass, reused by generate_keystore)
+            with os.scandir(builtin_portfolios_dir) as entries:
+                portfolio_files = sorted(
+                    Path(entry.path) for entry in entries if entry.name.endswith(".json") and entry.is_file()
+                )
             if not portfolio_files:
                 logger.error("✗ No portfolio files found in: %s", builtin_portfolios_dir)
                 sublime.error_message(
@@ -96,17 +102,19 @@ class RegexlabGenerateIntegrityCommand(sublime_plugin.ApplicationCommand):  # ty
 
             # Generate keystore
             logger.info("Generating integrity keystore...")
-            portfolio_count, total_bytes = manager.generate_keystore(builtin_portfolios_dir)
+            portfolio_count, total_bytes = manager.generate_keystore(builtin_portfolios_dir, portfolio_files)
 
             # Success
+            salt_size = manager.salt_file.stat().st_size
+            kst_size = manager.keystore_file.stat().st_size
             logger.info("=" * 60)
             logger.info("SUCCESS: Integrity keystore generated!")
             logger.info("  Location: %s", regexlab_dir)
             logger.info("  Portfolios: %s", portfolio_count)
             logger.info("  Total size: %s bytes", f"{total_bytes:,}")
             logger.info("  Files:")
-            logger.info("    - salt.key (%s bytes)", manager.salt_file.stat().st_size)
-            logger.info("    - rxl.kst (%s bytes)", f"{manager.keystore_file.stat().st_size:,}")
+            logger.info("    - salt.key (%s bytes)", salt_size)
+            logger.info("    - rxl.kst (%s bytes)", f"{kst_size:,}")
             logger.info("=" * 60)
 
             sublime.message_dialog(
@@ -115,22 +123,18 @@ class RegexlabGenerateIntegrityCommand(sublime_plugin.ApplicationCommand):  # ty
                 f"Portfolios protected: {portfolio_count}\n"
                 f"Total size: {total_bytes:,} bytes\n\n"
                 "Files created:\n"
-                f"  • salt.key ({manager.salt_file.stat().st_size} bytes)\n"
-                f"  • rxl.kst ({manager.keystore_file.stat().st_size:,} bytes)\n\n"
+                f"  • salt.key ({salt_size} bytes)\n"
+                f"  • rxl.kst ({kst_size:,} bytes)\n\n"
                 "Builtin portfolios are now protected."
             )
 
         except ValueError as e:
             logger.error("✗ Validation error: %s", e)
-            import traceback
-
             logger.error("Traceback: %s", traceback.format_exc())
             sublime.error_message(f"RegexLab: Keystore generation failed!\n\n{e}\n\nCheck console for details.")
 
         except OSError as e:
             logger.error("✗ I/O error: %s", e)
-            import traceback
-
             logger.error("Traceback: %s", traceback.format_exc())
             sublime.error_message(f"RegexLab: File operation failed!\n\n{e}\n\nCheck console for details.")
 
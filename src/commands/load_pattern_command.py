@@ -6,12 +6,16 @@ Provides Quick Panel selection and injection into Sublime Text Find panel.
 
 from __future__ import annotations
 
+import html
 import re
+import time
 from datetime import datetime
+from functools import lru_cache, partial
 from typing import TYPE_CHECKING, Callable
 
 from ..core.constants import (
     DEFAULT_DATE_FORMAT,
+    DEFAULT_QUICK_PANEL_MAX_ITEMS,
     DEFAULT_QUICK_PANEL_SHOW_DESCRIPTIONS,
     DEFAULT_QUICK_PANEL_WIDTH,
     DEFAULT_SHOW_INPUT_HELP_POPUP,
@@ -31,7 +35,7 @@ from ..core.helpers import (
     is_builtin_portfolio_path,
     pluralize,
 )
-from ..core.logger import get_logger
+from ..core.logger import LogLevel, get_logger
 from ..core.models import Pattern, Portfolio
 from ..core.settings_manager import SettingsManager
 from ..services.pattern_service import PatternService
@@ -48,6 +52,139 @@ from .portfolio_manager_command_helper import collect_variables_for_pattern
 if TYPE_CHECKING:
     import sublime  # pyright: ignore[reportMissingImports]
 
+logger = get_logger()
+
+# sublime imported once at module load (None outside Sublime Text)
+try:
+    import sublime as _sublime  # pyright: ignore[reportMissingImports]
+except ImportError:
+    _sublime = None
+
+# Quick panel flag resolved once at import (0 when sublime is unavailable)
+_MONOSPACE_FONT = getattr(_sublime, "MONOSPACE_FONT", 0)
+
+# Panel icons shown in front of descriptions for patterns with a default_panel
+_PANEL_ICONS = {
+    "find": ICON_FIND_PANEL,
+    "replace": ICON_REPLACE_PANEL,
+    "find_in_files": ICON_FIND_IN_FILES_PANEL,
+}
+
+# Date/time variables (casefolded name) -> (format setting key, default format)
+_DATETIME_FORMAT_SETTINGS = {
+    "date": ("date_format", DEFAULT_DATE_FORMAT),
+    "time": ("time_format", DEFAULT_TIME_FORMAT),
+}
+
+# Variable input help popup (minihtml), filled with str.format_map
+_POPUP_HTML_HEADER = """
+<body style="margin: 0; padding: 10px; font-family: system-ui;">
+    <div style="background: var(--background); color: var(--foreground);">
+        <h3 style="margin: 0 0 8px 0; color: var(--bluish);">
+            {emoji} {title}
+        </h3>
+"""
+_POPUP_HTML_FOOTER = """
+    </div>
+</body>
+"""
+_POPUP_HTML_WITH_FORMAT = (
+    _POPUP_HTML_HEADER
+    + """
+        <p style="margin: 4px 0;">
+            <b>Format:</b> <code style="background: var(--background); padding: 2px 4px; border-radius: 3px;">{format_info}</code>
+        </p>
+        <p style="margin: 4px 0;">
+            <b>Example:</b> <span style="color: var(--greenish);">{example}</span>
+        </p>
+"""
+    + _POPUP_HTML_FOOTER
+)
+_POPUP_HTML_NO_FORMAT = (
+    _POPUP_HTML_HEADER
+    + """
+        <p style="margin: 4px 0; font-style: italic;">
+            Enter any value for this variable
+        </p>
+"""
+    + _POPUP_HTML_FOOTER
+)
+
+# Label of the last row of a truncated pattern list (opens the next page)
+_SHOW_MORE_LABEL = "▸ Show more patterns…"
+
+# Map strftime directives to strict ISO regex patterns
+# These patterns enforce zero-padding and valid ranges
+_STRFTIME_DIRECTIVES = {
+    "%Y": r"[12][0-9]{3}",  # Year: 1000-2999 (ISO 8601)
+    "%y": r"[0-9]{2}",  # 2-digit year: 00-99
+    "%m": r"(0[1-9]|1[0-2])",  # Month: 01-12 (zero-padded)
+    "%d": r"(0[1-9]|[12][0-9]|3[01])",  # Day: 01-31 (zero-padded)
+    "%H": r"([01][0-9]|2[0-3])",  # Hour 24h: 00-23 (zero-padded)
+    "%I": r"(0[1-9]|1[0-2])",  # Hour 12h: 01-12 (zero-padded)
+    "%M": r"[0-5][0-9]",  # Minute: 00-59 (zero-padded)
+    "%S": r"[0-5][0-9]",  # Second: 00-59 (zero-padded)
+    "%f": r"[0-9]{6}",  # Microsecond: 000000-999999
+    "%p": r"(AM|PM)",  # AM/PM indicator
+    "%B": r"\w+",  # Full month name (variable length)
+    "%b": r"\w{3}",  # Abbreviated month (3 chars)
+    "%A": r"\w+",  # Full weekday name (variable length)
+    "%a": r"\w{3}",  # Abbreviated weekday (3 chars)
+}
+
+
+# Formatted "now" values for date/time hints: strftime format -> (monotonic timestamp, value)
+# Reused for _HINT_TTL_SECONDS so back-to-back variable prompts do not reformat the clock
+_HINT_TTL_SECONDS = 1.0
+_now_cache: dict[str, tuple[float, str]] = {}
+
+
+def _now_strftime(strftime_format: str) -> str:
+    """
+    Format the current date/time, reusing a value formatted less than a second ago.
+
+    Args:
+        strftime_format: Python strftime format string (e.g., "%Y-%m-%d")
+
+    Returns:
+        Current date/time formatted with strftime_format
+    """
+    now = time.monotonic()
+    cached = _now_cache.get(strftime_format)
+    if cached is not None and now - cached[0] < _HINT_TTL_SECONDS:
+        return cached[1]
+
+    # time.strftime formats the C struct directly (no datetime object);
+    # only datetime supports %f (microseconds)
+    if "%f" in strftime_format:
+        value = datetime.now().strftime(strftime_format)
+    else:
+        value = time.strftime(strftime_format)
+    _now_cache[strftime_format] = (now, value)
+    return value
+
+
+def _pattern_sort_key(pattern: Pattern) -> str:
+    """Case-insensitive sort key for pattern names (casefold handles Unicode, e.g. ß/ss)."""
+    return pattern.name.casefold()
+
+
+@lru_cache(maxsize=64)
+def _compile_strftime_regex(strftime_format: str) -> re.Pattern[str]:
+    """
+    Compile the validation regex for a strftime format, once per format.
+
+    Date/time variables are validated on every input, always against the
+    same date_format/time_format settings, so the conversion is memoized.
+
+    Args:
+        strftime_format: Python strftime format string (e.g., "%Y-%m-%d")
+
+    Returns:
+        Compiled regex (see LoadPatternCommand._format_to_regex)
+    """
+    return re.compile(LoadPatternCommand._format_to_regex(strftime_format))
+
 
 class LoadPatternCommand:
     """
@@ -74,7 +211,7 @@ class LoadPatternCommand:
             settings_manager: Optional SettingsManager instance (for testing)
         """
         self.pattern_service = pattern_service or PatternService()
-        self.portfolio_service = portfolio_service or PortfolioService()
+        self.portfolio_service = portfolio_service or PortfolioService.get_instance()
         self.settings_manager = settings_manager or SettingsManager.get_instance()
 
     def run(self, window: sublime.Window) -> None:
@@ -112,12 +249,23 @@ class LoadPatternCommand:
         # Get Quick Panel width from settings
         panel_width = self.settings_manager.get("quick_panel_width", DEFAULT_QUICK_PANEL_WIDTH)
 
+        # Check if descriptions should be shown (read once, not per pattern)
+        show_descriptions = self.settings_manager.get(
+            "quick_panel_show_descriptions", DEFAULT_QUICK_PANEL_SHOW_DESCRIPTIONS
+        )
+
         # Portfolios already sorted by get_all_portfolios() - no need to re-sort
 
         # Build grouped display with separators
-        items: list[list[str]] = []
+        # Two-line rows are [line, description]; single-line rows are plain strings
+        # (show_quick_panel flattens rows itself, so no one-element list per pattern)
+        items: list[list[str] | str] = []
         # Map: (Portfolio or None for separator, Pattern or None for separator)
         pattern_map: list[tuple[Portfolio | None, Pattern | None]] = []
+        # Map: portfolio name -> (file path, is_builtin), reused by the Actions menu
+        builtin_map: dict[str, tuple[str | None, bool]] = {}
+        # Path lookup bound once for the loop (one dict lookup per portfolio)
+        portfolio_path_for = self.portfolio_service.get_portfolio_path
 
         for portfolio in all_portfolios:
             patterns = portfolio.patterns
@@ -125,11 +273,12 @@ class LoadPatternCommand:
                 continue
 
             # Sort patterns alphabetically by name (case-insensitive)
-            patterns = sorted(patterns, key=lambda p: p.name.lower())
+            patterns = sorted(patterns, key=_pattern_sort_key)
 
             # Determine if portfolio is truly builtin (based on file location)
-            portfolio_path = self.portfolio_service.portfolio_manager._portfolio_paths.get(portfolio.name)
+            portfolio_path = portfolio_path_for(portfolio.name)
             is_builtin = is_builtin_portfolio_path(portfolio_path)
+            builtin_map[portfolio.name] = (portfolio_path, is_builtin)
 
             # Add separator for this portfolio (centered with readonly indicator)
             separator_line = self._format_separator(portfolio.name, is_builtin, portfolio.readonly, panel_width)
@@ -137,39 +286,28 @@ class LoadPatternCommand:
             items.append([separator_line, f"{pattern_count} {pluralize(pattern_count, 'pattern')}"])
             pattern_map.append((None, None))  # Placeholder for separator (not selectable)
 
-            # Add patterns from this portfolio with aligned formatting
-            for pattern in patterns:
-                formatted_line = self._format_pattern_line(pattern, portfolio.name, panel_width)
-
-                # Check if descriptions should be shown
-                show_descriptions = self.settings_manager.get(
-                    "quick_panel_show_descriptions", DEFAULT_QUICK_PANEL_SHOW_DESCRIPTIONS
+            # Add patterns from this portfolio with aligned formatting (one extend per portfolio)
+            portfolio_tag = f"[{portfolio.name}]"
+            if show_descriptions:
+                items.extend(
+                    [
+                        self._format_pattern_line(pattern, portfolio_tag, panel_width),
+                        self._format_description_line(pattern),
+                    ]
+                    for pattern in patterns
                 )
+            else:
+                # Single-line mode: no description
+                items.extend(self._format_pattern_line(pattern, portfolio_tag, panel_width) for pattern in patterns)
 
-                if show_descriptions:
-                    description_line = self._format_description_line(pattern)
-                    items.append([formatted_line, description_line])
-                else:
-                    # Single-line mode: no description
-                    items.append([formatted_line])
-
-                pattern_map.append((portfolio, pattern))
+            pattern_map.extend((portfolio, pattern) for pattern in patterns)
 
         if not pattern_map:
             window.status_message("Regex Lab: No patterns available")
             return
 
-        # Show Quick Panel with pattern selector callback
-        on_select = self._create_pattern_selector(window, pattern_map)
-
-        # Show Quick Panel with monospace font for proper alignment
-        try:
-            import sublime  # pyright: ignore[reportMissingImports]
-
-            window.show_quick_panel(items, on_select, flags=sublime.MONOSPACE_FONT)
-        except (ImportError, AttributeError):
-            # Fallback for tests (sublime module not available)
-            window.show_quick_panel(items, on_select)
+        # Show Quick Panel (first page) with pattern selector callback
+        self._show_pattern_page(window, items, pattern_map, builtin_map)
 
     def _run_single_portfolio(self, window: sublime.Window) -> None:
         """
@@ -194,8 +332,8 @@ class LoadPatternCommand:
             window.status_message("Regex Lab: No patterns in active portfolio")
             return
 
-        # Prepare Quick Panel items (classic format)
-        items: list[list[str]] = []
+        # Prepare Quick Panel items (classic format, plain strings in single-line mode)
+        items: list[list[str] | str] = []
 
         # Check if descriptions should be shown
         show_descriptions = self.settings_manager.get(
@@ -213,21 +351,62 @@ class LoadPatternCommand:
                 items.append([pattern.name, description_line])
             else:
                 # Single-line mode: no description
-                items.append([pattern.name])
+                items.append(pattern.name)
 
             pattern_map.append((active_portfolio, pattern))
 
-        # Show Quick Panel with pattern selector callback
-        on_select = self._create_pattern_selector(window, pattern_map)
+        # Show Quick Panel (first page) with pattern selector callback
+        self._show_pattern_page(window, items, pattern_map)
 
-        # Show Quick Panel with monospace font for proper alignment
-        try:
-            import sublime  # pyright: ignore[reportMissingImports]
+    def _show_pattern_page(
+        self,
+        window: sublime.Window,
+        items: list[list[str] | str],
+        pattern_map: list[tuple[Portfolio | None, Pattern | None]],
+        builtin_map: dict[str, tuple[str | None, bool]] | None = None,
+        offset: int = 0,
+    ) -> None:
+        """
+        Show one page of the pattern list in the Quick Panel.
+
+        At most 'quick_panel_max_items' rows are handed to the Quick Panel
+        (0 = no limit). When rows remain, a "Show more" row is appended that
+        re-opens the panel on the next page of the already built rows.
+
+        Args:
+            window: Sublime Text window instance
+            items: All Quick Panel rows (built once)
+            pattern_map: List mapping row indices to (portfolio, pattern) tuples
+            builtin_map: Optional portfolio name -> (path, is_builtin) map from the list build
+            offset: Index of the first row of this page
+        """
+        max_items = self.settings_manager.get("quick_panel_max_items", DEFAULT_QUICK_PANEL_MAX_ITEMS)
+        end = offset + max_items if max_items > 0 else len(items)
+
+        # Small lists (the common case): show everything, no slicing
+        if offset == 0 and end >= len(items):
+            on_select = self._create_pattern_selector(window, pattern_map, builtin_map)
+            window.show_quick_panel(items, on_select, flags=_MONOSPACE_FONT)
+            return
+
+        page_items = items[offset:end]
+        page_map = pattern_map[offset:end]
+
+        # Rows are padded to the width of the first row: keep it a list when
+        # a page starts on a single-line (plain string) row
+        if isinstance(page_items[0], str):
+            page_items[0] = [page_items[0], ""]
+
+        on_show_more: Callable[[], None] | None = None
+        remaining = len(items) - end
+        if remaining > 0:
+            page_items.append([_SHOW_MORE_LABEL, f"{remaining} more {pluralize(remaining, 'row')}"])
+            on_show_more = partial(self._show_pattern_page, window, items, pattern_map, builtin_map, end)
 
-            window.show_quick_panel(items, on_select, flags=sublime.MONOSPACE_FONT)
-        except (ImportError, AttributeError):
-            # Fallback for tests (sublime module not available)
-            window.show_quick_panel(items, on_select)
+        on_select = self._create_pattern_selector(window, page_map, builtin_map, on_show_more)
+
+        # Show Quick Panel with monospace font for proper alignment
+        window.show_quick_panel(page_items, on_select, flags=_MONOSPACE_FONT)
 
     def _format_separator(self, portfolio_name: str, is_builtin: bool, is_readonly: bool, panel_width: int) -> str:
         """
@@ -260,7 +439,7 @@ class LoadPatternCommand:
 
         return format_centered_separator(label, panel_width)
 
-    def _format_pattern_line(self, pattern: Pattern, portfolio_name: str, panel_width: int) -> str:
+    def _format_pattern_line(self, pattern: Pattern, portfolio_tag: str, panel_width: int) -> str:
         """
         Format a pattern line with aligned columns.
 
@@ -269,18 +448,19 @@ class LoadPatternCommand:
 
         Args:
             pattern: Pattern to format
-            portfolio_name: Name of the portfolio
+            portfolio_tag: Bracketed portfolio name ("[Portfolio]"), built once per portfolio
             panel_width: Total width for Quick Panel (from settings)
 
         Returns:
             Formatted line string
         """
         # Determine icon and type label
-        icon = ICON_DYNAMIC_PATTERN if pattern.is_dynamic() else ICON_STATIC_PATTERN
-        type_label = "Dynamic" if pattern.is_dynamic() else "Static "  # Add space after Static for alignment
+        is_dynamic = pattern.is_dynamic()
+        icon = ICON_DYNAMIC_PATTERN if is_dynamic else ICON_STATIC_PATTERN
+        type_label = "Dynamic" if is_dynamic else "Static "  # Add space after Static for alignment
 
         # Build right suffix: [Portfolio] Icon Type
-        right_text = f"[{portfolio_name}] {icon} {type_label}"
+        right_text = f"{portfolio_tag} {icon} {type_label}"
 
         # Delegate to unified formatter
         return format_quick_panel_line(pattern.name, right_text, panel_width)
@@ -308,16 +488,9 @@ class LoadPatternCommand:
                 "Find FIXME comments in project files"
                 "Match email addresses in text"
         """
-        # Panel icons mapping
-        panel_icons = {
-            "find": ICON_FIND_PANEL,
-            "replace": ICON_REPLACE_PANEL,
-            "find_in_files": ICON_FIND_IN_FILES_PANEL,
-        }
-
         # If pattern has default_panel, show panel icon + description
-        if pattern.default_panel and pattern.default_panel in panel_icons:
-            panel_icon = panel_icons[pattern.default_panel]
+        panel_icon = _PANEL_ICONS.get(pattern.default_panel) if pattern.default_panel else None
+        if panel_icon:
             return f"{panel_icon} {pattern.description}"
 
         # Otherwise, show ONLY description (type info already in main line)
@@ -329,6 +502,7 @@ class LoadPatternCommand:
         pattern: Pattern,
         portfolio: Portfolio,
         on_action_callback: Callable[[str, str | None], None],
+        builtin_info: tuple[str | None, bool] | None = None,
     ) -> None:
         """
         Show Actions Quick Panel after pattern selection.
@@ -350,24 +524,29 @@ class LoadPatternCommand:
             on_action_callback: Callback function receiving (action_type, panel_type)
                 - action_type: "use" | "edit" | "delete"
                 - panel_type: "find" | "replace" | "find_in_files" (only for "use" actions)
+            builtin_info: (portfolio path, is_builtin) already computed while building
+                the pattern list; resolved here when not provided (V1 mode)
         """
-        logger = get_logger()
-        logger.debug(f"Showing Actions menu for pattern '{pattern.name}' in portfolio '{portfolio.name}'")
+        logger.debug("Showing Actions menu for pattern '%s' in portfolio '%s'", pattern.name, portfolio.name)
 
-        # Determine if portfolio is builtin (based on file path)
-        portfolio_path = self.portfolio_service.portfolio_manager._portfolio_paths.get(portfolio.name)
-        logger.debug(f"Portfolio path: {portfolio_path}")
-
-        # Check if portfolio path indicates builtin
-        is_builtin = is_builtin_portfolio_path(portfolio_path)
+        if builtin_info is not None:
+            portfolio_path, is_builtin = builtin_info
+        else:
+            # Determine if portfolio is builtin (based on file path)
+            portfolio_path = self.portfolio_service.get_portfolio_path(portfolio.name)
+            is_builtin = is_builtin_portfolio_path(portfolio_path)
 
-        logger.debug(f"Builtin detection: path={portfolio_path}, is_builtin={is_builtin}")
+        logger.debug("Builtin detection: path=%s, is_builtin=%s", portfolio_path, is_builtin)
 
         # Check if portfolio is editable (not builtin + not readonly)
         is_editable = not is_builtin and not portfolio.readonly
 
         logger.debug(
-            f"Portfolio '{portfolio.name}': builtin={is_builtin}, readonly={portfolio.readonly}, editable={is_editable}"
+            "Portfolio '%s': builtin=%s, readonly=%s, editable=%s",
+            portfolio.name,
+            is_builtin,
+            portfolio.readonly,
+            is_editable,
         )
 
         # Build items list with context-aware actions
@@ -398,7 +577,7 @@ class LoadPatternCommand:
                 # Use actions (always at indices 0-2)
                 panel_types = ["find", "replace", "find_in_files"]
                 selected_panel = panel_types[index]
-                logger.debug(f"User selected 'use' action with panel={selected_panel}")
+                logger.debug("User selected 'use' action with panel=%s", selected_panel)
                 on_action_callback("use", selected_panel)
             elif not is_builtin and index == 3:
                 # Edit action (index 3 if not builtin)
@@ -423,48 +602,78 @@ class LoadPatternCommand:
         self,
         window: sublime.Window,
         pattern_map: list[tuple[Portfolio | None, Pattern | None]],
+        builtin_map: dict[str, tuple[str | None, bool]] | None = None,
+        on_show_more: Callable[[], None] | None = None,
     ) -> Callable[[int], None]:
         """
         Factory function to create pattern selection callback.
 
-        Reduces nesting level from 2 to 1 by extracting the nested on_select callback.
+        Binds the panel context to _on_pattern_select with functools.partial
+        (no nested function/closure cells allocated per Quick Panel open).
 
         Args:
             window: Sublime Text window instance
             pattern_map: List mapping Quick Panel indices to (portfolio, pattern) tuples
+            builtin_map: Optional portfolio name -> (path, is_builtin) map from the list build
+            on_show_more: Optional callback for the "Show more" row (right after the mapped rows)
 
         Returns:
             Callback function for Quick Panel on_select
         """
+        return partial(self._on_pattern_select, window, pattern_map, builtin_map, on_show_more)
 
-        def on_select(index: int) -> None:
-            if index == -1:
-                # User cancelled
-                return
+    def _on_pattern_select(
+        self,
+        window: sublime.Window,
+        pattern_map: list[tuple[Portfolio | None, Pattern | None]],
+        builtin_map: dict[str, tuple[str | None, bool]] | None,
+        on_show_more: Callable[[], None] | None,
+        index: int,
+    ) -> None:
+        """
+        Handle pattern selection in the Load Pattern Quick Panel.
+
+        Args:
+            window: Sublime Text window instance
+            pattern_map: List mapping Quick Panel indices to (portfolio, pattern) tuples
+            builtin_map: Optional portfolio name -> (path, is_builtin) map from the list build
+            on_show_more: Optional callback for the "Show more" row (right after the mapped rows)
+            index: Selected Quick Panel index (-1 if cancelled)
+        """
+        if index == -1:
+            # User cancelled
+            return
+
+        if on_show_more is not None and index == len(pattern_map):
+            # "Show more" row: open the next page
+            on_show_more()
+            return
 
-            selected_portfolio, selected_pattern = pattern_map[index]
+        selected_portfolio, selected_pattern = pattern_map[index]
 
-            # Skip separators (both are None)
-            if selected_pattern is None or selected_portfolio is None:
-                return
+        # Skip separators (both are None)
+        if selected_pattern is None or selected_portfolio is None:
+            return
 
-            logger = get_logger()
+        if logger.is_enabled_for(LogLevel.DEBUG):
             logger.debug(
-                f"Pattern selected: '{selected_pattern.name}' "
-                f"(type={selected_pattern.type}, dynamic={selected_pattern.is_dynamic()})"
+                "Pattern selected: '%s' (type=%s, dynamic=%s)",
+                selected_pattern.name,
+                selected_pattern.type,
+                selected_pattern.is_dynamic(),
             )
 
-            # PRIORITY: If pattern has default_panel configured, skip Actions menu and inject directly
-            if selected_pattern.default_panel:
-                logger.debug(f"Pattern has default_panel='{selected_pattern.default_panel}', skipping Actions menu")
-                self._handle_use_action(window, selected_pattern, selected_pattern.default_panel, None)
-                return
-
-            # Show Actions Quick Panel with unified callback
-            on_action_callback = self._create_action_callback(window, selected_pattern, selected_portfolio)
-            self._show_pattern_actions_menu(window, selected_pattern, selected_portfolio, on_action_callback)
+        # PRIORITY: If pattern has default_panel configured, skip Actions menu and inject directly
+        default_panel = selected_pattern.default_panel
+        if default_panel:
+            logger.debug("Pattern has default_panel='%s', skipping Actions menu", default_panel)
+            self._handle_use_action(window, selected_pattern, default_panel, None)
+            return
 
-        return on_select
+        # Show Actions Quick Panel with unified callback
+        on_action_callback = self._create_action_callback(window, selected_pattern, selected_portfolio)
+        builtin_info = builtin_map.get(selected_portfolio.name) if builtin_map else None
+        self._show_pattern_actions_menu(window, selected_pattern, selected_portfolio, on_action_callback, builtin_info)
 
     def _create_action_callback(
         self,
@@ -476,7 +685,7 @@ class LoadPatternCommand:
         Factory function to create action callback for pattern actions menu.
 
         Eliminates 85% code duplication between V1 and V2 modes by unifying
-        the action handling logic.
+        the action handling logic (bound to _on_pattern_action with functools.partial).
 
         Args:
             window: Sublime Text window instance
@@ -486,27 +695,41 @@ class LoadPatternCommand:
         Returns:
             Callback function for action selection (action_type, panel_type)
         """
+        return partial(self._on_pattern_action, window, pattern, portfolio)
 
-        def on_action_callback(action_type: str, panel_type: str | None) -> None:
-            """Callback when user selects an action from Actions menu."""
-            logger = get_logger()
-            logger.debug(f"Action selected: type={action_type}, panel={panel_type}")
-
-            if action_type == "use":
-                # User chose "Use in X" - route to injection workflow
-                self._handle_use_action(window, pattern, panel_type, None)  # type: ignore
-            elif action_type == "edit":
-                # Edit Pattern
-                logger.debug(f"Edit Pattern action triggered for '{pattern.name}'")
-                edit_cmd = EditPatternCommand(self.portfolio_service)
-                edit_cmd.run(window, pattern, portfolio)
-            elif action_type == "delete":
-                # Delete Pattern
-                logger.debug(f"Delete Pattern action triggered for '{pattern.name}'")
-                delete_cmd = DeletePatternCommand(self.portfolio_service)
-                delete_cmd.run(window, pattern, portfolio)
+    def _on_pattern_action(
+        self,
+        window: sublime.Window,
+        pattern: Pattern,
+        portfolio: Portfolio,
+        action_type: str,
+        panel_type: str | None,
+    ) -> None:
+        """
+        Handle an action selected from the Actions menu.
 
-        return on_action_callback
+        Args:
+            window: Sublime Text window instance
+            pattern: Selected pattern
+            portfolio: Portfolio containing the pattern
+            action_type: "use" | "edit" | "delete"
+            panel_type: "find" | "replace" | "find_in_files" (only for "use" actions)
+        """
+        logger.debug("Action selected: type=%s, panel=%s", action_type, panel_type)
+
+        if action_type == "use":
+            # User chose "Use in X" - route to injection workflow
+            self._handle_use_action(window, pattern, panel_type, None)  # type: ignore
+        elif action_type == "edit":
+            # Edit Pattern
+            logger.debug("Edit Pattern action triggered for '%s'", pattern.name)
+            edit_cmd = EditPatternCommand(self.portfolio_service)
+            edit_cmd.run(window, pattern, portfolio)
+        elif action_type == "delete":
+            # Delete Pattern
+            logger.debug("Delete Pattern action triggered for '%s'", pattern.name)
+            delete_cmd = DeletePatternCommand(self.portfolio_service)
+            delete_cmd.run(window, pattern, portfolio)
 
     def _handle_use_action(
         self,
@@ -528,13 +751,11 @@ class LoadPatternCommand:
             panel_type: Target panel ("find" | "replace" | "find_in_files")
             captured_panel: Previously captured panel (for dynamic patterns, unused in refactored flow)
         """
-        logger = get_logger()
-        logger.debug(
-            f"Handling 'use' action: pattern='{pattern.name}', panel={panel_type}, is_dynamic={pattern.is_dynamic()}"
-        )
+        is_dynamic = pattern.is_dynamic()
+        logger.debug("Handling 'use' action: pattern='%s', panel=%s, is_dynamic=%s", pattern.name, panel_type, is_dynamic)
 
         # Static patterns: format and inject directly
-        if not pattern.is_dynamic():
+        if not is_dynamic:
             logger.debug("Static pattern detected, injecting directly")
             resolved_pattern = self.pattern_service.format_for_find_panel(pattern)
             self._inject_pattern_in_panel(window, panel_type, resolved_pattern, pattern.name)
@@ -547,20 +768,19 @@ class LoadPatternCommand:
             window.status_message("Regex Lab: Dynamic pattern has no variables")
             return
 
-        logger.debug(
-            f"Collecting {len(variables_to_collect)} "
-            f"{pluralize(len(variables_to_collect), 'variable')} for dynamic pattern"
-        )
+        if logger.is_enabled_for(LogLevel.DEBUG):
+            variable_count = len(variables_to_collect)
+            logger.debug("Collecting %d %s for dynamic pattern", variable_count, pluralize(variable_count, "variable"))
 
         def on_completion(collected_values: dict[str, str]) -> None:
             """Callback when all variables collected - resolve and inject pattern."""
             try:
-                logger.debug(f"Variables collected successfully: {list(collected_values.keys())}")
+                logger.debug("Variables collected successfully: %s", list(collected_values))
                 resolved_pattern = self.pattern_service.resolve_pattern(pattern, collected_values)
-                logger.debug(f"Pattern resolved successfully, injecting into {panel_type} panel")
+                logger.debug("Pattern resolved successfully, injecting into %s panel", panel_type)
                 self._inject_pattern_in_panel(window, panel_type, resolved_pattern, pattern.name)
             except ValueError as e:
-                logger.error(f"Error resolving pattern '{pattern.name}': {e}")
+                logger.error("Error resolving pattern '%s': %s", pattern.name, e)
                 window.status_message(f"Regex Lab: Error resolving pattern - {e}")
 
         # Start variable collection workflow
@@ -579,47 +799,39 @@ class LoadPatternCommand:
         Returns:
             Pre-filled value for input panel (empty string if no hint)
         """
-        settings = SettingsManager.get_instance()
+        # Date/time variables - use date_format/time_format setting
+        format_setting = _DATETIME_FORMAT_SETTINGS.get(var_name.casefold())
+        if format_setting is None:
+            # No hint for other variables
+            return ""
 
-        # Date variable - use date_format setting
-        if var_name.lower() == "date":
-            date_format = settings.get("date_format", DEFAULT_DATE_FORMAT)
-            return datetime.now().strftime(date_format)
+        return _now_strftime(SettingsManager.get_instance().get(*format_setting))
 
-        # Time variable - use time_format setting
-        if var_name.lower() == "time":
-            time_format = settings.get("time_format", DEFAULT_TIME_FORMAT)
-            return datetime.now().strftime(time_format)
-
-        # No hint for other variables
-        return ""
-
-    def _get_variable_mask(self, var_name: str) -> str | None:
+    def _get_datetime_validator(self, var_name: str) -> tuple[str | None, re.Pattern[str] | None]:
         """
-        Get validation regex mask for variable based on naming convention.
+        Get the strftime format and validation regex for a date/time variable.
+
+        The format is read from settings once and used for both validation
+        stages (regex format check + strptime).
 
         Args:
             var_name: Name of the variable
 
         Returns:
-            Regex pattern for validation (None if no validation)
+            Tuple of (strftime_format, compiled_regex)
+            (None, None) for variables without validation
         """
-        settings = SettingsManager.get_instance()
-
-        # Date variable - convert date_format to regex
-        if var_name.lower() == "date":
-            date_format = settings.get("date_format", DEFAULT_DATE_FORMAT)
-            return self._format_to_regex(date_format)
+        # Date/time variables - convert date_format/time_format to regex
+        format_setting = _DATETIME_FORMAT_SETTINGS.get(var_name.casefold())
+        if format_setting is None:
+            # No validation for other variables
+            return (None, None)
 
-        # Time variable - convert time_format to regex
-        if var_name.lower() == "time":
-            time_format = settings.get("time_format", DEFAULT_TIME_FORMAT)
-            return self._format_to_regex(time_format)
+        strftime_format = SettingsManager.get_instance().get(*format_setting)
+        return (strftime_format, _compile_strftime_regex(strftime_format))
 
-        # No validation for other variables
-        return None
-
-    def _format_to_regex(self, strftime_format: str) -> str:
+    @staticmethod
+    def _format_to_regex(strftime_format: str) -> str:
         """
         Convert strftime format to strict ISO-compliant regex pattern.
 
@@ -639,34 +851,23 @@ class LoadPatternCommand:
         Note:
             V2 will support custom user-defined masks. This enforces ISO 8601 standard.
         """
-        # Map strftime directives to strict ISO regex patterns
-        # These patterns enforce zero-padding and valid ranges
-        replacements = {
-            "%Y": r"[12][0-9]{3}",  # Year: 1000-2999 (ISO 8601)
-            "%y": r"[0-9]{2}",  # 2-digit year: 00-99
-            "%m": r"(0[1-9]|1[0-2])",  # Month: 01-12 (zero-padded)
-            "%d": r"(0[1-9]|[12][0-9]|3[01])",  # Day: 01-31 (zero-padded)
-            "%H": r"([01][0-9]|2[0-3])",  # Hour 24h: 00-23 (zero-padded)
-            "%I": r"(0[1-9]|1[0-2])",  # Hour 12h: 01-12 (zero-padded)
-            "%M": r"[0-5][0-9]",  # Minute: 00-59 (zero-padded)
-            "%S": r"[0-5][0-9]",  # Second: 00-59 (zero-padded)
-            "%f": r"[0-9]{6}",  # Microsecond: 000000-999999
-            "%p": r"(AM|PM)",  # AM/PM indicator
-            "%B": r"\w+",  # Full month name (variable length)
-            "%b": r"\w{3}",  # Abbreviated month (3 chars)
-            "%A": r"\w+",  # Full weekday name (variable length)
-            "%a": r"\w{3}",  # Abbreviated weekday (3 chars)
-        }
-
-        # Escape special regex characters in the format string
-        pattern = re.escape(strftime_format)
-
-        # Replace escaped strftime directives with strict regex patterns
-        for directive, regex_pattern in replacements.items():
-            escaped_directive = re.escape(directive)
-            pattern = pattern.replace(escaped_directive, regex_pattern)
-
-        return pattern
+        # Single left-to-right scan: every directive is exactly "%" + one char,
+        # so expand known directives and escape everything else
+        parts: list[str] = []
+        i = 0
+        length = len(strftime_format)
+        while i < length:
+            char = strftime_format[i]
+            if char == "%" and i + 1 < length:
+                directive_regex = _STRFTIME_DIRECTIVES.get(strftime_format[i : i + 2])
+                if directive_regex is not None:
+                    parts.append(directive_regex)
+                    i += 2
+                    continue
+            parts.append(re.escape(char))
+            i += 1
+
+        return "".join(parts)
 
     def _validate_variable(self, var_name: str, value: str) -> tuple[bool, str]:
         """
@@ -685,55 +886,39 @@ class LoadPatternCommand:
             If valid: (True, "")
             If invalid: (False, "error message")
         """
-        mask = self._get_variable_mask(var_name)
+        strftime_format, mask = self._get_datetime_validator(var_name)
 
         # No mask = no validation (always valid)
-        if mask is None:
+        if strftime_format is None or mask is None:
             return (True, "")
 
         # Empty value is invalid if mask exists
         if not value:
             return (False, f"Value for '{var_name}' cannot be empty")
 
+        is_date = var_name.casefold() == "date"
+
         # STAGE 1: Strict ISO format validation (regex)
         # This enforces zero-padding and valid ranges
-        if not re.fullmatch(mask, value):
+        if not mask.fullmatch(value):
             # Provide specific error message for date/time
-            if var_name.lower() == "date":
+            if is_date:
                 return (
                     False,
                     f"Invalid date format for '{var_name}'. Must use zero-padded ISO format (e.g., 2025-01-09, not 2025-1-9)",
                 )
-            elif var_name.lower() == "time":
-                return (
-                    False,
-                    f"Invalid time format for '{var_name}'. Must use zero-padded ISO format (e.g., 01:05:09, not 1:5:9)",
-                )
-            else:
-                return (False, f"Invalid format for '{var_name}'.")
-
-        settings = SettingsManager.get_instance()
-
-        # STAGE 2: Semantic validation for date variables (after format check)
-        if var_name.lower() == "date":
-            date_format = settings.get("date_format", DEFAULT_DATE_FORMAT)
-            try:
-                datetime.strptime(value, date_format)
-                return (True, "")
-            except ValueError:
-                return (False, f"Invalid date for '{var_name}'. Expected format: {date_format}")
-
-        # STAGE 2: Semantic validation for time variables (after format check)
-        if var_name.lower() == "time":
-            time_format = settings.get("time_format", DEFAULT_TIME_FORMAT)
-            try:
-                datetime.strptime(value, time_format)
-                return (True, "")
-            except ValueError:
-                return (False, f"Invalid time for '{var_name}'. Expected format: {time_format}")
+            return (
+                False,
+                f"Invalid time format for '{var_name}'. Must use zero-padded ISO format (e.g., 01:05:09, not 1:5:9)",
+            )
 
-        # Other variables: only regex validation (already passed above)
-        return (True, "")
+        # STAGE 2: Semantic validation (after format check), same format as stage 1
+        try:
+            datetime.strptime(value, strftime_format)
+            return (True, "")
+        except ValueError:
+            kind = "date" if is_date else "time"
+            return (False, f"Invalid {kind} for '{var_name}'. Expected format: {strftime_format}")
 
     def _inject_pattern_in_panel(
         self,
@@ -783,9 +968,7 @@ class LoadPatternCommand:
             on_done: Callback when user submits value
             on_cancel: Callback when user cancels
         """
-        try:
-            import sublime  # pyright: ignore[reportMissingImports]
-        except ModuleNotFoundError:
+        if _sublime is None:
             # Fallback without popup support
             window.show_input_panel(
                 f"Enter value for '{var_name}':",
@@ -796,7 +979,12 @@ class LoadPatternCommand:
             )
             return
 
-        settings = SettingsManager.get_instance()
+        # Read every setting this prompt needs in one call
+        format_setting = _DATETIME_FORMAT_SETTINGS.get(var_name.casefold())
+        wanted = {"show_input_help_popup": DEFAULT_SHOW_INPUT_HELP_POPUP}
+        if format_setting is not None:
+            wanted[format_setting[0]] = format_setting[1]
+        values = SettingsManager.get_instance().get_many(wanted)
 
         # Determine emoji and format info based on variable name
         # Icons consistent with Quick Panel:
@@ -807,12 +995,9 @@ class LoadPatternCommand:
         format_info = ""
         example = ""
 
-        if var_name.lower() == "date":
-            format_info = settings.get("date_format", DEFAULT_DATE_FORMAT)
-            example = datetime.now().strftime(format_info)
-        elif var_name.lower() == "time":
-            format_info = settings.get("time_format", DEFAULT_TIME_FORMAT)
-            example = datetime.now().strftime(format_info)
+        if format_setting is not None:
+            format_info = values[format_setting[0]]
+            example = _now_strftime(format_info)
 
         # Build enhanced caption with emoji and format hint
         caption = f"{emoji} Enter value for '{var_name}'"
@@ -820,56 +1005,38 @@ class LoadPatternCommand:
             caption += f" (Format: {format_info}, ex: {example})"
         caption += ":"
 
-        # Show popup guidance if enabled
-        if settings.get("show_input_help_popup", DEFAULT_SHOW_INPUT_HELP_POPUP):
-            view = window.active_view()
-            if view:
-                # Build HTML popup content
-                popup_html = f"""
-                <body style="margin: 0; padding: 10px; font-family: system-ui;">
-                    <div style="background: var(--background); color: var(--foreground);">
-                        <h3 style="margin: 0 0 8px 0; color: var(--bluish);">
-                            {emoji} {var_name.title()}
-                        </h3>
-                """
-
-                if format_info:
-                    popup_html += f"""
-                        <p style="margin: 4px 0;">
-                            <b>Format:</b> <code style="background: var(--background); padding: 2px 4px; border-radius: 3px;">{format_info}</code>
-                        </p>
-                        <p style="margin: 4px 0;">
-                            <b>Example:</b> <span style="color: var(--greenish);">{example}</span>
-                        </p>
-                    """
-                else:
-                    popup_html += """
-                        <p style="margin: 4px 0; font-style: italic;">
-                            Enter any value for this variable
-                        </p>
-                    """
-
-                popup_html += """
-                    </div>
-                </body>
-                """
-
-                # Show popup at cursor position
-                view.show_popup(
-                    popup_html,
-                    flags=sublime.HIDE_ON_MOUSE_MOVE_AWAY,
-                    location=-1,  # at cursor
-                    max_width=400,
-                )
+        # Popup disabled: open the input panel straight away, no view lookup needed
+        if not values["show_input_help_popup"]:
+            window.show_input_panel(caption, hint, on_done, None, on_cancel)
+            return
 
-                # Delay input panel slightly so popup appears first
-                sublime.set_timeout(
-                    lambda: window.show_input_panel(caption, hint, on_done, None, on_cancel),
-                    100,
-                )
-            else:
-                # No view, show input panel immediately
-                window.show_input_panel(caption, hint, on_done, None, on_cancel)
-        else:
-            # Popup disabled, show input panel immediately
+        view = window.active_view()
+        if not view:
+            # No view, show input panel immediately
             window.show_input_panel(caption, hint, on_done, None, on_cancel)
+            return
+
+        # Fill the module-level popup template (user-controlled text is HTML-escaped)
+        title = html.escape(var_name.title())
+        if format_info:
+            popup_html = _POPUP_HTML_WITH_FORMAT.format_map(
+                {
+                    "emoji": emoji,
+                    "title": title,
+                    "format_info": html.escape(format_info),
+                    "example": html.escape(example),
+                }
+            )
+        else:
+            popup_html = _POPUP_HTML_NO_FORMAT.format_map({"emoji": emoji, "title": title})
+
+        # Show popup at cursor position
+        view.show_popup(
+            popup_html,
+            flags=_sublime.HIDE_ON_MOUSE_MOVE_AWAY,
+            location=-1,  # at cursor
+            max_width=400,
+        )
+
+        # Open the input panel on the next main-thread tick, once the popup is dispatched
+        _sublime.set_timeout(lambda: window.show_input_panel(caption, hint, on_done, None, on_cancel), 0)
@@ -15,19 +15,104 @@ and loaded into the active session.
 
 from __future__ import annotations
 
-import re
+from dataclasses import dataclass, field
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Callable
 
-from ..core.helpers import format_aligned_summary
-from ..core.logger import get_logger
+from ..core.helpers import SEPARATOR_LINE, format_aligned_summary
+from ..core.logger import LogLevel, get_logger
 from ..core.models import Portfolio
 from ..core.settings_manager import SettingsManager
 from ..services.portfolio_service import PortfolioService
 
+# sublime imported once at module load (None outside Sublime Text)
+try:
+    import sublime as _sublime  # pyright: ignore[reportMissingImports]
+except ImportError:
+    _sublime = None
+
 # Type alias for the on_done callback
 OnDoneCallback = Callable[[str], None]
 
+# User portfolios directory, relative to the Sublime Text Packages directory
+_PORTFOLIOS_REL = Path("User", "RegexLab", "portfolios")
+
+# Rows shown after the summary in the confirmation panel (blank + separator + 2 actions)
+_CONFIRMATION_ACTIONS = ("", SEPARATOR_LINE, "✅ Create Portfolio", "❌ Cancel")
+
+# Characters forbidden in portfolio names (Windows/Unix filesystem restrictions)
+# A plain set test: no regex engine for a fixed handful of characters
+_INVALID_NAME_CHARS = frozenset('<>:"/\\|?*')
+
+# Device names reserved by Windows (compared against the upper-cased name)
+_RESERVED_NAMES = frozenset(
+    {
+        "CON",
+        "PRN",
+        "AUX",
+        "NUL",
+        "COM1",
+        "COM2",
+        "COM3",
+        "COM4",
+        "COM5",
+        "COM6",
+        "COM7",
+        "COM8",
+        "COM9",
+        "LPT1",
+        "LPT2",
+        "LPT3",
+        "LPT4",
+        "LPT5",
+        "LPT6",
+        "LPT7",
+        "LPT8",
+        "LPT9",
+    }
+)
+
+
+def _debug_disabled(message: str, *args: Any) -> None:
+    """Stand-in for logger.debug when debug logging is off."""
+
+
+@lru_cache(maxsize=1)
+def _get_system_username() -> str:
+    """
+    Get the system username, looked up once per session.
+
+    Only the system fallback is cached: 'variables.username' is still read
+    from settings on every wizard run, so settings changes apply immediately.
+
+    Returns:
+        System username (empty string if unavailable)
+    """
+    try:
+        import getpass
+
+        return getpass.getuser()
+    except (KeyError, OSError, ImportError):
+        # KeyError: user not found in pwd database (Unix)
+        # OSError: system errors accessing user info
+        # ImportError: pwd module not available (Windows)
+        return ""
+
+
+@dataclass
+class _WizardState:
+    """Data collected across the New Portfolio wizard steps."""
+
+    name: str = ""
+    description: str = ""
+    author: str = ""
+    tags: list[str] = field(default_factory=list)
+    # Sublime Text Packages directory, resolved once per run (None if unavailable)
+    packages_path: Path | None = None
+    # Existing portfolio names, scanned on the first name attempt
+    existing_names: set[str] | None = None
+
 
 class NewPortfolioWizardCommand:
     """
@@ -46,17 +131,20 @@ class NewPortfolioWizardCommand:
         Initialize the New Portfolio Wizard.
 
         Args:
-            portfolio_service: Optional PortfolioService instance (uses singleton if None)
+            portfolio_service: Optional PortfolioService instance (uses shared instance if None)
             settings_manager: Optional SettingsManager instance (uses singleton if None)
         """
-        self.portfolio_service = portfolio_service or PortfolioService()
+        self.portfolio_service = portfolio_service or PortfolioService.get_instance()
         self.settings_manager = settings_manager or SettingsManager.get_instance()
         self.logger = get_logger()
+        # Debug level resolved once per wizard run: when it is off, debug calls are a no-op
+        # (no log_level settings lookup per call)
+        self._debug = self.logger.debug if self.logger.is_enabled_for(LogLevel.DEBUG) else _debug_disabled
 
         # Wizard state (stores collected data across steps)
-        self.wizard_data: dict[str, Any] = {}
+        self.state = _WizardState()
 
-        self.logger.debug("New Portfolio Wizard: Initialized")
+        self._debug("New Portfolio Wizard: Initialized")
 
     def run(self, window: Any) -> None:
         """
@@ -65,10 +153,20 @@ class NewPortfolioWizardCommand:
         Args:
             window: Sublime Text window instance
         """
-        self.logger.debug("New Portfolio Wizard: Starting wizard")
+        self._debug("New Portfolio Wizard: Starting wizard")
 
         # Reset wizard state
-        self.wizard_data = {}
+        self.state = _WizardState()
+
+        # Resolve the Packages path once for the whole wizard (existence check + save)
+        try:
+            self.state.packages_path = Path(window.extract_variables()["packages"])
+        except (KeyError, ValueError, AttributeError) as e:
+            # KeyError: Missing 'packages' variable from Sublime Text
+            # ValueError: Invalid path format
+            # AttributeError: window.extract_variables() unavailable
+            self.logger.warning("New Portfolio Wizard: Packages path unavailable - %s: %s", type(e).__name__, e)
+            self.state.packages_path = None
 
         # Start with Step 1: Portfolio Name
         self._show_name_input(window)
@@ -84,7 +182,7 @@ class NewPortfolioWizardCommand:
         Args:
             window: Sublime Text window instance
         """
-        self.logger.debug("New Portfolio Wizard: Step 1 - Portfolio Name")
+        self._debug("New Portfolio Wizard: Step 1 - Portfolio Name")
 
         window.show_input_panel(
             "📦 Portfolio Name:",
@@ -103,39 +201,57 @@ class NewPortfolioWizardCommand:
             name: User-provided portfolio name
         """
         name = name.strip()
-        self.logger.debug("New Portfolio Wizard: Step 1 - Name entered: '%s'", name)
+        self._debug("New Portfolio Wizard: Step 1 - Name entered: '%s'", name)
 
         # Validate name
         validation_error = self._validate_portfolio_name(name)
         if validation_error:
-            self.logger.debug("New Portfolio Wizard: Step 1 - Validation failed: %s", validation_error)
+            self._debug("New Portfolio Wizard: Step 1 - Validation failed: %s", validation_error)
             window.status_message(f"Invalid name: {validation_error}")
             # Re-prompt with error message
             self._show_name_input(window)
             return
 
-        # Check if portfolio already exists
+        # Check if portfolio already exists (skipped if the Packages path is unknown)
+        packages_path = self.state.packages_path
         try:
-            packages_path = Path(window.extract_variables()["packages"])
-            if self.portfolio_service.portfolio_exists(name, str(packages_path)):
-                self.logger.debug("New Portfolio Wizard: Step 1 - Portfolio '%s' already exists", name)
+            if packages_path is not None and self._portfolio_name_taken(name, packages_path):
+                self._debug("New Portfolio Wizard: Step 1 - Portfolio '%s' already exists", name)
                 window.status_message(f"Portfolio '{name}' already exists. Choose a different name.")
                 self._show_name_input(window)
                 return
-        except (KeyError, ValueError, AttributeError) as e:
-            # KeyError: Missing 'packages' variable from Sublime Text
-            # ValueError: Invalid path format
-            # AttributeError: window.extract_variables() unavailable
+        except (KeyError, ValueError) as e:
+            # KeyError/ValueError: Unreadable portfolio metadata or invalid path
             self.logger.warning(
                 "New Portfolio Wizard: Failed to check portfolio existence - %s: %s", type(e).__name__, e
             )
             # Continue anyway (non-fatal error)
 
         # Store name and proceed to Step 2
-        self.wizard_data["name"] = name
-        self.logger.debug("New Portfolio Wizard: Step 1 - Name validated, proceeding to Step 2")
+        self.state.name = name
+        self._debug("New Portfolio Wizard: Step 1 - Name validated, proceeding to Step 2")
         self._show_description_input(window)
 
+    def _portfolio_name_taken(self, name: str, packages_path: Path) -> bool:
+        """
+        Check a candidate name against the existing portfolios.
+
+        The existing names are scanned once per wizard run and reused when
+        the user retries with another name.
+
+        Args:
+            name: Candidate portfolio name
+            packages_path: Sublime Text Packages directory
+
+        Returns:
+            True if a portfolio with this name (or file name) already exists
+        """
+        existing = self.state.existing_names
+        if existing is None:
+            existing = self.portfolio_service.get_existing_portfolio_names(str(packages_path))
+            self.state.existing_names = existing
+        return name in existing or name.lower() in existing
+
     def _validate_portfolio_name(self, name: str) -> str | None:
         """
         Validate portfolio name.
@@ -156,39 +272,14 @@ class NewPortfolioWizardCommand:
         if len(name) > 50:
             return "Name too long (max 50 characters)"
 
+        # Check for reserved names (Windows) - single set lookup, before the character scan
+        if name.upper() in _RESERVED_NAMES:
+            return f"Name '{name}' is reserved by the system"
+
         # Check for invalid characters (Windows/Unix filesystem restrictions)
-        invalid_chars = r'[<>:"/\\|?*]'
-        if re.search(invalid_chars, name):
+        if not _INVALID_NAME_CHARS.isdisjoint(name):
             return 'Name contains invalid characters (< > : " / \\ | ? *)'
 
-        # Check for reserved names (Windows)
-        reserved_names = [
-            "CON",
-            "PRN",
-            "AUX",
-            "NUL",
-            "COM1",
-            "COM2",
-            "COM3",
-            "COM4",
-            "COM5",
-            "COM6",
-            "COM7",
-            "COM8",
-            "COM9",
-            "LPT1",
-            "LPT2",
-            "LPT3",
-            "LPT4",
-            "LPT5",
-            "LPT6",
-            "LPT7",
-            "LPT8",
-            "LPT9",
-        ]
-        if name.upper() in reserved_names:
-            return f"Name '{name}' is reserved by the system"
-
         return None
 
     # =========================================================================
@@ -202,7 +293,7 @@ class NewPortfolioWizardCommand:
         Args:
             window: Sublime Text window instance
         """
-        self.logger.debug("New Portfolio Wizard: Step 2 - Description")
+        self._debug("New Portfolio Wizard: Step 2 - Description")
 
         window.show_input_panel(
             "📝 Description (optional):",
@@ -221,11 +312,11 @@ class NewPortfolioWizardCommand:
             description: User-provided description
         """
         description = description.strip()
-        self.logger.debug("New Portfolio Wizard: Step 2 - Description entered: '%s'", description)
+        self._debug("New Portfolio Wizard: Step 2 - Description entered: '%s'", description)
 
         # Store description (can be empty) and proceed to Step 3
-        self.wizard_data["description"] = description
-        self.logger.debug("New Portfolio Wizard: Step 2 - Proceeding to Step 3")
+        self.state.description = description
+        self._debug("New Portfolio Wizard: Step 2 - Proceeding to Step 3")
         self._show_author_input(window)
 
     # =========================================================================
@@ -239,11 +330,11 @@ class NewPortfolioWizardCommand:
         Args:
             window: Sublime Text window instance
         """
-        self.logger.debug("New Portfolio Wizard: Step 3 - Author")
+        self._debug("New Portfolio Wizard: Step 3 - Author")
 
         # Get default author from settings or system username
         default_author = self._get_default_author()
-        self.logger.debug("New Portfolio Wizard: Step 3 - Default author: '%s'", default_author)
+        self._debug("New Portfolio Wizard: Step 3 - Default author: '%s'", default_author)
 
         window.show_input_panel(
             "👤 Author (optional):",
@@ -266,15 +357,7 @@ class NewPortfolioWizardCommand:
             return username
 
         # Fallback to system username
-        try:
-            import getpass
-
-            return getpass.getuser()
-        except (KeyError, OSError, ImportError):
-            # KeyError: user not found in pwd database (Unix)
-            # OSError: system errors accessing user info
-            # ImportError: pwd module not available (Windows)
-            return ""
+        return _get_system_username()
 
     def _on_author_done(self, window: Any, author: str) -> None:
         """
@@ -285,11 +368,11 @@ class NewPortfolioWizardCommand:
             author: User-provided author
         """
         author = author.strip()
-        self.logger.debug("New Portfolio Wizard: Step 3 - Author entered: '%s'", author)
+        self._debug("New Portfolio Wizard: Step 3 - Author entered: '%s'", author)
 
         # Store author (can be empty) and proceed to Step 4
-        self.wizard_data["author"] = author
-        self.logger.debug("New Portfolio Wizard: Step 3 - Proceeding to Step 4")
+        self.state.author = author
+        self._debug("New Portfolio Wizard: Step 3 - Proceeding to Step 4")
         self._show_tags_input(window)
 
     # =========================================================================
@@ -303,7 +386,7 @@ class NewPortfolioWizardCommand:
         Args:
             window: Sublime Text window instance
         """
-        self.logger.debug("New Portfolio Wizard: Step 4 - Tags")
+        self._debug("New Portfolio Wizard: Step 4 - Tags")
 
         window.show_input_panel(
             "🏷️  Tags (optional, comma-separated):",
@@ -321,15 +404,15 @@ class NewPortfolioWizardCommand:
             window: Sublime Text window instance
             tags: User-provided tags (comma-separated)
         """
-        self.logger.debug("New Portfolio Wizard: Step 4 - Tags entered: '%s'", tags)
+        self._debug("New Portfolio Wizard: Step 4 - Tags entered: '%s'", tags)
 
         # Parse tags (split by comma, strip whitespace, filter empty)
-        tag_list = [tag.strip() for tag in tags.split(",") if tag.strip()]
-        self.logger.debug("New Portfolio Wizard: Step 4 - Parsed tags: %s", tag_list)
+        tag_list = [stripped for tag in tags.split(",") if (stripped := tag.strip())]
+        self._debug("New Portfolio Wizard: Step 4 - Parsed tags: %s", tag_list)
 
         # Store tags and proceed to Step 5
-        self.wizard_data["tags"] = tag_list
-        self.logger.debug("New Portfolio Wizard: Step 4 - Proceeding to Step 5")
+        self.state.tags = tag_list
+        self._debug("New Portfolio Wizard: Step 4 - Proceeding to Step 5")
         self._show_confirmation(window)
 
     # =========================================================================
@@ -343,26 +426,24 @@ class NewPortfolioWizardCommand:
         Args:
             window: Sublime Text window instance
         """
-        self.logger.debug("New Portfolio Wizard: Step 5 - Confirmation")
+        self._debug("New Portfolio Wizard: Step 5 - Confirmation")
 
-        try:
-            import sublime  # pyright: ignore[reportMissingImports]
+        if _sublime is None:
+            self.logger.error("New Portfolio Wizard: sublime module not available")
+            return
 
-            # Build summary lines
-            summary_lines = self._build_summary()
-            self.logger.debug("New Portfolio Wizard: Step 5 - Summary built (%s lines)", len(summary_lines))
+        # Build summary lines
+        summary_lines = self._build_summary()
+        self._debug("New Portfolio Wizard: Step 5 - Summary built (%s lines)", len(summary_lines))
 
-            # Show quick panel with summary + action choices
-            items = [*summary_lines, "", "─" * 60, "✅ Create Portfolio", "❌ Cancel"]
+        # Show quick panel with summary + action choices
+        items = [*summary_lines, *_CONFIRMATION_ACTIONS]
 
-            window.show_quick_panel(
-                items,
-                lambda index: self._on_confirmation_done(window, index, len(summary_lines)),
-                sublime.MONOSPACE_FONT,
-            )
-        except ImportError:
-            self.logger.error("New Portfolio Wizard: sublime module not available")
-            return
+        window.show_quick_panel(
+            items,
+            lambda index: self._on_confirmation_done(window, index, len(summary_lines)),
+            _sublime.MONOSPACE_FONT,
+        )
 
     def _build_summary(self) -> list[str]:
         """
@@ -375,20 +456,20 @@ class NewPortfolioWizardCommand:
         summary_items = []
 
         # Name (required)
-        summary_items.append(("Name", self.wizard_data["name"]))
+        summary_items.append(("Name", self.state.name))
 
         # Description (optional)
-        desc = self.wizard_data.get("description", "")
+        desc = self.state.description
         if desc:
             summary_items.append(("Description", desc))
 
         # Author (optional)
-        author = self.wizard_data.get("author", "")
+        author = self.state.author
         if author:
             summary_items.append(("Author", author))
 
         # Tags (optional)
-        tags = self.wizard_data.get("tags", [])
+        tags = self.state.tags
         if tags:
             summary_items.append(("Tags", ", ".join(tags)))
 
@@ -403,7 +484,7 @@ class NewPortfolioWizardCommand:
             index: Selected index in quick panel
             summary_line_count: Number of summary lines (to identify action buttons)
         """
-        self.logger.debug("New Portfolio Wizard: Step 5 - Selection: index=%s", index)
+        self._debug("New Portfolio Wizard: Step 5 - Selection: index=%s", index)
 
         # User cancelled
         if index == -1:
@@ -415,14 +496,18 @@ class NewPortfolioWizardCommand:
         cancel_index = summary_line_count + 3  # "❌ Cancel"
 
         if index == create_index:
-            self.logger.debug("New Portfolio Wizard: Step 5 - User confirmed creation")
-            self._create_portfolio(window)
+            self._debug("New Portfolio Wizard: Step 5 - User confirmed creation")
+            # Disk I/O (mkdir, JSON write, reload) runs on the async worker, not the UI thread
+            if _sublime is not None:
+                _sublime.set_timeout_async(lambda: self._create_portfolio(window), 0)
+            else:
+                self._create_portfolio(window)
         elif index == cancel_index:
-            self.logger.debug("New Portfolio Wizard: Step 5 - User cancelled")
+            self._debug("New Portfolio Wizard: Step 5 - User cancelled")
             self._on_cancel(window)
         else:
             # User clicked on summary line (ignore)
-            self.logger.debug("New Portfolio Wizard: Step 5 - Summary line clicked, ignoring")
+            self._debug("New Portfolio Wizard: Step 5 - Summary line clicked, ignoring")
             self._show_confirmation(window)
 
     # =========================================================================
@@ -433,50 +518,68 @@ class NewPortfolioWizardCommand:
         """
         Create the portfolio with collected data.
 
+        Runs on the async worker thread; status messages are posted back
+        to the main thread.
+
         Args:
             window: Sublime Text window instance
         """
-        name = self.wizard_data["name"]
-        self.logger.debug("New Portfolio Wizard: Creating portfolio '%s'", name)
+        name = self.state.name
+        self._debug("New Portfolio Wizard: Creating portfolio '%s'", name)
 
         try:
             # Create Portfolio object
             portfolio = Portfolio(
                 name=name,
-                description=self.wizard_data.get("description", ""),
-                author=self.wizard_data.get("author", ""),
-                tags=self.wizard_data.get("tags", []),
+                description=self.state.description,
+                author=self.state.author,
+                tags=self.state.tags,
                 patterns=[],  # Empty portfolio
             )
 
             # Save to User/RegexLab/portfolios/
-            packages_path = Path(window.extract_variables()["packages"])
-            portfolios_dir = packages_path / "User" / "RegexLab" / "portfolios"
+            packages_path = self.state.packages_path
+            if packages_path is None:
+                raise ValueError("Sublime Text Packages path is unavailable")
+            portfolios_dir = packages_path / _PORTFOLIOS_REL
             portfolios_dir.mkdir(parents=True, exist_ok=True)
 
             portfolio_path = portfolios_dir / f"{name}.json"
-            self.logger.debug("New Portfolio Wizard: Saving to: %s", portfolio_path)
+            self._debug("New Portfolio Wizard: Saving to: %s", portfolio_path)
 
             self.portfolio_service.save_portfolio(portfolio, str(portfolio_path))
 
             # V2.2.1+ Auto-Discovery: File saved to portfolios/ is automatically loaded
             # No need to update loaded_portfolios setting anymore
-            self.logger.debug("New Portfolio Wizard: Portfolio saved to portfolios/ (auto-discovery enabled)")
+            self._debug("New Portfolio Wizard: Portfolio saved to portfolios/ (auto-discovery enabled)")
 
             # Load into active session immediately
             self.portfolio_service.portfolio_manager.load_portfolio(portfolio_path, set_as_builtin=False, reload=False)
-            self.logger.debug("New Portfolio Wizard: Portfolio loaded into session")
+            self._debug("New Portfolio Wizard: Portfolio loaded into session")
 
             # Success message
-            window.status_message(f"Portfolio '{name}' created and loaded successfully!")
-            self.logger.debug("New Portfolio Wizard: Creation complete")
+            self._post_status(window, f"Portfolio '{name}' created and loaded successfully!")
+            self._debug("New Portfolio Wizard: Creation complete")
 
         except (OSError, ValueError) as e:
             # OSError: File I/O errors (disk full, permissions, directory creation)
             # ValueError: Invalid portfolio data or configuration
             error_msg = f"Failed to create portfolio: {e}"
             self.logger.error("New Portfolio Wizard: %s - %s: %s", error_msg, type(e).__name__, e)
-            window.status_message(error_msg)
+            self._post_status(window, error_msg)
+
+    def _post_status(self, window: Any, message: str) -> None:
+        """
+        Show a status message from the main thread.
+
+        Args:
+            window: Sublime Text window instance
+            message: Status bar message
+        """
+        if _sublime is not None:
+            _sublime.set_timeout(lambda: window.status_message(message), 0)
+        else:
+            window.status_message(message)
 
     # =========================================================================
     # Cancellation
@@ -489,6 +592,6 @@ class NewPortfolioWizardCommand:
         Args:
             window: Sublime Text window instance
         """
-        self.logger.debug("New Portfolio Wizard: Cancelled")
+        self._debug("New Portfolio Wizard: Cancelled")
         window.status_message("Portfolio creation cancelled")
-        self.wizard_data = {}  # Clear state
+        self.state = _WizardState()  # Clear state
@@ -11,6 +11,7 @@ Extensible architecture to facilitate adding new features.
 
 from __future__ import annotations
 
+from functools import lru_cache
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
@@ -18,7 +19,6 @@ from ..core.constants import (
     DEFAULT_EXPORT_DIRECTORY,
     DEFAULT_QUICK_PANEL_WIDTH,
     ICON_ADD,
-    ICON_AVAILABLE,
     ICON_BACK,
     ICON_BROWSE,
     ICON_BUILTIN_BOOK,
@@ -44,6 +44,7 @@ from ..core.constants import (
     ICON_SUCCESS,
 )
 from ..core.helpers import (
+    SEPARATOR_LINE,
     find_portfolio_file_by_name,
     format_aligned_summary,
     format_centered_separator,
@@ -52,7 +53,7 @@ from ..core.helpers import (
     normalize_portfolio_name,
     pluralize,
 )
-from ..core.logger import get_logger
+from ..core.logger import LogLevel, get_logger
 from ..core.models import PatternType
 from ..core.settings_manager import SettingsManager
 from ..services.pattern_service import PatternService
@@ -69,6 +70,104 @@ if TYPE_CHECKING:
 
 logger = get_logger()
 
+# sublime imported once at module load (None outside Sublime Text)
+try:
+    import sublime as _sublime  # pyright: ignore[reportMissingImports]
+except ImportError:
+    _sublime = None
+
+_MONOSPACE_FONT = getattr(_sublime, "MONOSPACE_FONT", 0)
+
+
+def _packages_path() -> str:
+    """
+    Return Sublime Text's Packages directory.
+
+    Returns:
+        Packages path (default Linux location outside Sublime Text, for tests)
+    """
+    if _sublime is not None:
+        return _sublime.packages_path()
+    return str(Path.home() / ".config" / "sublime-text" / "Packages")
+
+
+# Icon shown in front of each hub action (ICON_DEFAULT for the others)
+_ACTION_ICON_MAP = {
+    "New Portfolio": ICON_ADD,
+    "Import Portfolio": ICON_IMPORT,
+    "Export Portfolio": ICON_EXPORT,
+    "Reload Portfolios": ICON_RELOAD,
+    "Settings": ICON_SETTINGS,
+}
+
+# Hub actions section: (name, label, description, action)
+_HUB_ACTIONS = (
+    ("New Portfolio", "Create New", "Create a new empty portfolio with the interactive wizard", "new_portfolio"),
+    ("Import Portfolio", "Load File", "Import an external portfolio .json file", "import_portfolio"),
+    (
+        "Reload Portfolios",
+        "Refresh All",
+        "Reload all portfolios from disk (refresh external changes)",
+        "reload_portfolios",
+    ),
+    ("Settings", "Configure", "Open RegexLab settings (loaded_portfolios, etc.)", "open_settings"),
+    ("About", "Version Info", "Show RegexLab version and installation guide", "about"),
+)
+
+
+@lru_cache(maxsize=8)
+def _build_action_section(panel_width: int) -> tuple[tuple[list[str], ...], tuple[dict[str, Any], ...]]:
+    """
+    Build the Actions section of the hub (separator + fixed actions).
+
+    Only depends on the panel width, so it is cached per width; callers must
+    extend their own lists and never mutate the returned rows.
+
+    Args:
+        panel_width: Total width for Quick Panel (from settings)
+
+    Returns:
+        Tuple of (items, action_map) for the Actions section
+    """
+    items: list[list[str]] = [
+        [format_centered_separator(f"{ICON_SECTION_ACTIONS} Actions", panel_width), "Portfolio management operations"]
+    ]
+    action_map: list[dict[str, Any]] = [{"type": "separator"}]
+
+    for name, label, description, action in _HUB_ACTIONS:
+        icon = _ACTION_ICON_MAP.get(name, ICON_DEFAULT)
+        items.append([format_quick_panel_line(name, label, panel_width, left_icon=icon), description])
+        action_map.append({"type": "action", "action": action})
+
+    return tuple(items), tuple(action_map)
+
+
+# Right-hand type labels of hub portfolio rows:
+#   Portfolio Name                                             🔒 Built-in
+#   Portfolio Name                                             🔒 Custom / 📝 Custom (by readonly)
+#   Portfolio Name                                             🚫 Disabled
+_BUILTIN_TYPE_LABEL = f"{ICON_READONLY} Built-in"
+_CUSTOM_TYPE_LABELS = (f"{ICON_EDITABLE} Custom", f"{ICON_READONLY} Custom")
+_DISABLED_TYPE_LABEL = f"{ICON_DISABLED} Disabled"
+
+# Description suffixes of hub rows, indexed by portfolio.readonly for loaded portfolios
+_READONLY_SUFFIXES = (" • Readonly: False", " • Readonly: True")
+_DISABLED_SUFFIX = " • Click to enable"
+
+
+@lru_cache(maxsize=128)
+def _pattern_count_label(count: int) -> str:
+    """
+    Format a pattern count with its pluralized noun (e.g. "1 pattern", "3 patterns").
+
+    Args:
+        count: Number of patterns
+
+    Returns:
+        Count label string
+    """
+    return f"{count} {pluralize(count, 'pattern')}"
+
 
 class PortfolioManagerCommand:
     """
@@ -96,10 +195,15 @@ class PortfolioManagerCommand:
             settings_manager: Optional SettingsManager instance (for testing)
             pattern_service: Optional PatternService instance (for testing)
         """
-        self.portfolio_service = portfolio_service or PortfolioService()
+        self.portfolio_service = portfolio_service or PortfolioService.get_instance()
         self.settings_manager = settings_manager or SettingsManager.get_instance()
         self.pattern_service = pattern_service or PatternService()
         self.logger = get_logger()
+        # Quick Panel width read once per command instance (a fresh instance is
+        # created each time the hub is opened, so setting changes apply on next open)
+        self._panel_width: int = self.settings_manager.get("quick_panel_width", DEFAULT_QUICK_PANEL_WIDTH)
+        # Built-in flag per portfolio name, reset on every hub display and on reload
+        self._builtin_cache: dict[str, bool] = {}
 
     def run(self, window: sublime.Window) -> None:
         """
@@ -108,11 +212,18 @@ class PortfolioManagerCommand:
         Args:
             window: Sublime Text window instance
         """
-        self.logger.debug("Portfolio Manager: Command invoked")
+        # Each logger call re-reads the log level; check it once for the whole hub build
+        debug_enabled = self.logger.is_enabled_for(LogLevel.DEBUG)
+
+        # Quick Panel width resolved in __init__ (reused when navigating back to the hub)
+        panel_width = self._panel_width
 
-        # Get Quick Panel width from settings
-        panel_width = self.settings_manager.get("quick_panel_width", DEFAULT_QUICK_PANEL_WIDTH)
-        self.logger.debug("Portfolio Manager: Quick Panel width = %s", panel_width)
+        # Portfolios may have been loaded/unloaded since the last display
+        self._builtin_cache.clear()
+
+        if debug_enabled:
+            self.logger.debug("Portfolio Manager: Command invoked")
+            self.logger.debug("Portfolio Manager: Quick Panel width = %s", panel_width)
 
         # Build Quick Panel items (3 sections)
         items: list[list[str]] = []
@@ -120,120 +231,103 @@ class PortfolioManagerCommand:
 
         # === SECTION 1: Loaded Portfolios ===
         loaded_portfolios = self.portfolio_service.get_all_portfolios()
-        self.logger.debug("Portfolio Manager: Found %s loaded portfolios", len(loaded_portfolios))
+        if debug_enabled:
+            self.logger.debug("Portfolio Manager: Found %s loaded portfolios", len(loaded_portfolios))
 
         if loaded_portfolios:
             # Section separator
-            separator = self._format_separator(f"{ICON_SECTION_LOADED} Loaded Portfolios", panel_width)
+            separator = format_centered_separator(f"{ICON_SECTION_LOADED} Loaded Portfolios", panel_width)
             count = len(loaded_portfolios)
             items.append([separator, f"{count} {pluralize(count, 'portfolio')} loaded"])
             action_map.append({"type": "separator"})
 
             # Portfolios already sorted by get_all_portfolios() (builtin first, alphabetical)
             # No need to re-sort here
-            self.logger.debug("Portfolio Manager: Using pre-sorted portfolios from get_all_portfolios()")
-
-            # Add each loaded portfolio
-            for portfolio in loaded_portfolios:
-                is_builtin = self._is_builtin_portfolio(portfolio.name)
-                formatted_line = self._format_portfolio_line(
-                    portfolio, panel_width, is_loaded=True, is_builtin=is_builtin
-                )
-                pattern_count = len(portfolio.patterns)
-                description = f"{pattern_count} {pluralize(pattern_count, 'pattern')} • Readonly: {portfolio.readonly}"
-
+            if debug_enabled:
+                self.logger.debug("Portfolio Manager: Using pre-sorted portfolios from get_all_portfolios()")
                 self.logger.debug(
-                    "Portfolio Manager: Adding loaded portfolio '%s' (%s patterns, readonly=%s)",
-                    portfolio.name,
-                    pattern_count,
-                    portfolio.readonly,
+                    "Portfolio Manager: Adding loaded portfolios: %s", ", ".join(p.name for p in loaded_portfolios)
                 )
 
-                items.append([formatted_line, description])
-                action_map.append(
-                    {
-                        "type": "loaded_portfolio",
-                        "portfolio": portfolio,
-                        "name": portfolio.name,
-                    }
-                )
-        else:
+            # Type label follows the ACTUAL location (builtin), then the readonly flag for custom ones
+            items.extend(
+                [
+                    [
+                        format_quick_panel_line(
+                            portfolio.name,
+                            _BUILTIN_TYPE_LABEL
+                            if self._is_builtin_portfolio(portfolio.name)
+                            else _CUSTOM_TYPE_LABELS[bool(portfolio.readonly)],
+                            panel_width,
+                        ),
+                        _pattern_count_label(len(portfolio.patterns)) + _READONLY_SUFFIXES[bool(portfolio.readonly)],
+                    ]
+                    for portfolio in loaded_portfolios
+                ]
+            )
+            action_map.extend(
+                [
+                    {"type": "loaded_portfolio", "portfolio": portfolio, "name": portfolio.name}
+                    for portfolio in loaded_portfolios
+                ]
+            )
+        elif debug_enabled:
             self.logger.debug("Portfolio Manager: No loaded portfolios found")
 
         # === SECTION 2: Disabled Portfolios ===
-        try:
-            import sublime  # pyright: ignore[reportMissingImports]
-
-            packages_path = sublime.packages_path()
-        except (ImportError, AttributeError):
-            # Fallback for tests
-            packages_path = str(Path.home() / ".config" / "sublime-text" / "Packages")
+        packages_path = _packages_path()
 
         disabled_portfolios = self.portfolio_service.get_disabled_portfolios(packages_path)
-        self.logger.debug("Portfolio Manager: Found %s disabled portfolios", len(disabled_portfolios))
+        if debug_enabled:
+            self.logger.debug("Portfolio Manager: Found %s disabled portfolios", len(disabled_portfolios))
 
         # Only show section if there are disabled portfolios
         if disabled_portfolios:
             # Section separator
-            separator = self._format_separator(f"{ICON_SECTION_DISABLED} Disabled Portfolios", panel_width)
+            separator = format_centered_separator(f"{ICON_SECTION_DISABLED} Disabled Portfolios", panel_width)
             count = len(disabled_portfolios)
             items.append([separator, f"{count} {pluralize(count, 'portfolio')} disabled"])
             action_map.append({"type": "separator"})
 
-            # Add each disabled portfolio
-            for filepath, metadata in disabled_portfolios:
-                name = metadata.get("name", Path(filepath).stem)
-                pattern_count = metadata.get("pattern_count", 0)
-                formatted_line = self._format_disabled_portfolio_line(name, panel_width)
-                description = f"{pattern_count} {pluralize(pattern_count, 'pattern')} • Click to enable"
-
+            # Resolve display names once, then build each column with a comprehension
+            disabled_entries = [
+                (filepath, metadata.get("name", Path(filepath).stem), metadata)
+                for filepath, metadata in disabled_portfolios
+            ]
+            if debug_enabled:
                 self.logger.debug(
-                    "Portfolio Manager: Adding disabled portfolio '%s' from %s (%s patterns)",
-                    name,
-                    Path(filepath).name,
-                    pattern_count,
+                    "Portfolio Manager: Adding disabled portfolios: %s",
+                    ", ".join(name for _, name, _ in disabled_entries),
                 )
 
-                items.append([formatted_line, description])
-                # Fix closure bug: capture loop variables by value using default parameters
-                action_map.append(self._make_disabled_portfolio_action(filepath, name, metadata))
-        else:
+            items.extend(
+                [
+                    [
+                        format_quick_panel_line(name, _DISABLED_TYPE_LABEL, panel_width),
+                        _pattern_count_label(metadata.get("pattern_count", 0)) + _DISABLED_SUFFIX,
+                    ]
+                    for _, name, metadata in disabled_entries
+                ]
+            )
+            # Fix closure bug: capture loop variables by value using default parameters
+            action_map.extend(
+                [
+                    self._make_disabled_portfolio_action(filepath, name, metadata)
+                    for filepath, name, metadata in disabled_entries
+                ]
+            )
+        elif debug_enabled:
             self.logger.debug("Portfolio Manager: No available portfolios found")
 
         # === SECTION 3: Actions ===
-        separator = self._format_separator(f"{ICON_SECTION_ACTIONS} Actions", panel_width)
-        items.append([separator, "Portfolio management operations"])
-        action_map.append({"type": "separator"})
-
-        self.logger.debug("Portfolio Manager: Adding %s action items", 5)
-
-        # Action: New Portfolio
-        new_portfolio_line = self._format_action_line("New Portfolio", "Create New", panel_width)
-        items.append([new_portfolio_line, "Create a new empty portfolio with the interactive wizard"])
-        action_map.append({"type": "action", "action": "new_portfolio"})
-
-        # Action: Import Portfolio
-        import_line = self._format_action_line("Import Portfolio", "Load File", panel_width)
-        items.append([import_line, "Import an external portfolio .json file"])
-        action_map.append({"type": "action", "action": "import_portfolio"})
-
-        # Action: Reload Portfolios
-        reload_line = self._format_action_line("Reload Portfolios", "Refresh All", panel_width)
-        items.append([reload_line, "Reload all portfolios from disk (refresh external changes)"])
-        action_map.append({"type": "action", "action": "reload_portfolios"})
-
-        # Action: Open Settings
-        settings_line = self._format_action_line("Settings", "Configure", panel_width)
-        items.append([settings_line, "Open RegexLab settings (loaded_portfolios, etc.)"])
-        action_map.append({"type": "action", "action": "open_settings"})
-
-        # Action: About
-        about_line = self._format_action_line("About", "Version Info", panel_width)
-        items.append([about_line, "Show RegexLab version and installation guide"])
-        action_map.append({"type": "action", "action": "about"})
+        action_items, action_entries = _build_action_section(panel_width)
+        items.extend(action_items)
+        action_map.extend(action_entries)
 
         # Show Quick Panel
-        self.logger.debug("Portfolio Manager: Displaying Quick Panel with %s items", len(items))
+        if debug_enabled:
+            self.logger.debug("Portfolio Manager: Adding %s action items", len(_HUB_ACTIONS))
+            self.logger.debug("Portfolio Manager: Displaying Quick Panel with %s items", len(items))
 
         def on_select(index: int) -> None:
             if index == -1:
@@ -248,91 +342,9 @@ class PortfolioManagerCommand:
             # Route to appropriate handler
             self._handle_selection(window, action)
 
-        try:
-            import sublime  # pyright: ignore[reportMissingImports]
-
-            window.show_quick_panel(items, on_select, flags=sublime.MONOSPACE_FONT)
-            self.logger.debug("Portfolio Manager: Quick Panel shown with MONOSPACE_FONT flag")
-        except (ImportError, AttributeError):
-            # Fallback for tests
-            window.show_quick_panel(items, on_select)
-            self.logger.debug("Portfolio Manager: Quick Panel shown (test mode - no flags)")
-
-    def _format_separator(self, label: str, panel_width: int) -> str:
-        """
-        Format a centered separator line.
-
-        Delegates to helpers.format_centered_separator() for consistency.
-
-        Args:
-            label: Label text for the separator
-            panel_width: Total width for Quick Panel (from settings)
-
-        Returns:
-            Centered separator string
-        """
-        return format_centered_separator(label, panel_width)
-
-    def _format_portfolio_line(
-        self, portfolio: Portfolio, panel_width: int, is_loaded: bool = False, is_builtin: bool = False
-    ) -> str:
-        """
-        Format a portfolio line with aligned columns.
-
-        Format for loaded portfolios:
-        Portfolio Name                                             🔒 Built-in
-        Portfolio Name                                             🔒 Custom
-        Portfolio Name                                             📝 Custom
-
-        Args:
-            portfolio: Portfolio to format
-            panel_width: Total width for Quick Panel (from settings)
-            is_loaded: Whether this portfolio is currently loaded
-            is_builtin: Whether this portfolio is builtin (from data/portfolios/)
-
-        Returns:
-            Formatted line string
-        """
-        # Determine icon and type label based on state
-        if is_loaded:
-            # Determine label based on ACTUAL location (is_builtin), not readonly flag
-            if is_builtin:
-                icon = ICON_READONLY
-                type_label = "Built-in"
-            elif portfolio.readonly:
-                # Custom portfolio with readonly=true
-                icon = ICON_READONLY
-                type_label = "Custom"
-            else:
-                # Custom portfolio with readonly=false
-                icon = ICON_EDITABLE
-                type_label = "Custom"
-        else:
-            icon = ICON_AVAILABLE
-            type_label = "Available"
-
-        # Build right text: Icon Type
-        right_text = f"{icon} {type_label}"
-
-        # Delegate to unified formatter
-        return format_quick_panel_line(portfolio.name, right_text, panel_width)
-
-    def _format_disabled_portfolio_line(self, name: str, panel_width: int) -> str:
-        """
-        Format a disabled (not loaded) portfolio line.
-
-        Format:
-        Portfolio Name                                             🚫 Disabled
-
-        Args:
-            name: Portfolio name
-            panel_width: Total width for Quick Panel
-
-        Returns:
-            Formatted line string
-        """
-        # Delegate to unified formatter
-        return format_quick_panel_line(name, f"{ICON_DISABLED} Disabled", panel_width)
+        window.show_quick_panel(items, on_select, flags=_MONOSPACE_FONT)
+        if debug_enabled:
+            self.logger.debug("Portfolio Manager: Quick Panel shown (flags=%s)", _MONOSPACE_FONT)
 
     def _make_disabled_portfolio_action(self, filepath: str, name: str, metadata: dict[str, Any]) -> dict[str, Any]:
         """
@@ -359,39 +371,6 @@ class PortfolioManagerCommand:
             "metadata": metadata,
         }
 
-    def _format_action_line(self, action_name: str, action_label: str, panel_width: int) -> str:
-        """
-        Format an action line with aligned columns.
-
-        Format:
-        🔧 Action Name                                             Action Label
-
-        Icons are selected based on action name:
-        - New Portfolio: ➕
-        - Reload: 🔄
-        - Settings: ⚙️
-
-        Args:
-            action_name: Name of the action (e.g., "New Portfolio")
-            action_label: Short label for the action (e.g., "Create New")
-            panel_width: Total width for Quick Panel (from settings)
-
-        Returns:
-            Formatted line string
-        """  # noqa: RUF002
-        # Select icon based on action name
-        icon_map = {
-            "New Portfolio": ICON_ADD,
-            "Import Portfolio": ICON_IMPORT,
-            "Export Portfolio": ICON_EXPORT,
-            "Reload Portfolios": ICON_RELOAD,
-            "Settings": ICON_SETTINGS,
-        }
-        icon = icon_map.get(action_name, ICON_DEFAULT)
-
-        # Delegate to unified formatter (icon as left_icon)
-        return format_quick_panel_line(action_name, action_label, panel_width, left_icon=icon)
-
     def _handle_selection(self, window: sublime.Window, action: dict[str, Any]) -> None:
         """
         Route selection to appropriate handler based on action type.
@@ -491,17 +470,15 @@ class PortfolioManagerCommand:
             # CUSTOM PORTFOLIO actions only
 
             if not is_readonly:
-                # 2. Add Pattern (editable custom only)
-                items.append([f"{ICON_ADD} Add Pattern", "Create a new pattern in this portfolio"])
-                action_map.append("add_pattern")
-
-                # 3. Edit Pattern (editable custom only)
-                items.append([f"{ICON_EDIT} Edit Pattern", "Modify an existing pattern"])
-                action_map.append("edit_pattern")
-
-                # 4. Delete Pattern (editable custom only)
-                items.append([f"{ICON_DELETE} Delete Pattern", "Remove a pattern from this portfolio"])
-                action_map.append("delete_pattern")
+                # 2-4. Add / Edit / Delete Pattern (editable custom only)
+                items.extend(
+                    (
+                        [f"{ICON_ADD} Add Pattern", "Create a new pattern in this portfolio"],
+                        [f"{ICON_EDIT} Edit Pattern", "Modify an existing pattern"],
+                        [f"{ICON_DELETE} Delete Pattern", "Remove a pattern from this portfolio"],
+                    )
+                )
+                action_map.extend(("add_pattern", "edit_pattern", "delete_pattern"))
 
             # 5. Export Portfolio (custom)
             items.append([f"{ICON_EXPORT} Export Portfolio", "Copy portfolio to external location"])
@@ -572,12 +549,7 @@ class PortfolioManagerCommand:
             elif selected_action == "delete_portfolio":
                 self._delete_portfolio(window, portfolio.name, portfolio.readonly)
 
-        try:
-            import sublime  # pyright: ignore[reportMissingImports]
-
-            window.show_quick_panel(items, on_select, flags=sublime.MONOSPACE_FONT)
-        except (ImportError, AttributeError):
-            window.show_quick_panel(items, on_select)
+        window.show_quick_panel(items, on_select, flags=_MONOSPACE_FONT)
 
     def _handle_disabled_portfolio(self, window: sublime.Window, action: dict[str, Any]) -> None:
         """
@@ -684,12 +656,7 @@ class PortfolioManagerCommand:
                 is_readonly = metadata.get("readonly", False)
                 self._delete_portfolio(window, name, is_readonly, filepath)
 
-        try:
-            import sublime  # pyright: ignore[reportMissingImports]
-
-            window.show_quick_panel(items, on_select, flags=sublime.MONOSPACE_FONT)
-        except (ImportError, AttributeError):
-            window.show_quick_panel(items, on_select)
+        window.show_quick_panel(items, on_select, flags=_MONOSPACE_FONT)
 
     def _enable_portfolio(self, window: sublime.Window, filepath: str, name: str) -> None:
         """
@@ -850,7 +817,7 @@ class PortfolioManagerCommand:
         portfolio.updated = datetime.now().strftime("%Y-%m-%d")
 
         # Get portfolio path
-        portfolio_path = self.portfolio_service.portfolio_manager._portfolio_paths.get(portfolio.name)
+        portfolio_path = self.portfolio_service.get_portfolio_path(portfolio.name)
 
         if not portfolio_path:
             window.status_message(f"RegexLab: Portfolio path not found for '{portfolio.name}'")
@@ -942,7 +909,7 @@ class PortfolioManagerCommand:
             "⚠️ This action cannot be undone.",
             "⚠️ All patterns in this portfolio will be permanently lost.",
             "",
-            "─" * 60,
+            SEPARATOR_LINE,
             f"{ICON_DELETE} Delete this portfolio",
             f"{ICON_BACK} Cancel",
         ]
@@ -972,12 +939,7 @@ class PortfolioManagerCommand:
 
         self.logger.debug("Showing delete confirmation panel for portfolio '%s'", portfolio_name)
 
-        try:
-            import sublime  # pyright: ignore[reportMissingImports]
-
-            window.show_quick_panel(items, on_select, flags=sublime.MONOSPACE_FONT)
-        except (ImportError, AttributeError):
-            window.show_quick_panel(items, on_select)
+        window.show_quick_panel(items, on_select, flags=_MONOSPACE_FONT)
 
     def _execute_delete(self, window: sublime.Window, portfolio_name: str, filepath: str | None) -> None:
         """
@@ -1284,7 +1246,7 @@ class PortfolioManagerCommand:
 
             # Pattern count
             pattern_count = len(portfolio.patterns)
-            patterns_label = f"{pattern_count} {pluralize(pattern_count, 'pattern')}"
+            patterns_label = _pattern_count_label(pattern_count)
 
             items.append([f"{icon} {portfolio.name}{type_label}", patterns_label])
             portfolio_map.append(portfolio)
@@ -1386,6 +1348,7 @@ class PortfolioManagerCommand:
             window: Sublime Text window instance
         """
         self.logger.debug("Portfolio Manager: Executing 'Reload Portfolios' action")
+        self._builtin_cache.clear()
 
         try:
             # Use the global reload command for consistency
@@ -1651,12 +1614,7 @@ class PortfolioManagerCommand:
             # For disabled: block all actions (preview mode only)
             self._show_pattern_actions(window, portfolio, selected_pattern, pattern_map, is_readonly, is_builtin)
 
-        try:
-            import sublime  # pyright: ignore[reportMissingImports]
-
-            window.show_quick_panel(items, on_select, flags=sublime.MONOSPACE_FONT)
-        except (ImportError, AttributeError):
-            window.show_quick_panel(items, on_select)
+        window.show_quick_panel(items, on_select, flags=_MONOSPACE_FONT)
 
     def _show_pattern_actions(
         self,
@@ -1717,12 +1675,7 @@ class PortfolioManagerCommand:
                 # Only action is Back
                 self._browse_patterns(window, portfolio, is_readonly=True, is_builtin=False)
 
-            try:
-                import sublime  # pyright: ignore[reportMissingImports]
-
-                window.show_quick_panel(items, on_select_disabled, flags=sublime.MONOSPACE_FONT)
-            except (ImportError, AttributeError):
-                window.show_quick_panel(items, on_select_disabled)
+            window.show_quick_panel(items, on_select_disabled, flags=_MONOSPACE_FONT)
             return
 
         # BUILTIN or EDITABLE CUSTOM portfolios: Show injection actions
@@ -1782,12 +1735,7 @@ class PortfolioManagerCommand:
             elif selected_action == "back":
                 self._browse_patterns(window, portfolio, is_readonly, is_builtin)
 
-        try:
-            import sublime  # pyright: ignore[reportMissingImports]
-
-            window.show_quick_panel(items, on_select, flags=sublime.MONOSPACE_FONT)
-        except (ImportError, AttributeError):
-            window.show_quick_panel(items, on_select)
+        window.show_quick_panel(items, on_select, flags=_MONOSPACE_FONT)
 
     def _is_builtin_portfolio(self, portfolio_name: str) -> bool:
         """
@@ -1801,9 +1749,15 @@ class PortfolioManagerCommand:
         Returns:
             True if builtin, False if custom
         """
+        # The hub list and the context menu ask for the same names within one display
+        cached = self._builtin_cache.get(portfolio_name)
+        if cached is not None:
+            return cached
+
         # Use portfolio_paths from PortfolioManager (no file I/O needed)
-        portfolio_path = self.portfolio_service.portfolio_manager._portfolio_paths.get(portfolio_name)
+        portfolio_path = self.portfolio_service.get_portfolio_path(portfolio_name)
         is_builtin = is_builtin_portfolio_path(portfolio_path)
+        self._builtin_cache[portfolio_name] = is_builtin
 
         if is_builtin:
             self.logger.debug("Portfolio '%s' is builtin", portfolio_name)
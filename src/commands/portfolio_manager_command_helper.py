@@ -12,6 +12,7 @@ from __future__ import annotations
 
 import re
 from datetime import datetime
+from functools import lru_cache
 from typing import TYPE_CHECKING, Any, Callable
 
 from ..core.constants import (
@@ -35,6 +36,23 @@ if TYPE_CHECKING:
     from ..core.models import Pattern
 
 
+@lru_cache(maxsize=64)
+def _compile_assertion(assertion_pattern: str) -> re.Pattern[str]:
+    """
+    Compile a variables_assertion regex once and reuse it for every input check.
+
+    Args:
+        assertion_pattern: Regex from the 'variables_assertion' settings
+
+    Returns:
+        Compiled regex
+
+    Raises:
+        re.error: If the regex is invalid (not cached, raised again on next call)
+    """
+    return re.compile(assertion_pattern)
+
+
 def inject_pattern_in_panel(
     window: sublime.Window,
     panel_type: str,
@@ -398,7 +416,7 @@ def collect_variables_for_pattern(
         # Validate input if assertion exists
         if assertion_pattern:
             try:
-                if not re.fullmatch(assertion_pattern, value):
+                if not _compile_assertion(assertion_pattern).fullmatch(value):
                     # Validation failed → show error and retry
                     # Use hint if available, otherwise show regex pattern
                     expected_format = hint if hint else f"regex: {assertion_pattern}"
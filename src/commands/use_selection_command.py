@@ -56,7 +56,7 @@ class RegexLabUseSelectionCommand:
             portfolio_service: Optional PortfolioService instance (for testing)
         """
         self.pattern_service = pattern_service or PatternService()
-        self.portfolio_service = portfolio_service or PortfolioService()
+        self.portfolio_service = portfolio_service or PortfolioService.get_instance()
         self.logger = get_logger()
 
     def run(self, window: sublime.Window) -> None:
@@ -276,7 +276,7 @@ class RegexLabUseSelectionCommand:
             self.logger.debug("Use Selection: Pattern added to portfolio (total patterns: %s)", len(portfolio.patterns))
 
             # Save portfolio to disk
-            portfolio_path = self.portfolio_service.portfolio_manager._portfolio_paths.get(portfolio.name)
+            portfolio_path = self.portfolio_service.get_portfolio_path(portfolio.name)
             if not portfolio_path:
                 raise ValueError(f"Portfolio path not found for '{portfolio.name}'")
 
@@ -37,6 +37,10 @@ DEFAULT_SHOW_PATTERN_TYPE_ICONS: bool = True
 # Show descriptions in Quick Panel (default: True)
 DEFAULT_QUICK_PANEL_SHOW_DESCRIPTIONS: bool = True
 
+# Maximum rows per Load Pattern Quick Panel page (0 = no limit)
+# Longer lists end with a "Show more" row that opens the next page
+DEFAULT_QUICK_PANEL_MAX_ITEMS: int = 500
+
 # Show helpful popup when entering variable values (default: False)
 DEFAULT_SHOW_INPUT_HELP_POPUP: bool = False
 
@@ -198,6 +202,10 @@ INTEGRITY_SALT_FILENAME: str = "salt.key"
 # Keystore file name for encrypted portfolio data
 INTEGRITY_KEYSTORE_FILENAME: str = "keystore.bin"
 
+# Always run the full builtin integrity check on startup/reload, even when
+# nothing changed since the last successful verification (default: False)
+DEFAULT_FORCE_INTEGRITY_CHECK: bool = False
+
 # KDF iteration count (for password-based key derivation)
 # Higher = more secure but slower
 KDF_ITERATIONS: int = 100_000
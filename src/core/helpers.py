@@ -14,6 +14,9 @@ from typing import TYPE_CHECKING, Any
 if TYPE_CHECKING:
     from collections.abc import Callable
 
+# Separator between a summary and its actions in confirmation Quick Panels
+SEPARATOR_LINE = "─" * 60
+
 
 def is_builtin_portfolio_path(portfolio_path: str | Path | None) -> bool:
     """
@@ -233,18 +236,35 @@ def format_aligned_summary(title: str, items: list[tuple[str, str]]) -> list[str
                  Name : Test
           Description : A test pattern
     """
-    lines = [f"{title}:", ""]
-
     if not items:
-        return lines
+        return [f"{title}:", ""]
 
     # Find longest label for alignment
     max_label_length = max(len(label) for label, _ in items)
 
+    return format_aligned_summary_fixed(title, items, max_label_length)
+
+
+def format_aligned_summary_fixed(title: str, items: list[tuple[str, str]], label_width: int) -> list[str]:
+    """
+    Format summary like format_aligned_summary, with a known label width.
+
+    Use it when the labels are fixed in code, so their width does not have
+    to be measured on every render.
+
+    Args:
+        title: Summary title
+        items: List of (label, value) tuples to display
+        label_width: Width labels are right-aligned to (longest label length)
+
+    Returns:
+        List of formatted lines ready for display in Quick Panel
+    """
+    lines = [f"{title}:", ""]
+
     # Format lines with right-aligned labels
     for label, value in items:
-        padded_label = label.rjust(max_label_length)
-        lines.append(f"  {padded_label} : {value}")
+        lines.append(f"  {label.rjust(label_width)} : {value}")
 
     return lines
 
@@ -9,8 +9,10 @@ from __future__ import annotations
 import hashlib
 import itertools
 import json
+import os
 import secrets
 from pathlib import Path
+from typing import Any, Callable
 
 from .helpers import normalize_portfolio_name
 from .logger import get_logger
@@ -29,6 +31,8 @@ class IntegrityManager:
         self.regexlab_dir = regexlab_dir
         self.salt_file = regexlab_dir / "salt.key"
         self.keystore_file = regexlab_dir / "rxl.kst"
+        self.stamp_file = regexlab_dir / "verify.stamp"
+        self.digest_cache_file = regexlab_dir / "rxl.digest_cache.json"
         self.logger = get_logger()
 
     # === Salt Management ===
@@ -125,14 +129,117 @@ class IntegrityManager:
             raise ValueError(f"SHA256 mismatch: expected {sha256[:16]}..., got {computed_sha256[:16]}...")
         return decrypted.decode("utf-8")
 
+    # === Verification Stamp ===
+
+    def compute_state_stamp(self, portfolios_dir: Path) -> str:
+        """
+        Compute a cheap fingerprint of everything verification depends on.
+
+        SHA256 over the sorted (name, mtime_ns, ctime_ns, size) of every entry
+        of the portfolios directory, plus salt.key and rxl.kst. The entry list
+        catches additions, deletions and renames; size and ctime catch a file
+        rewritten in place with its old mtime put back (e.g. cp -p from a
+        backup). Costs one scandir plus cached DirEntry stats, no file reads.
+
+        Args:
+            portfolios_dir: Path to builtin portfolios directory
+
+        Returns:
+            Hex digest of the current state
+        """
+        records: list[tuple[str, int, int, int]] = []
+        try:
+            with os.scandir(portfolios_dir) as entries:
+                for entry in entries:
+                    st = entry.stat()
+                    records.append((entry.name, st.st_mtime_ns, st.st_ctime_ns, st.st_size))
+        except OSError:
+            pass
+        records.sort()
+
+        for path in (self.salt_file, self.keystore_file):
+            try:
+                st = path.stat()
+            except OSError:
+                # Missing file: recorded as absent so its later creation changes the stamp
+                records.append((path.name, -1, -1, -1))
+            else:
+                records.append((path.name, st.st_mtime_ns, st.st_ctime_ns, st.st_size))
+
+        return hashlib.sha256(repr(records).encode("utf-8")).hexdigest()
+
+    def is_verification_current(self, portfolios_dir: Path) -> bool:
+        """
+        Check whether nothing changed since the last successful verification.
+
+        Args:
+            portfolios_dir: Path to builtin portfolios directory
+
+        Returns:
+            True if the stored stamp matches the current state
+        """
+        try:
+            last_verified = self.stamp_file.read_text(encoding="utf-8").strip()
+        except OSError:
+            return False
+        # Any difference in names, mtimes, ctimes or sizes forces a full verification
+        return self.compute_state_stamp(portfolios_dir) == last_verified
+
+    def mark_verified(self, portfolios_dir: Path) -> None:
+        """
+        Record the current state as verified (call after verify_and_restore).
+
+        Args:
+            portfolios_dir: Path to builtin portfolios directory
+        """
+        try:
+            self.stamp_file.write_text(self.compute_state_stamp(portfolios_dir), encoding="utf-8")
+        except OSError as e:
+            self.logger.warning("Could not write %s: %s", self.stamp_file.name, e)
+
+    # === Digest Cache ===
+
+    @staticmethod
+    def _stat_key(path: Path) -> list[int] | None:
+        """Return [mtime_ns, size] for a file, or None if it cannot be stat'ed."""
+        try:
+            st = path.stat()
+        except OSError:
+            return None
+        return [st.st_mtime_ns, st.st_size]
+
+    def read_digest_cache(self) -> dict[str, list[Any]]:
+        """
+        Read the persisted digest cache.
+
+        Format: {filename: [mtime_ns, size, sha256_hex]} for files verified
+        on a previous run. Returns an empty dict if missing or unreadable.
+        """
+        try:
+            data = json.loads(self.digest_cache_file.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return {}
+        return data if isinstance(data, dict) else {}
+
+    def write_digest_cache(self, cache: dict[str, list[Any]]) -> None:
+        """Persist the digest cache atomically (temp file + os.replace)."""
+        tmp_file = self.digest_cache_file.with_suffix(".tmp")
+        try:
+            tmp_file.write_text(json.dumps(cache), encoding="utf-8")
+            os.replace(str(tmp_file), str(self.digest_cache_file))
+        except OSError as e:
+            self.logger.warning("Could not write %s: %s", self.digest_cache_file.name, e)
+
     # === Multi-Portfolio Keystore ===
 
-    def generate_keystore(self, portfolios_dir: Path) -> tuple[int, int]:
+    def generate_keystore(self, portfolios_dir: Path, portfolio_files: list[Path] | None = None) -> tuple[int, int]:
         """
         Generate rxl.kst from all portfolios in builtin directory.
 
         Args:
             portfolios_dir: Path to builtin portfolios directory
+            portfolio_files: Sorted *.json files of portfolios_dir, if the caller
+                already listed them (avoids scanning the directory twice)
 
         Returns:
             Tuple of (portfolios_count, total_bytes)
@@ -143,8 +250,9 @@ class IntegrityManager:
         """
         self.logger.info("Generating keystore from: %s", portfolios_dir)
 
-        # 1. Scan portfolio files
-        portfolio_files = sorted(portfolios_dir.glob("*.json"))
+        # 1. Scan portfolio files (unless already provided)
+        if portfolio_files is None:
+            portfolio_files = sorted(portfolios_dir.glob("*.json"))
         if not portfolio_files:
             raise ValueError(f"No portfolio files found in {portfolios_dir}")
 
@@ -201,12 +309,15 @@ class IntegrityManager:
 
         return len(blocks), total_size
 
-    def verify_and_restore(self, portfolios_dir: Path) -> tuple[bool, list[Path], list[tuple[Path, str]]]:
+    def verify_and_restore(
+        self, portfolios_dir: Path, on_progress: Callable[[int, int], None] | None = None
+    ) -> tuple[bool, list[Path], list[tuple[Path, str]]]:
         """
         Verify all builtin portfolios and restore corrupted ones.
 
         Args:
             portfolios_dir: Path to builtin portfolios directory
+            on_progress: Optional callback(done, total) invoked after each block
 
         Returns:
             Tuple of (all_ok, verified_files, restored_files)
@@ -252,6 +363,12 @@ class IntegrityManager:
         restored_files: list[tuple[Path, str]] = []
         cursor = self.HEADER_LENGTH
 
+        # Files verified on a previous run whose stat is unchanged need neither
+        # decryption (PBKDF2) nor re-hashing: index cached entries by digest
+        digest_cache = self.read_digest_cache()
+        filename_by_sha = {entry[2]: name for name, entry in digest_cache.items() if len(entry) == 3}
+        new_digest_cache: dict[str, list[Any]] = {}
+
         for i in range(portfolio_count):
             # Read SHA256 (64 chars)
             if cursor + self.SHA256_SIZE > len(keystore_data):
@@ -279,6 +396,19 @@ class IntegrityManager:
             encrypted_data = keystore_data[cursor : cursor + encrypted_size]
             cursor += encrypted_size
 
+            # Fast path: unchanged file already verified against this digest
+            cached_name = filename_by_sha.get(sha256)
+            if cached_name is not None:
+                cached_file = portfolios_dir / cached_name
+                stat_key = self._stat_key(cached_file)
+                if stat_key is not None and stat_key == digest_cache[cached_name][:2]:
+                    verified_files.append(cached_file)
+                    new_digest_cache[cached_name] = [*stat_key, sha256]
+                    self.logger.debug("✓ %s - intact (cached digest)", cached_name)
+                    if on_progress is not None:
+                        on_progress(i + 1, portfolio_count)
+                    continue
+
             # Decrypt and verify
             try:
                 decrypted_json = self.decrypt_portfolio_block(salt, sha256, encrypted_data)
@@ -317,6 +447,17 @@ class IntegrityManager:
                 restored_files.append((portfolio_file, "File missing"))
                 self.logger.warning("⚠ %s - RESTORED (missing)", filename)
 
+            # File now matches the keystore digest (verified or restored)
+            stat_key = self._stat_key(portfolio_file)
+            if stat_key is not None:
+                new_digest_cache[filename] = [*stat_key, sha256]
+
+            if on_progress is not None:
+                on_progress(i + 1, portfolio_count)
+
+        if new_digest_cache != digest_cache:
+            self.write_digest_cache(new_digest_cache)
+
         all_ok = len(restored_files) == 0
 
         if all_ok:
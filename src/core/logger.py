@@ -22,6 +22,15 @@ class LogLevel(IntEnum):
     ERROR = 40
 
 
+# Map 'log_level' setting strings to LogLevel (built once, read on every log call)
+_LEVEL_MAP = {
+    "DEBUG": LogLevel.DEBUG,
+    "INFO": LogLevel.INFO,
+    "WARNING": LogLevel.WARNING,
+    "ERROR": LogLevel.ERROR,
+}
+
+
 class Logger:
     """
     Centralized logger for RegexLab plugin.
@@ -54,15 +63,7 @@ class Logger:
         """
         level_str = self.settings.get("log_level", DEFAULT_LOG_LEVEL).upper()
 
-        # Map string to LogLevel
-        level_map = {
-            "DEBUG": LogLevel.DEBUG,
-            "INFO": LogLevel.INFO,
-            "WARNING": LogLevel.WARNING,
-            "ERROR": LogLevel.ERROR,
-        }
-
-        return level_map.get(level_str, LogLevel.INFO)
+        return _LEVEL_MAP.get(level_str, LogLevel.INFO)
 
     def _should_log(self, level: LogLevel) -> bool:
         """
@@ -76,6 +77,23 @@ class Logger:
         """
         return level >= self.get_log_level()
 
+    def is_enabled_for(self, level: LogLevel) -> bool:
+        """
+        Check if messages at the given level are currently emitted.
+
+        Use it to skip building expensive log arguments on hot paths:
+
+            if logger.is_enabled_for(LogLevel.DEBUG):
+                logger.debug("State: %s", expensive_dump())
+
+        Args:
+            level: The log level to test.
+
+        Returns:
+            True if a message at this level would be logged.
+        """
+        return self._should_log(level)
+
     def debug(self, message: str, *args: Any) -> None:
         """
         Log a debug message (only if log level <= DEBUG).
@@ -52,6 +52,8 @@ class Pattern:
     type: PatternType
     description: str = ""
     default_panel: str | None = None  # "find", "replace", or "find_in_files"
+    # Compiled regex from an earlier validation (e.g. the Add Pattern wizard), not serialized
+    compiled_regex: re.Pattern[str] | None = field(default=None, repr=False, compare=False)
 
     def __post_init__(self) -> None:
         """Validation after initialization."""
@@ -101,6 +103,8 @@ class Pattern:
         Validate regex syntax.
 
         For dynamic patterns, temporarily replaces variables with 'X'.
+        A compiled_regex built from the same source is reused instead of
+        compiling again.
         """
         test_regex = self.regex
 
@@ -109,6 +113,9 @@ class Pattern:
             var_pattern = r"\{\{(\w+)\}\}"
             test_regex = re.sub(var_pattern, "X", test_regex)
 
+        if self.compiled_regex is not None and self.compiled_regex.pattern == test_regex:
+            return
+
         try:
             re.compile(test_regex)
         except re.error as e:
@@ -282,6 +289,15 @@ class Portfolio:
             return True
         return False
 
+    def replace_patterns(self, patterns: list[Pattern]) -> None:
+        """
+        Replace the whole pattern list and rebuild the lookup cache.
+
+        Used after a successful save so the in-memory portfolio matches disk.
+        """
+        self.patterns = patterns
+        self._pattern_cache = {p.name: p for p in patterns}
+
     def get_pattern(self, name: str) -> Pattern | None:
         """
         Get a pattern by its name - O(1) lookup via cache.
@@ -8,15 +8,65 @@ Implements singleton pattern for portfolio state.
 from __future__ import annotations
 
 import json
-from datetime import datetime
+import os
+import threading
+from datetime import date
 from pathlib import Path
+from typing import Any
 
 from .helpers import is_builtin_portfolio_path
 from .logger import get_logger
-from .models import Portfolio
+from .models import Pattern, Portfolio
 
 logger = get_logger()
 
+# Optional fast JSON parser: orjson parses several times faster than the stdlib
+# and takes bytes directly. Falls back to json when it is not installed.
+# Saves use it too: OPT_INDENT_2 gives the same 2-space, UTF-8 layout as
+# json.dumps(indent=2, ensure_ascii=False), serialized straight to bytes.
+try:
+    import orjson
+
+    _json_loads = orjson.loads
+
+    def _json_dumps_pretty(data: dict[str, Any]) -> bytes:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+
+except ImportError:
+    _json_loads = json.loads
+
+    def _json_dumps_pretty(data: dict[str, Any]) -> bytes:
+        return json.dumps(data, indent=2, ensure_ascii=False).encode("utf-8")
+
+
+def _write_json_atomic(path: Path, data: dict[str, Any]) -> None:
+    """
+    Write JSON to path through a temporary file and an atomic rename.
+
+    Args:
+        path: Destination file
+        data: JSON-serializable data
+
+    Raises:
+        OSError: If the temporary file can't be written or renamed
+    """
+    # Serialized once, written with a single write()
+    payload = _json_dumps_pretty(data)
+    tmp_path = path.with_name(path.name + ".tmp")
+    try:
+        with tmp_path.open("wb") as f:
+            f.write(payload)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(str(tmp_path), str(path))
+    except OSError:
+        # The original file is untouched; drop the partial temp file
+        try:
+            tmp_path.unlink()
+        except OSError:
+            pass
+        raise
+
 
 class PortfolioManager:
     """
@@ -46,6 +96,10 @@ class PortfolioManager:
         self._loaded_portfolios: dict[str, Portfolio] = {}
         self._builtin_portfolio: Portfolio | None = None
         self._portfolio_paths: dict[str, Path] = {}
+        # (mtime_ns, size) of each loaded file, used to skip re-parsing unchanged files
+        self._path_fingerprints: dict[Path, tuple[int, int]] = {}
+        # Guards the dicts above: plugin_loaded() populates them from the async thread
+        self._lock = threading.RLock()
 
     @classmethod
     def get_instance(cls) -> PortfolioManager:
@@ -71,6 +125,27 @@ class PortfolioManager:
         Returns:
             Loaded Portfolio object
 
+        Raises:
+            FileNotFoundError: If the file doesn't exist
+            ValueError: If the JSON is invalid or missing required fields
+            PermissionError: If the file can't be read
+        """
+        return self.read_portfolio_file(path)[0]
+
+    def read_portfolio_file(self, path: Path) -> tuple[Portfolio, tuple[int, int]]:
+        """
+        Load a portfolio from a JSON file along with its stat fingerprint.
+
+        The fingerprint is taken before the file is opened: if the file is
+        saved while it is being read, the recorded fingerprint is the older
+        one and the next reload picks up the new content.
+
+        Args:
+            path: Path to the JSON portfolio file
+
+        Returns:
+            Tuple of (loaded Portfolio, (mtime_ns, size) fingerprint)
+
         Raises:
             FileNotFoundError: If the file doesn't exist
             ValueError: If the JSON is invalid or missing required fields
@@ -82,10 +157,13 @@ class PortfolioManager:
         if not path.is_file():
             raise ValueError(f"Path is not a file: {path}")
 
+        fingerprint = self._fingerprint(path)
+
         try:
-            with path.open("r", encoding="utf-8") as f:
-                data = json.load(f)
-        except json.JSONDecodeError as e:
+            # Bytes in, no intermediate str decode (orjson and json both accept bytes)
+            data = _json_loads(path.read_bytes())
+        except (json.JSONDecodeError, UnicodeDecodeError) as e:
+            # orjson.JSONDecodeError subclasses json.JSONDecodeError
             raise ValueError(f"Invalid JSON in portfolio file: {e}") from e
         except PermissionError as e:
             raise PermissionError(f"Cannot read portfolio file: {e}") from e
@@ -95,7 +173,7 @@ class PortfolioManager:
         except (KeyError, ValueError) as e:
             raise ValueError(f"Invalid portfolio data: {e}") from e
 
-        return portfolio
+        return portfolio, fingerprint
 
     def load_portfolio(self, path: Path, set_as_builtin: bool = False, reload: bool = False) -> Portfolio:
         """
@@ -113,19 +191,67 @@ class PortfolioManager:
             FileNotFoundError: If file doesn't exist
             ValueError: If portfolio is invalid or name collision (unless reload=True)
         """
-        portfolio = self.load_portfolio_from_file(path)
+        portfolio, fingerprint = self.read_portfolio_file(path)
+        return self.register_portfolio(
+            portfolio, path, set_as_builtin=set_as_builtin, reload=reload, fingerprint=fingerprint
+        )
 
-        # Check for name collision (unless reloading)
-        if portfolio.name in self._loaded_portfolios and not set_as_builtin and not reload:
-            raise ValueError(f"Portfolio '{portfolio.name}' is already loaded")
+    def register_portfolio(
+        self,
+        portfolio: Portfolio,
+        path: Path,
+        set_as_builtin: bool = False,
+        reload: bool = False,
+        fingerprint: tuple[int, int] | None = None,
+    ) -> Portfolio:
+        """
+        Add an already parsed portfolio to loaded portfolios.
 
-        # Add to loaded portfolios (overwrite if reload)
-        self._loaded_portfolios[portfolio.name] = portfolio
-        self._portfolio_paths[portfolio.name] = path
+        Second half of load_portfolio(): lets callers parse several files
+        concurrently with read_portfolio_file() and register the results
+        in a deterministic order.
+
+        Args:
+            portfolio: Portfolio parsed from path
+            path: Path the portfolio was loaded from
+            set_as_builtin: If True, set this portfolio as the built-in portfolio
+            reload: If True, allow replacing an already loaded portfolio
+            fingerprint: Fingerprint taken before the file was read (from
+                read_portfolio_file()); stat'ed now when omitted
+
+        Returns:
+            The registered Portfolio object
+
+        Raises:
+            FileNotFoundError: If the file disappeared since it was parsed
+            ValueError: If name collision (unless reload=True)
+        """
+        if fingerprint is None:
+            fingerprint = self._fingerprint(path)
+
+        with self._lock:
+            # Check for name collision (unless reloading)
+            if portfolio.name in self._loaded_portfolios and not set_as_builtin and not reload:
+                raise ValueError(f"Portfolio '{portfolio.name}' is already loaded")
+
+            # A file maps to one portfolio: drop names it was loaded under before
+            # (its "name" field was edited), otherwise the old name stays loaded
+            stale = [name for name, known in self._portfolio_paths.items() if known == path and name != portfolio.name]
+            self._unload_names_locked(stale)
+
+            # Add to loaded portfolios (overwrite if reload)
+            self._loaded_portfolios[portfolio.name] = portfolio
+            self._portfolio_paths[portfolio.name] = path
+            self._path_fingerprints[path] = fingerprint
+
+            # Set as built-in if requested
+            if set_as_builtin:
+                self._builtin_portfolio = portfolio
+
+        for name in stale:
+            logger.info(f"Portfolio '{name}' unloaded (renamed to '{portfolio.name}' in {path})")
 
-        # Set as built-in if requested
         if set_as_builtin:
-            self._builtin_portfolio = portfolio
             logger.info(f"Built-in portfolio '{portfolio.name}' loaded from {path}")
         else:
             action = "reloaded" if reload else "loaded"
@@ -133,6 +259,34 @@ class PortfolioManager:
 
         return portfolio
 
+    @staticmethod
+    def _fingerprint(path: Path) -> tuple[int, int]:
+        """Return the (mtime_ns, size) stat fingerprint of a file."""
+        st = path.stat()
+        return (st.st_mtime_ns, st.st_size)
+
+    def is_unchanged_since_load(self, path: Path) -> bool:
+        """
+        Check whether a loaded portfolio file is unchanged on disk.
+
+        Compares the current stat fingerprint (mtime_ns, size) against the one
+        recorded when the file was last loaded. Costs a single stat() call
+        instead of a full JSON parse.
+
+        Args:
+            path: Path to the portfolio file
+
+        Returns:
+            True if the file is loaded and unchanged, False otherwise
+        """
+        previous = self._path_fingerprints.get(path)
+        if previous is None:
+            return False
+        try:
+            return self._fingerprint(path) == previous
+        except OSError:
+            return False
+
     def unload_portfolio(self, name: str) -> bool:
         """
         Unload a portfolio by name.
@@ -148,34 +302,128 @@ class PortfolioManager:
         Raises:
             ValueError: If trying to unload built-in portfolio
         """
-        if name not in self._loaded_portfolios:
-            logger.warning(f"Portfolio '{name}' not found")
-            return False
+        with self._lock:
+            if name not in self._loaded_portfolios:
+                logger.warning(f"Portfolio '{name}' not found")
+                return False
 
-        # Protect built-in portfolio
-        if self._builtin_portfolio and self._builtin_portfolio.name == name:
-            raise ValueError("Cannot unload built-in portfolio")
+            # Protect built-in portfolio
+            if self._builtin_portfolio and self._builtin_portfolio.name == name:
+                raise ValueError("Cannot unload built-in portfolio")
 
-        # Remove from loaded portfolios
-        del self._loaded_portfolios[name]
-        if name in self._portfolio_paths:
-            del self._portfolio_paths[name]
+            # Remove from loaded portfolios
+            del self._loaded_portfolios[name]
+            if name in self._portfolio_paths:
+                self._path_fingerprints.pop(self._portfolio_paths.pop(name), None)
 
         logger.info(f"Portfolio '{name}' unloaded")
         return True
 
+    def unload_missing(self, existing_paths: set[Path]) -> list[str]:
+        """
+        Unload every portfolio whose source file is not in existing_paths.
+
+        Used by incremental reloads to drop portfolios whose file was deleted
+        or moved, without touching the ones still on disk. Unlike
+        unload_portfolio(), this also releases the built-in portfolio.
+
+        Args:
+            existing_paths: Portfolio files currently present on disk
+
+        Returns:
+            Names of the unloaded portfolios
+        """
+        with self._lock:
+            removed = [name for name, path in self._portfolio_paths.items() if path not in existing_paths]
+            self._unload_names_locked(removed)
+
+        for name in removed:
+            logger.info(f"Portfolio '{name}' unloaded (file removed)")
+        return removed
+
+    def unload_path(self, path: Path) -> list[str]:
+        """
+        Unload every portfolio that was loaded from path.
+
+        Used by incremental reloads when a changed file can no longer be
+        loaded, so its previous content does not stay in memory. Like
+        unload_missing(), this also releases the built-in portfolio.
+
+        Args:
+            path: Path to the portfolio file
+
+        Returns:
+            Names of the unloaded portfolios
+        """
+        with self._lock:
+            removed = [name for name, known in self._portfolio_paths.items() if known == path]
+            self._unload_names_locked(removed)
+
+        for name in removed:
+            logger.info(f"Portfolio '{name}' unloaded (file could not be reloaded)")
+        return removed
+
+    def _unload_names_locked(self, names: list[str]) -> None:
+        """Drop the given portfolios and their tracked paths. Caller holds _lock."""
+        for name in names:
+            self._loaded_portfolios.pop(name, None)
+            self._path_fingerprints.pop(self._portfolio_paths.pop(name), None)
+            if self._builtin_portfolio is not None and self._builtin_portfolio.name == name:
+                self._builtin_portfolio = None
+
+    def set_builtin_principal(self, path: Path) -> Portfolio | None:
+        """
+        Make the portfolio loaded from path the built-in portfolio.
+
+        Args:
+            path: Path to the portfolio file
+
+        Returns:
+            The new built-in Portfolio, or None if no portfolio was loaded from path
+        """
+        with self._lock:
+            for name, known in self._portfolio_paths.items():
+                if known == path:
+                    self._builtin_portfolio = self._loaded_portfolios[name]
+                    return self._builtin_portfolio
+        return None
+
+    def is_known_path(self, path: Path) -> bool:
+        """
+        Check whether a file was the source of a currently loaded portfolio.
+
+        Args:
+            path: Path to the portfolio file
+
+        Returns:
+            True if a loaded portfolio was read from this path
+        """
+        return path in self._path_fingerprints
+
     # ========== Portfolio Saving ==========
 
-    def save_portfolio(self, portfolio: Portfolio, path: Path | None = None, *, allow_readonly: bool = False) -> None:
+    def save_portfolio(
+        self,
+        portfolio: Portfolio,
+        path: Path | None = None,
+        *,
+        allow_readonly: bool = False,
+        patterns: list[Pattern] | None = None,
+    ) -> None:
         """
         Save a portfolio to a JSON file.
 
-        Respects readonly flag (soft immutability).
+        Respects readonly flag (soft immutability). The file is written to a
+        temporary sibling and renamed over the target, so a failed save never
+        leaves a truncated portfolio behind. In-memory changes (updated date,
+        patterns) are applied only once the file is in place.
 
         Args:
             portfolio: Portfolio object to save
             path: Path where to save the JSON file (if None, use tracked path)
             allow_readonly: Set True to bypass readonly guard (used by maintenance flows)
+            patterns: New pattern list to write instead of portfolio.patterns;
+                swapped into the portfolio after a successful write
 
         Raises:
             ValueError: If portfolio is readonly or invalid
@@ -195,23 +443,29 @@ class PortfolioManager:
             else:
                 raise ValueError(f"No path tracked for portfolio '{portfolio.name}'")
 
-        # Update 'updated' timestamp
-        portfolio.updated = datetime.now().strftime("%Y-%m-%d")
+        # New 'updated' timestamp (applied to the portfolio after the write)
+        updated = date.today().isoformat()
 
         # Create parent directories if they don't exist
         path.parent.mkdir(parents=True, exist_ok=True)
 
         data = portfolio.to_dict()
+        data["updated"] = updated
+        if patterns is not None:
+            data["patterns"] = [p.to_dict() for p in patterns]
 
         try:
-            with path.open("w", encoding="utf-8") as f:
-                json.dump(data, f, indent=2, ensure_ascii=False)
+            _write_json_atomic(path, data)
             logger.info(f"Portfolio '{portfolio.name}' saved to {path}")
         except PermissionError as e:
             raise PermissionError(f"Cannot write portfolio file: {e}") from e
         except OSError as e:
             raise OSError(f"Failed to save portfolio: {e}") from e
 
+        portfolio.updated = updated
+        if patterns is not None:
+            portfolio.replace_patterns(patterns)
+
     # ========== Multi-Portfolio Queries ==========
 
     def get_portfolio(self, name: str) -> Portfolio | None:
@@ -226,6 +480,18 @@ class PortfolioManager:
         """
         return self._loaded_portfolios.get(name)
 
+    def get_portfolio_path(self, name: str) -> Path | None:
+        """
+        Get the file path a loaded portfolio was read from.
+
+        Args:
+            name: Portfolio name
+
+        Returns:
+            Tracked file path or None if the portfolio is not loaded
+        """
+        return self._portfolio_paths.get(name)
+
     def get_all_portfolios(self) -> list[Portfolio]:
         """
         Get all loaded portfolios.
@@ -397,9 +663,11 @@ class PortfolioManager:
         """
         Clear all loaded portfolios (legacy V1 API compatibility).
         """
-        self._loaded_portfolios.clear()
-        self._portfolio_paths.clear()
-        self._builtin_portfolio = None
+        with self._lock:
+            self._loaded_portfolios.clear()
+            self._portfolio_paths.clear()
+            self._path_fingerprints.clear()
+            self._builtin_portfolio = None
 
     # ========== Utilities ==========
 
@@ -156,6 +156,25 @@ class SettingsManager:
             # Test mode: use fallback settings dictionary
             return self._fallback_settings.get(key, default)
 
+    def get_many(self, defaults: dict[str, Any]) -> dict[str, Any]:
+        """
+        Get several setting values in one call.
+
+        Plain keys are read directly from the settings object; keys in
+        DEEP_MERGE_KEYS go through get() for the deep merge.
+
+        Args:
+            defaults: Mapping of setting key to its default value.
+
+        Returns:
+            Mapping of setting key to its value (or default if not found).
+        """
+        source = self._settings if self._settings is not None else self._fallback_settings
+        return {
+            key: self.get(key, default) if key in DEEP_MERGE_KEYS else source.get(key, default)
+            for key, default in defaults.items()
+        }
+
     def get_nested(self, path: str, default: Any = None) -> Any:
         """
         Get a nested setting value using dot notation.
@@ -10,7 +10,7 @@ from __future__ import annotations
 import json
 import os
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 from ..core.constants import REQUIRED_PORTFOLIO_FIELDS
 from ..core.helpers import get_current_timestamp
@@ -18,6 +18,9 @@ from ..core.logger import get_logger
 from ..core.models import Pattern, PatternType, Portfolio
 from ..core.portfolio_manager import PortfolioManager
 
+if TYPE_CHECKING:
+    from ..core.integrity_manager import IntegrityManager
+
 logger = get_logger()
 
 
@@ -32,6 +35,11 @@ class PortfolioService:
     - Exporting/importing portfolios
     """
 
+    # Shared IntegrityManager per .regexlab directory (services are short-lived)
+    _integrity_managers: dict[Path, IntegrityManager] = {}
+
+    _instance: PortfolioService | None = None
+
     def __init__(self, portfolio_manager: PortfolioManager | None = None) -> None:
         """
         Initialize the portfolio service.
@@ -42,6 +50,51 @@ class PortfolioService:
         """
         self.portfolio_manager = portfolio_manager or PortfolioManager.get_instance()
 
+    @classmethod
+    def get_instance(cls) -> PortfolioService:
+        """
+        Get the shared service bound to the PortfolioManager singleton.
+
+        The service holds no state of its own, so commands can share one
+        instead of constructing a new service per run.
+
+        Returns:
+            The shared PortfolioService instance.
+        """
+        manager = PortfolioManager.get_instance()
+        # Rebuild if the manager singleton was replaced (e.g. reset between tests)
+        if cls._instance is None or cls._instance.portfolio_manager is not manager:
+            cls._instance = cls(manager)
+        return cls._instance
+
+    @classmethod
+    def reset_instance(cls) -> None:
+        """
+        Reset the shared instance.
+
+        Useful for testing to ensure clean state between tests.
+        """
+        cls._instance = None
+
+    def get_integrity_manager(self, regexlab_dir: Path) -> IntegrityManager:
+        """
+        Get the shared IntegrityManager for a .regexlab directory.
+
+        Args:
+            regexlab_dir: Directory containing salt.key and rxl.kst
+
+        Returns:
+            IntegrityManager instance, created on first request
+        """
+        manager = self._integrity_managers.get(regexlab_dir)
+        if manager is None:
+            # Imported on demand: only startup/reload need integrity checks
+            from ..core.integrity_manager import IntegrityManager
+
+            manager = IntegrityManager(regexlab_dir)
+            self._integrity_managers[regexlab_dir] = manager
+        return manager
+
     def get_active_portfolio(self) -> Portfolio | None:
         """
         Get the currently active portfolio.
@@ -179,9 +232,8 @@ class PortfolioService:
         This method:
         1. Finds portfolio by name
         2. Validates portfolio is editable (not readonly)
-        3. Adds pattern to portfolio in memory
-        4. Saves portfolio to disk (updates 'updated' timestamp)
-        5. Reloads portfolio to sync changes
+        3. Saves portfolio with the new pattern to disk (atomic write, updates 'updated')
+        4. Appends the pattern in memory only once the file is written
 
         Args:
             portfolio_name: Name of portfolio to add pattern to
@@ -201,19 +253,13 @@ class PortfolioService:
             raise ValueError(f"Portfolio '{portfolio_name}' is read-only")
 
         # Check if pattern name already exists
-        if any(p.name == pattern.name for p in portfolio.patterns):
+        if portfolio.get_pattern(pattern.name):
             raise ValueError(f"Pattern '{pattern.name}' already exists in portfolio")
 
-        # Add pattern to portfolio
-        portfolio.add_pattern(pattern)
-
-        # Update 'updated' timestamp
-        portfolio.updated = get_current_timestamp()
-
-        # Save portfolio to disk
+        # Save portfolio to disk; the in-memory portfolio is left untouched on failure
         try:
             manager = PortfolioManager.get_instance()
-            manager.save_portfolio(portfolio)  # Raises exception on failure
+            manager.save_portfolio(portfolio, patterns=[*portfolio.patterns, pattern])  # Raises exception on failure
 
             logger.info("Pattern '%s' added to portfolio '%s'", pattern.name, portfolio_name)
             return True
@@ -356,6 +402,18 @@ class PortfolioService:
             logger.error("Validation failed for %s - %s: %s", filepath, type(e).__name__, error)
             return (False, error)
 
+    def get_portfolio_path(self, name: str) -> Path | None:
+        """
+        Get the file path of a loaded portfolio (O(1) lookup).
+
+        Args:
+            name: Name of the portfolio
+
+        Returns:
+            Path of the portfolio file, or None if the portfolio is not loaded
+        """
+        return self.portfolio_manager.get_portfolio_path(name)
+
     def is_portfolio_loaded(self, portfolio_name: str) -> bool:
         """
         Check if portfolio with given name is currently loaded.
@@ -429,6 +487,36 @@ class PortfolioService:
         logger.debug("Portfolio does not exist: %s", name)
         return False
 
+    def get_existing_portfolio_names(self, packages_path: str) -> set[str]:
+        """
+        Collect the names of all existing portfolios in one scan.
+
+        Same sources as portfolio_exists() (loaded, disabled, active files),
+        plus the file stems in portfolios/ (lowercase) since a new portfolio
+        is saved as '<name>.json'. Lets callers test several candidate names
+        without re-reading every portfolio file per check.
+
+        Args:
+            packages_path: Path to Sublime Text packages directory
+
+        Returns:
+            Set of portfolio names and lowercase portfolio file stems
+        """
+        names = {p.name for p in self.get_all_portfolios()}
+        names.update(metadata["name"] for _, metadata in self.get_disabled_portfolios(packages_path))
+
+        portfolios_dir = os.path.join(packages_path, "User", "RegexLab", "portfolios")
+        if os.path.exists(portfolios_dir):
+            for filename in os.listdir(portfolios_dir):
+                if filename.endswith(".json"):
+                    names.add(filename[: -len(".json")].lower())
+                    valid, result = self.validate_portfolio_file(os.path.join(portfolios_dir, filename))
+                    if valid and isinstance(result, dict):
+                        names.add(result["name"])
+
+        logger.debug("Existing portfolio names: %d", len(names))
+        return names
+
     def save_portfolio(self, portfolio: Portfolio, filepath: str) -> None:
         """
         Save portfolio to specified file path.
@@ -450,6 +538,25 @@ class PortfolioService:
         self.portfolio_manager.save_portfolio(portfolio, Path(filepath))
         logger.debug("Portfolio saved successfully: %s", portfolio.name)
 
+    def save_portfolio_patterns(self, portfolio: Portfolio, patterns: list[Pattern], filepath: str) -> None:
+        """
+        Save portfolio with a new pattern list, then apply it in memory.
+
+        The portfolio is only modified once the file has been written, so
+        callers need no rollback on failure.
+
+        Args:
+            portfolio: Portfolio to save
+            patterns: Pattern list to write (replaces portfolio.patterns on success)
+            filepath: Path where to save the portfolio
+
+        Raises:
+            IOError: If save fails
+        """
+        logger.debug("Saving portfolio '%s' (%d patterns) to: %s", portfolio.name, len(patterns), filepath)
+        self.portfolio_manager.save_portfolio(portfolio, Path(filepath), patterns=patterns)
+        logger.debug("Portfolio saved successfully: %s", portfolio.name)
+
     def toggle_readonly(self, portfolio: Portfolio, filepath: str) -> None:
         """
         Toggle readonly flag and save portfolio.
@@ -0,0 +1,33 @@
+"""Tests for the {{VAR}} detection used by the Edit Pattern wizard."""
+
+from __future__ import annotations
+
+import re
+import unittest
+
+from src.commands.edit_pattern_command import _contains_dynamic_var
+
+
+class TestContainsDynamicVar(unittest.TestCase):
+    def test_known_inputs(self) -> None:
+        cases = {
+            "{{}}": False,
+            "{{A}}": True,
+            "{{}}{{A}}": True,
+            "{{A}": False,
+            "": False,
+            "plain \\d+ regex": False,
+        }
+        for text, expected in cases.items():
+            with self.subTest(text=text):
+                self.assertIs(_contains_dynamic_var(text), expected)
+
+    def test_matches_reference_regex(self) -> None:
+        reference = re.compile(r"{{[^}]+}}")
+        for text in ("{{{A}}}", "}}{{A", "{{A}}}", "{{ }}", "{{A}x}}", "{{{{}}}}", "x{{A}}y{{"):
+            with self.subTest(text=text):
+                self.assertIs(_contains_dynamic_var(text), bool(reference.search(text)))
+
+
+if __name__ == "__main__":
+    unittest.main()
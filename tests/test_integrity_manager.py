@@ -0,0 +1,78 @@
+"""Regression tests for the IntegrityManager verification stamp."""
+
+from __future__ import annotations
+
+import os
+import tempfile
+import unittest
+from pathlib import Path
+from types import SimpleNamespace
+from unittest import mock
+
+from src.core.integrity_manager import IntegrityManager
+
+
+class _FakeEntry:
+    """os.DirEntry stand-in with fixed stat values."""
+
+    def __init__(self, name: str, mtime_ns: int, ctime_ns: int, size: int) -> None:
+        self.name = name
+        self._stat = SimpleNamespace(st_mtime_ns=mtime_ns, st_ctime_ns=ctime_ns, st_size=size)
+
+    def stat(self) -> SimpleNamespace:
+        return self._stat
+
+
+class _FakeScandir:
+    """Context manager returned by the patched os.scandir."""
+
+    def __init__(self, entries: list[_FakeEntry]) -> None:
+        self._entries = entries
+
+    def __enter__(self) -> list[_FakeEntry]:
+        return self._entries
+
+    def __exit__(self, *exc_info: object) -> None:
+        return None
+
+
+class TestVerificationStamp(unittest.TestCase):
+    def setUp(self) -> None:
+        self._tmp = tempfile.TemporaryDirectory()
+        root = Path(self._tmp.name)
+        self.portfolios_dir = root / "builtin_portfolios"
+        self.portfolios_dir.mkdir()
+        self.manager = IntegrityManager(root / ".regexlab")
+        self.manager.write_salt(b"0" * IntegrityManager.SALT_SIZE)
+        self.portfolio = self.portfolios_dir / "a.json"
+        self.portfolio.write_text('{"name": "A"}', encoding="utf-8")
+        self.manager.mark_verified(self.portfolios_dir)
+
+    def tearDown(self) -> None:
+        self._tmp.cleanup()
+
+    def test_unchanged_state_is_current(self) -> None:
+        self.assertTrue(self.manager.is_verification_current(self.portfolios_dir))
+
+    def test_rewrite_with_restored_mtime_is_detected(self) -> None:
+        # Same name, mtime and size: only ctime moves. Stats are faked so the
+        # test does not depend on the filesystem's timestamp granularity.
+        before = [_FakeEntry("a.json", mtime_ns=100, ctime_ns=100, size=13)]
+        after = [_FakeEntry("a.json", mtime_ns=100, ctime_ns=200, size=13)]
+
+        with mock.patch("src.core.integrity_manager.os.scandir", return_value=_FakeScandir(before)):
+            self.manager.mark_verified(self.portfolios_dir)
+            self.assertTrue(self.manager.is_verification_current(self.portfolios_dir))
+        with mock.patch("src.core.integrity_manager.os.scandir", return_value=_FakeScandir(after)):
+            self.assertFalse(self.manager.is_verification_current(self.portfolios_dir))
+
+    def test_size_change_with_restored_mtime_is_detected(self) -> None:
+        st = self.portfolio.stat()
+        self.portfolio.write_text('{"name": "Tampered"}', encoding="utf-8")
+        os.utime(self.portfolio, ns=(st.st_atime_ns, st.st_mtime_ns))
+
+        self.assertFalse(self.manager.is_verification_current(self.portfolios_dir))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,68 @@
+"""Regression tests for PortfolioManager incremental reloads."""
+
+from __future__ import annotations
+
+import json
+import tempfile
+import unittest
+from pathlib import Path
+
+from src.core.portfolio_manager import PortfolioManager
+
+
+def _write_portfolio(path: Path, name: str) -> None:
+    path.write_text(json.dumps({"name": name, "patterns": []}), encoding="utf-8")
+
+
+class TestPortfolioReload(unittest.TestCase):
+    def setUp(self) -> None:
+        PortfolioManager.reset_instance()
+        self.manager = PortfolioManager.get_instance()
+        self._tmp = tempfile.TemporaryDirectory()
+        self.path = Path(self._tmp.name) / "x.json"
+
+    def tearDown(self) -> None:
+        self._tmp.cleanup()
+        PortfolioManager.reset_instance()
+
+    def test_renamed_portfolio_replaces_old_name(self) -> None:
+        _write_portfolio(self.path, "Old")
+        self.manager.load_portfolio(self.path)
+
+        _write_portfolio(self.path, "NewName")
+        self.manager.load_portfolio(self.path, reload=True)
+
+        names = [p.name for p in self.manager.get_all_portfolios()]
+        self.assertEqual(names, ["NewName"])
+        self.assertIsNone(self.manager.get_portfolio_path("Old"))
+        self.assertEqual(self.manager.get_portfolio_path("NewName"), self.path)
+
+    def test_save_after_read_is_not_recorded_as_loaded(self) -> None:
+        _write_portfolio(self.path, "Old")
+        portfolio, fingerprint = self.manager.read_portfolio_file(self.path)
+
+        # File saved after the read but before registration
+        _write_portfolio(self.path, "Saved meanwhile")
+        self.manager.register_portfolio(portfolio, self.path, fingerprint=fingerprint)
+
+        self.assertFalse(self.manager.is_unchanged_since_load(self.path))
+
+    def test_unload_path_drops_portfolio_loaded_from_file(self) -> None:
+        _write_portfolio(self.path, "Old")
+        self.manager.load_portfolio(self.path)
+
+        self.assertEqual(self.manager.unload_path(self.path), ["Old"])
+        self.assertEqual(self.manager.get_all_portfolios(), [])
+        self.assertFalse(self.manager.is_known_path(self.path))
+
+    def test_set_builtin_principal_uses_already_loaded_file(self) -> None:
+        _write_portfolio(self.path, "Builtin")
+        portfolio = self.manager.load_portfolio(self.path)
+
+        self.assertIs(self.manager.set_builtin_principal(self.path), portfolio)
+        self.assertIs(self.manager.get_builtin_portfolio(), portfolio)
+        self.assertIsNone(self.manager.set_builtin_principal(self.path.with_name("missing.json")))
+
+
+if __name__ == "__main__":
+    unittest.main()